@@ -0,0 +1,64 @@
+"""
+Peak memory benchmark of DataFrame column projections and `get_cells`.
+
+Builds a synthetic field table, projects it to 'x', 'y', 'z', 'p' as
+`FieldData` does and extracts a profile, once with the original copying
+projection and once with the zero-copy views. Each variant runs in its own
+process and reports the growth of the peak resident set size.
+
+Usage: python benchmarks/bench_dataframe_views.py [n_rows]
+"""
+import resource
+import subprocess
+import sys
+import numpy as np
+
+from lutils.core.types import DataFrame
+
+
+HEADER = ['cellI', 'x', 'y', 'z', 'p', 'Ux', 'Uy', 'Uz']
+KEYS = ['x', 'y', 'z', 'p']
+
+
+def peak_rss() -> int:
+    """Returns the peak resident set size of the process in bytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def legacy_profile(table: DataFrame) -> np.ndarray:
+    """Original implementation: sorted fancy-index projection, filter and sort copies."""
+    col_idx = sorted(table._map[key] for key in KEYS)
+    data = DataFrame(KEYS, table._data[:, col_idx])
+    filter_idx = np.where(np.abs(data['x'] - 0.5) < 1e-3)[0]
+    filtered = data._data[filter_idx]
+    return filtered[np.argsort(filtered[:, data._map['y']])]
+
+
+def view_profile(table: DataFrame) -> DataFrame:
+    """Current implementation: projection view and a single gather."""
+    data = table[KEYS]
+    filter_idx = np.flatnonzero(np.abs(data['x'] - 0.5) < 1e-3)
+    return data.select_rows(filter_idx[np.argsort(data['y'][filter_idx])])
+
+
+def run(variant: str,
+        n_rows: int) -> None:
+    table = DataFrame(HEADER, np.random.default_rng(0).random((n_rows, len(HEADER))))
+    before = peak_rss()
+    if variant == 'legacy':
+        n_profile = len(legacy_profile(table))
+    else:
+        n_profile = view_profile(table).shape()[0]
+    growth = (peak_rss() - before) / 2**20
+    print(f'{variant:7s} peak RSS growth: {growth:8.1f} MiB'
+          f'  (table {table._data.nbytes / 2**20:.1f} MiB, profile rows {n_profile})')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        run(sys.argv[1], int(sys.argv[2]))
+        sys.exit()
+
+    n_rows = sys.argv[1] if len(sys.argv) > 1 else '5000000'
+    for variant in ('legacy', 'views'):
+        subprocess.run([sys.executable, __file__, variant, n_rows], check=True)
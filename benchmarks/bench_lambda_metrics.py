@@ -0,0 +1,94 @@
+"""
+Runtime benchmark of the lambda accuracy metrics on the backward facing step.
+
+Reads '2000/lambda' of the immersed boundary BFS test case and rebuilds its
+cell centres from the four uniform blockMesh blocks, as the case stores no
+mesh points. The step is given once as an analytic box and once as a closed
+triangulated surface. The mesh is then extruded in z to millions of cells,
+and the signed distances, norms and error histograms are timed for each.
+
+Usage: python benchmarks/bench_lambda_metrics.py [n_layers]
+"""
+from pathlib import Path
+import sys
+import tempfile
+import time
+import numpy as np
+
+from lutils.core.bodies import Box, TriSurface
+from lutils.core.metrics import LambdaMetrics
+from lutils.io.foam_parser import parse_foam_field
+
+
+CASE = Path(__file__).parent.parent / 'testdata' / 'bfs' / 'openHFDIBRANS_kE'
+# Blocks in cell order: x range, y range, cells along x and y
+BLOCKS = [((0.0, 1.01), (0.0, 0.01091), 777, 8),
+          ((0.0, 1.01), (0.01091, 0.09), 777, 61),
+          ((1.01, 1.5), (0.01091, 0.09), 377, 61),
+          ((1.01, 1.5), (0.0, 0.01091), 377, 8)]
+DEPTH = 0.0013
+# Step corner, the step extends to -x, -y and both sides
+STEP = (1.0, 0.01)
+# HFDIBDEMDict settings
+INTERFACE_SPAN = 1.0
+THRESHOLD = 1e-4
+
+
+def bfs_cells() -> tuple[np.ndarray, np.ndarray]:
+    """Returns the cell centres and cell sizes of the BFS mesh, x fastest in each block."""
+    centres, sizes = [], []
+    for (x0, x1), (y0, y1), nx, ny in BLOCKS:
+        dx, dy = (x1 - x0) / nx, (y1 - y0) / ny
+        y, x = np.meshgrid(y0 + dy * (np.arange(ny) + 0.5), x0 + dx * (np.arange(nx) + 0.5), indexing='ij')
+        centres.append(np.column_stack([x.ravel(), y.ravel(), np.full(x.size, DEPTH / 2)]))
+        sizes.append(np.full(x.size, np.cbrt(dx * dy * DEPTH)))
+    return np.concatenate(centres), np.concatenate(sizes)
+
+
+def step_triangles(lower: np.ndarray,
+                   upper: np.ndarray) -> np.ndarray:
+    """Returns the 12 outward oriented triangles of a box."""
+    corners = np.array([[upper[i] if (c >> i) & 1 else lower[i] for i in range(3)] for c in range(8)])
+    quads = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+    return np.array([corners[[a, b, c]] for q in quads for a, b, c in ((q[0], q[1], q[2]), (q[0], q[2], q[3]))])
+
+
+def run(n_layers: int) -> None:
+    centres, sizes = bfs_cells()
+    values = parse_foam_field(CASE / '2000' / 'lambda', len(centres))
+    print(f'BFS cells: {len(centres)}, solid cells (lambda = 1): {(values == 1).sum()}')
+
+    # Extrude the mesh in z
+    offsets = np.repeat(np.arange(n_layers) * DEPTH, len(centres))
+    points = np.tile(centres, (n_layers, 1))
+    points[:, 2] += offsets
+    values, sizes = np.tile(values, n_layers), np.tile(sizes, n_layers)
+
+    # The band covers lambda up to the interface threshold, the STL step is
+    # closed just beyond it around the extruded domain
+    band = 8 * INTERFACE_SPAN * sizes.max()
+    lower = np.full(3, -2 * band)
+    upper = np.array([STEP[0], STEP[1], n_layers * DEPTH + 2 * band])
+    bodies = {'box': Box([-np.inf, -np.inf, -np.inf], [STEP[0], STEP[1], np.inf]),
+              'stl': TriSurface(step_triangles(lower, upper), band)}
+
+    for name, body in bodies.items():
+        start = time.perf_counter()
+        metrics = LambdaMetrics(points, values, body, sizes, INTERFACE_SPAN, THRESHOLD)
+        norms = metrics.norms()
+        metrics.histogram()
+        elapsed = time.perf_counter() - start
+        print(f'{name}: {len(points)} cells in {elapsed:.2f} s ({elapsed / len(points) * 1e9:.0f} ns/cell)')
+        for row, region in enumerate(np.asarray(norms['region'])):
+            print(f'  {region:10s} cells {norms["cells"][row]:9d}  L1 {norms["L1"][row]:.3e}'
+                  f'  L2 {norms["L2"][row]:.3e}  Linf {norms["Linf"][row]:.3e}'
+                  f'  misclassified {norms["misclassified"][row]:.2e}')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            metrics.write(Path(tmp), prefix=name)
+            print(f'  logs written in {time.perf_counter() - start:.3f} s')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 32)
@@ -0,0 +1,93 @@
+"""
+Peak memory benchmark of in-memory and out-of-core CSV field parsing.
+
+Writes a synthetic CSV field, then parses it, selects a slab of cells and
+reduces a column, once fully in memory and once spilled into memory-mapped
+columns. Each variant runs in its own process and reports the peak of the
+anonymous resident memory, i.e. excluding the reclaimable file-backed pages
+of the memory mappings.
+
+Usage: python benchmarks/bench_out_of_core.py [n_rows]
+"""
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+from lutils.core.types import DataFrame, Query
+from lutils.io.parser import parse_internal_field
+
+
+HEADER = ['cellI', 'x', 'y', 'z', 'p', 'Ux', 'Uy', 'Uz']
+
+
+def anon_rss() -> int:
+    """Returns the anonymous resident set size of the process in bytes."""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('RssAnon:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class PeakSampler(threading.Thread):
+    """Samples the anonymous resident set size until stopped."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.peak = anon_rss()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.is_set():
+            self.peak = max(self.peak, anon_rss())
+            time.sleep(0.002)
+
+    def stop(self) -> int:
+        self._done.set()
+        self.join()
+        return max(self.peak, anon_rss())
+
+
+def write_field(path: Path,
+                n_rows: int) -> None:
+    """Writes a synthetic CSV field of `n_rows` rows in chunks."""
+    rng = np.random.default_rng(0)
+    chunks = (rng.random((min(1 << 20, n_rows - start), len(HEADER)))
+              for start in range(0, n_rows, 1 << 20))
+    DataFrame.from_chunks(HEADER, chunks, path.with_suffix('.raw')).to_csv(path, precision=8)
+
+
+def run(variant: str,
+        path: Path) -> None:
+    before = anon_rss()
+    sampler = PeakSampler()
+    sampler.start()
+    start = time.perf_counter()
+    if variant == 'memory':
+        table = parse_internal_field(path)
+    else:
+        table = parse_internal_field(path, spill_dir=path.parent / 'spill')
+    slab = table.query(Query.between('x', 0.5, 0.501))
+    mean = table.reduce('p', 'mean')
+    elapsed = time.perf_counter() - start
+    growth = (sampler.stop() - before) / 2**20
+    print(f'{variant:7s} peak anonymous RSS growth: {growth:8.1f} MiB  ({elapsed:.2f} s,'
+          f' rows {table.shape()[0]}, slab rows {slab.shape()[0]}, mean p {mean:.4f})')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        run(sys.argv[1], Path(sys.argv[2]))
+        sys.exit()
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'field.csv'
+        write_field(path, n_rows)
+        print(f'rows: {n_rows}, file size: {path.stat().st_size / 2**20:.1f} MiB')
+        for variant in ('memory', 'spill'):
+            subprocess.run([sys.executable, __file__, variant, str(path)], check=True)
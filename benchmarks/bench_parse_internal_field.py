@@ -0,0 +1,62 @@
+"""
+Throughput benchmark of the bulk CSV tokenizer in `parse_internal_field`.
+
+Compares rows/s of the current implementation against the original
+line-by-line parser on a synthetic internal field export.
+
+Usage: python benchmarks/bench_parse_internal_field.py [n_rows]
+"""
+from pathlib import Path
+import tempfile
+import time
+import sys
+import numpy as np
+
+from lutils.io.parser import parse_internal_field
+
+
+def legacy_parse_internal_field(path: Path) -> np.ndarray:
+    """Original line-by-line implementation, kept for reference."""
+    with path.open() as f:
+        lines = f.readlines()
+        data = []
+        for line in lines[1:]:
+            if not line.strip():
+                continue
+            values = line.strip().split(',')
+            row = [float(x) if x else np.nan for x in values]
+            data.append(row)
+
+    return np.array(data)
+
+
+def write_field(path: Path,
+                n_rows: int) -> None:
+    """Writes a synthetic `cellI,x,y,z,S,Ux,Uy,Uz` export."""
+    rng = np.random.default_rng(0)
+    data = rng.random((n_rows, 8))
+    data[:, 0] = np.arange(n_rows)
+    np.savetxt(path, data, fmt='%.10g', delimiter=',',
+               header='cellI,x,y,z,S,Ux,Uy,Uz', comments='')
+
+
+def timeit(func, path: Path) -> float:
+    start = time.perf_counter()
+    func(path)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'field.dat'
+        write_field(path, n_rows)
+
+        t_new = timeit(parse_internal_field, path)
+        t_old = timeit(legacy_parse_internal_field, path)
+
+    print(f'rows: {n_rows}')
+    print(f'legacy: {t_old:8.3f} s  {n_rows/t_old:12.0f} rows/s')
+    print(f'bulk:   {t_new:8.3f} s  {n_rows/t_new:12.0f} rows/s')
+    print(f'speedup: {t_old/t_new:.1f}x')
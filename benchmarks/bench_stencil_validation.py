@@ -0,0 +1,80 @@
+"""
+Runtime benchmark of the interpolation stencil validation.
+
+Validates the boundary stencils of the immersed boundary BFS test case
+against its cell centres, rebuilt from the blockMesh blocks, then a
+synthetic set of wall stencils on a uniform grid with one corrupted row per
+check, scaled to `n_stencils` rows.
+
+Usage: python benchmarks/bench_stencil_validation.py [n_stencils]
+"""
+from pathlib import Path
+import sys
+import time
+import numpy as np
+
+from lutils.core.stencils import StencilValidator
+from lutils.core.types import RaggedArray
+from lutils.io.parser import parse_interpolation_info
+from bench_lambda_metrics import CASE, bfs_cells
+
+
+# Cell layers normal to the synthetic wall
+LAYERS = 4
+
+
+def synthetic_stencils(n_stencils: int) -> tuple[dict, np.ndarray, dict[str, int]]:
+    """Returns second order stencils of a wall at x = 0 on a unit grid, with corrupted rows."""
+    side = int(np.ceil(np.sqrt(n_stencils)))
+    x, y, z = np.meshgrid(np.arange(LAYERS) + 0.5, np.arange(side) + 0.5, np.arange(side) + 0.5,
+                          indexing='ij')
+    centres = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+
+    # Interface cells in the first layer, points one and two cells out along +x
+    cells = np.arange(n_stencils)
+    points = np.repeat(centres[cells], 3, axis=0).reshape(n_stencils, 3, 3)
+    points[:, 0, 0] = 0.0
+    points[:, 1:, 0] += np.array([1.0, 2.0])
+    int_cells = cells[:, None] + np.array([1, 2]) * side * side
+    columns = {'cellI': cells.astype(np.int32),
+               'cellCenter': centres[cells],
+               'surfNorm': np.tile([1.0, 0.0, 0.0], (n_stencils, 1)),
+               'yOrtho': np.full(n_stencils, 0.75),
+               'sigma': np.full(n_stencils, 0.5),
+               'order': np.full(n_stencils, 2, dtype=np.int32),
+               'intPoints': RaggedArray.from_counts(np.full(n_stencils, 3), points.reshape(-1, 3)),
+               'intCells': RaggedArray.from_counts(np.full(n_stencils, 2),
+                                                   int_cells.ravel().astype(np.int32))}
+
+    # One corrupted row per check
+    rows = dict(zip(['order', 'sigma', 'collinear', 'spacing', 'yOrtho', 'cells'],
+                    np.linspace(0, n_stencils - 1, 6).astype(np.int64)))
+    columns['order'][rows['order']] = 3
+    columns['sigma'][rows['sigma']] = 0.4
+    columns['intPoints'].values[3 * rows['collinear'] + 2, 1] += 0.1
+    columns['cellCenter'][rows['spacing'], 0] = 1.6
+    columns['sigma'][rows['spacing']] = 1.6
+    columns['yOrtho'][rows['yOrtho']] = 2.0
+    columns['intCells'].values[2 * rows['cells']] += 1
+
+    return columns, centres, rows
+
+
+def run(n_stencils: int) -> None:
+    columns = parse_interpolation_info(CASE / 'ZZ_python' / 'interpolationInfo_boundary.dat')
+    centres, _ = bfs_cells()
+    failures = StencilValidator(columns, centres=centres).validate()
+    print(f'BFS stencils: {len(columns["cellI"])}, failing rows: '
+          + ', '.join(f'{check} {len(rows)}' for check, rows in failures.items()))
+
+    columns, centres, rows = synthetic_stencils(n_stencils)
+    start = time.perf_counter()
+    failures = StencilValidator(columns, centres=centres).validate()
+    elapsed = time.perf_counter() - start
+    print(f'synthetic stencils: {n_stencils}, cells: {len(centres)}, validated in {elapsed:.2f} s')
+    for check, failed in failures.items():
+        print(f'  {check:10s} failing rows {failed.tolist()}  (corrupted row {rows[check]})')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
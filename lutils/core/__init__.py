@@ -1,5 +1,12 @@
-from lutils.core.data import FoamCase, FieldData, ResidualsData
-from lutils.core.types import DataFrame
+from lutils.core.data import (FoamCase, FieldData, ResidualsData, InterpolationData,
+                              GeometryData, CellSets, CoordinateStore)
+from lutils.core.types import DataFrame, Categorical, RaggedArray, Query
+from lutils.core.spatial import SpatialIndex
+from lutils.core.sampling import InterpolationWeights
+from lutils.core.mapping import CaseMapping
+from lutils.core.bodies import Body, Box, Sphere, Cylinder, PointCloud, TriSurface
+from lutils.core.metrics import LambdaMetrics, expected_lambda
+from lutils.core.stencils import StencilValidator
 from lutils.core.manager import CaseManager
 #from .processor import Simulation
 
@@ -7,6 +14,25 @@ __all__ = [
     'FoamCase',
     'FieldData',
     'ResidualsData',
+    'InterpolationData',
+    'GeometryData',
+    'CellSets',
+    'CoordinateStore',
     'DataFrame',
+    'Categorical',
+    'RaggedArray',
+    'Query',
+    'SpatialIndex',
+    'InterpolationWeights',
+    'CaseMapping',
+    'Body',
+    'Box',
+    'Sphere',
+    'Cylinder',
+    'PointCloud',
+    'TriSurface',
+    'LambdaMetrics',
+    'expected_lambda',
+    'StencilValidator',
     'CaseManager'
 ]
@@ -0,0 +1,626 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+import numpy as np
+
+from lutils.io.stl_parser import parse_stl
+from lutils.core.types import RaggedArray
+from lutils.core.spatial import SpatialIndex
+
+
+# Maximum number of ray casting columns along an axis
+_MAX_COLUMNS = 4096
+# Number of points tested for containment at once
+_DISTANCE_BATCH = 1 << 14
+# Maximum edge length of the surface pieces in bands
+_PIECE_BANDS = 3
+# Number of surface pieces registered into the distance bins at once
+_PIECE_BATCH = 1 << 10
+# Number of point and triangle pairs evaluated at once
+_PAIR_BATCH = 1 << 20
+
+
+class Body(ABC):
+    """
+    A solid body given by its signed distance function.
+
+    The signed distance is positive inside the body and negative outside,
+    matching the immersed boundary convention of lambda = 1 in the solid.
+    """
+
+    @abstractmethod
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """
+        Computes the signed distance of points to the body surface.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points, of shape (M, 3).
+
+        Returns
+        -------
+        np.ndarray
+            The distances, of shape (M,), positive inside the body.
+        """
+
+
+class Box(Body):
+    """
+    An axis-aligned box.
+
+    Bounds may be infinite, e.g. a backward facing step extending beyond the
+    inlet, the lower wall and both sides of the domain.
+
+    Parameters
+    ----------
+    lower : np.ndarray
+        The lower corner, of shape (3,).
+    upper : np.ndarray
+        The upper corner, of shape (3,).
+    """
+
+    def __init__(self,
+                 lower: np.ndarray,
+                 upper: np.ndarray) -> None:
+        self._lower = np.asarray(lower, dtype=np.float64)
+        self._upper = np.asarray(upper, dtype=np.float64)
+
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """Computes the signed distance, see `Body.signed_distance`."""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+
+        return _extrusion_distance(np.maximum(self._lower - points, points - self._upper))
+
+
+class Sphere(Body):
+    """
+    A sphere.
+
+    Parameters
+    ----------
+    centre : np.ndarray
+        The centre, of shape (3,).
+    radius : float
+        The radius.
+    """
+
+    def __init__(self,
+                 centre: np.ndarray,
+                 radius: float) -> None:
+        self._centre = np.asarray(centre, dtype=np.float64)
+        self._radius = radius
+
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """Computes the signed distance, see `Body.signed_distance`."""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+
+        return self._radius - np.linalg.norm(points - self._centre, axis=1)
+
+
+class Cylinder(Body):
+    """
+    A capped circular cylinder.
+
+    Parameters
+    ----------
+    start : np.ndarray
+        The centre of the first cap, of shape (3,).
+    end : np.ndarray
+        The centre of the second cap, of shape (3,).
+    radius : float
+        The radius.
+    """
+
+    def __init__(self,
+                 start: np.ndarray,
+                 end: np.ndarray,
+                 radius: float) -> None:
+        self._start = np.asarray(start, dtype=np.float64)
+        self._end = np.asarray(end, dtype=np.float64)
+        self._radius = radius
+
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """Computes the signed distance, see `Body.signed_distance`."""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        axis = self._end - self._start
+        half_length = np.linalg.norm(axis) / 2
+        axis /= 2 * half_length
+
+        # Axial and radial coordinates relative to the cylinder centre
+        offsets = points - (self._start + self._end) / 2
+        axial = offsets @ axis
+        radial = np.linalg.norm(offsets - axial[:, None] * axis, axis=1)
+
+        return _extrusion_distance(np.column_stack([radial - self._radius,
+                                                    np.abs(axial) - half_length]))
+
+
+class PointCloud(Body):
+    """
+    A body surface sampled by points with outward normals.
+
+    The distance is measured along the normal of the nearest surface point,
+    i.e. to its tangent plane, which is accurate near a smooth surface
+    sampled more finely than the distance of interest.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The surface points, of shape (N, 3).
+    normals : np.ndarray
+        The outward surface normals, of shape (N, 3), not necessarily
+        normalized.
+    """
+
+    def __init__(self,
+                 points: np.ndarray,
+                 normals: np.ndarray) -> None:
+        normals = np.asarray(normals, dtype=np.float64)
+        self._index = SpatialIndex(points)
+        self._normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """Computes the signed distance, see `Body.signed_distance`."""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        nearest, _ = self._index.nearest(points)
+
+        return np.einsum('md,md->m', self._index.points[nearest] - points, self._normals[nearest])
+
+
+class TriSurface(Body):
+    """
+    A closed triangulated body surface, e.g. from an STL file.
+
+    The sign is found by casting a ray from each point along +z and counting
+    the crossed triangles, whose xy projections are binned on a 2D grid.
+    Points on shared edges and vertices are assigned to exactly one triangle
+    by the top-left rule, so every crossing is counted once.
+
+    Only the distances within a `band` around the surface are computed, as
+    needed e.g. for the interface of an immersed body, the others are
+    clipped to +-band. The space around the surface is split into cubic bins
+    of one band, and every triangle is registered in the bins whose centre
+    lies within the band plus half a bin diagonal of it, i.e. only in a
+    slab around the triangle. Each point looks up the triangles of its bin,
+    and the exact distances of these point and triangle pairs are reduced
+    to the minimum of each point in batches of bounded size. The cost
+    follows the number of points near the surface, not the size of the
+    mesh.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        The triangle vertices, of shape (F, 3, 3), counter-clockwise seen from
+        the outside.
+    band : float
+        The half-width of the band of exact distances.
+    """
+
+    def __init__(self,
+                 triangles: np.ndarray,
+                 band: float) -> None:
+        triangles = np.asarray(triangles, dtype=np.float64)
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+        # Drop degenerate triangles
+        areas = np.linalg.norm(normals, axis=1)
+        self._triangles = triangles[areas > 0]
+        self._band = band
+        # Ray casting grid of the projected triangles and distance bins, built on first use
+        self._columns = None
+        self._bins = None
+
+    @classmethod
+    def from_stl(cls,
+                 path: Path,
+                 band: float) -> 'TriSurface':
+        """
+        Creates a TriSurface from an ASCII or binary STL file.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the STL file.
+        band : float
+            The half-width of the band of exact distances.
+
+        Returns
+        -------
+        TriSurface
+            The body surface.
+        """
+        return cls(parse_stl(Path(path)), band)
+
+    @property
+    def triangles(self):
+        """np.ndarray: The triangle vertices, of shape (F, 3, 3)."""
+        return self._triangles
+
+    @property
+    def band(self):
+        """float: The half-width of the band of exact distances."""
+        return self._band
+
+    def signed_distance(self,
+                        points: np.ndarray) -> np.ndarray:
+        """
+        Computes the signed distance, see `Body.signed_distance`.
+
+        The distances are clipped to +-band.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        distances = np.full(len(points), float(self._band))
+        lo, dims, keys, bins = self._get_bins()
+
+        # Points in a bin with registered triangles
+        cell = np.floor((points - lo) / self._band).astype(np.int64)
+        in_grid = np.all((cell >= 0) & (cell < dims), axis=1)
+        flat = np.ravel_multi_index(np.clip(cell, 0, dims - 1).T, dims)
+        slot = np.minimum(np.searchsorted(keys, flat), max(len(keys) - 1, 0))
+        near = np.flatnonzero(in_grid & (keys[slot] == flat)) if len(keys) else np.zeros(0, dtype=np.int64)
+        slot = slot[near]
+        counts = bins.offsets[slot + 1] - bins.offsets[slot]
+
+        # Pairs of the points with the triangles of their bin, in batches of about `_PAIR_BATCH`
+        ends = np.cumsum(counts)
+        bounds = np.searchsorted(ends, np.arange(1, ends[-1] // _PAIR_BATCH + 1) * _PAIR_BATCH) if len(ends) else []
+        for batch in np.split(np.arange(len(near)), bounds):
+            if not batch.size:
+                continue
+            starts, batch_counts = bins.offsets[slot[batch]], counts[batch]
+            local = np.arange(batch_counts.sum()) - np.repeat(np.cumsum(batch_counts) - batch_counts, batch_counts)
+            point_idx = np.repeat(near[batch], batch_counts)
+            triangle_idx = bins.values[np.repeat(starts, batch_counts) + local]
+            closest = _closest_points(points[point_idx], self._triangles[triangle_idx])
+            pair_distances = np.linalg.norm(points[point_idx] - closest, axis=1)
+            groups = np.cumsum(batch_counts) - batch_counts
+            distances[near[batch]] = np.minimum(np.minimum.reduceat(pair_distances, groups), self._band)
+
+        return np.where(self.contains(points), distances, -distances)
+
+    def contains(self,
+                 points: np.ndarray) -> np.ndarray:
+        """
+        Tests whether points lie inside the surface.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points, of shape (M, 3).
+
+        Returns
+        -------
+        np.ndarray
+            A boolean mask of the points inside.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        inside = np.empty(len(points), dtype=bool)
+        for start in range(0, len(points), _DISTANCE_BATCH):
+            batch = slice(start, start + _DISTANCE_BATCH)
+            inside[batch] = self._contains_batch(points[batch])
+
+        return inside
+
+    def _contains_batch(self,
+                        points: np.ndarray) -> np.ndarray:
+        """
+        Tests whether a batch of points lies inside by the parity of +z ray crossings.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points, of shape (M, 3).
+
+        Returns
+        -------
+        np.ndarray
+            A boolean mask of the points inside.
+        """
+        lo, size, dims, bins, vertices, heights = self._get_columns()
+
+        # Candidate triangles of the column of each point
+        cell = np.floor((points[:, :2] - lo) / size).astype(np.int64)
+        in_grid = np.all((cell >= 0) & (cell < dims), axis=1)
+        flat = np.ravel_multi_index(np.clip(cell, 0, dims - 1).T, dims)
+        starts = bins.offsets[flat]
+        counts = np.where(in_grid, bins.offsets[flat + 1] - starts, 0)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        query_idx = np.repeat(np.arange(len(points)), counts)
+        triangle_idx = bins.values[np.repeat(starts, counts) + local]
+
+        # Edge functions of the counter-clockwise projected triangles
+        xy = points[query_idx, :2]
+        a, b, c = vertices[triangle_idx, 0], vertices[triangle_idx, 1], vertices[triangle_idx, 2]
+        edges = [_edge_function(u, v, xy) for u, v in ((b, c), (c, a), (a, b))]
+        covered = np.ones(len(xy), dtype=bool)
+        for value, top_left in edges:
+            covered &= (value > 0) | ((value == 0) & top_left)
+
+        # Height of the crossing above each point
+        weights = np.stack([value for value, _ in edges], axis=1)[covered]
+        height = np.einsum('ij,ij->i', weights, heights[triangle_idx[covered]]) / weights.sum(axis=1)
+        crossed = query_idx[covered][height > points[query_idx[covered], 2]]
+
+        return np.bincount(crossed, minlength=len(points)) % 2 == 1
+
+    def _get_bins(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, RaggedArray]:
+        """
+        Returns the distance bins, building them on first use.
+
+        The triangles are subdivided into pieces of a few bands, each piece
+        visits the bins of the cube around it, and its triangle is kept in
+        the bins whose centre lies within the band plus half a bin diagonal
+        of the triangle. Every point within the band of a triangle then
+        finds it in its own bin.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, RaggedArray]
+            The grid origin, the number of bins per axis, the sorted flat
+            indices of the bins holding triangles, and the triangle indices
+            of each of these bins.
+        """
+        if self._bins is not None:
+            return self._bins
+
+        size = float(self._band)
+        lo = self._triangles.min(axis=(0, 1)) - size
+        dims = np.floor((self._triangles.max(axis=(0, 1)) + size - lo) / size).astype(np.int64) + 1
+        reach = size + np.sqrt(3) / 2 * size
+        n_triangles = len(self._triangles)
+
+        # Pieces lie within two thirds of their longest edge of their centroid
+        pieces, owners = _subdivide(self._triangles, _PIECE_BANDS * size)
+        half = size + 2 / 3 * _PIECE_BANDS * size
+        pairs = []
+        for start in range(0, len(pieces), _PIECE_BATCH):
+            centres = pieces[start:start + _PIECE_BATCH]
+            first = np.clip(np.floor((centres - half - lo) / size).astype(np.int64), 0, dims - 1)
+            last = np.clip(np.floor((centres + half - lo) / size).astype(np.int64), 0, dims - 1)
+            spans = last - first + 1
+            counts = spans.prod(axis=1)
+            local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            piece_idx = np.repeat(np.arange(len(centres)), counts)
+            span = spans[piece_idx]
+            cells = first[piece_idx] + np.stack([local // (span[:, 1] * span[:, 2]),
+                                                 local // span[:, 2] % span[:, 1],
+                                                 local % span[:, 2]], axis=1)
+
+            # Keep the bins near the triangle of the piece
+            triangle_idx = owners[start + piece_idx]
+            bin_centres = lo + (cells + 0.5) * size
+            closest = _closest_points(bin_centres, self._triangles[triangle_idx])
+            near = np.einsum('ij,ij->i', bin_centres - closest, bin_centres - closest) <= reach ** 2
+            flat = np.ravel_multi_index(cells[near].T, dims)
+            pairs.append(np.unique(flat * n_triangles + triangle_idx[near]))
+
+        # Triangles of each bin, in flat bin order
+        pairs = np.unique(np.concatenate(pairs)) if pairs else np.zeros(0, dtype=np.int64)
+        keys, counts = np.unique(pairs // max(n_triangles, 1), return_counts=True)
+        self._bins = (lo, dims, keys, RaggedArray.from_counts(counts, pairs % max(n_triangles, 1)))
+
+        return self._bins
+
+    def _get_columns(self) -> tuple:
+        """
+        Returns the ray casting grid, building it on first use.
+
+        The triangles are projected onto the xy plane, oriented
+        counter-clockwise, and registered in every grid column overlapped by
+        their bounding box. Triangles parallel to the rays are left out.
+
+        Returns
+        -------
+        tuple
+            The grid origin, the column size, the number of columns per axis,
+            the triangle indices of each column, and the projected vertices,
+            of shape (F, 3, 2), and the heights, of shape (F, 3), of the
+            projected triangles.
+        """
+        if self._columns is not None:
+            return self._columns
+
+        vertices = self._triangles[:, :, :2].copy()
+        heights = self._triangles[:, :, 2].copy()
+        ab, ac = vertices[:, 1] - vertices[:, 0], vertices[:, 2] - vertices[:, 0]
+        area = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+        vertices, heights, area = vertices[area != 0], heights[area != 0], area[area != 0]
+        clockwise = area < 0
+        vertices[clockwise] = vertices[clockwise][:, [0, 2, 1]]
+        heights[clockwise] = heights[clockwise][:, [0, 2, 1]]
+
+        # Columns of about the size of the projected triangles
+        lower, upper = vertices.min(axis=1), vertices.max(axis=1)
+        lo = lower.min(axis=0)
+        extent = np.maximum(upper.max(axis=0) - lo, np.finfo(np.float64).tiny)
+        size = max(float(np.median((upper - lower).max(axis=1))), float(extent.max()) / _MAX_COLUMNS)
+        dims = np.maximum(np.ceil(extent / size).astype(np.int64), 1)
+
+        # Register each triangle in the columns of its bounding box
+        first = np.clip(np.floor((lower - lo) / size).astype(np.int64), 0, dims - 1)
+        last = np.clip(np.floor((upper - lo) / size).astype(np.int64), 0, dims - 1)
+        spans = last - first + 1
+        counts = spans.prod(axis=1)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        triangle_idx = np.repeat(np.arange(len(vertices)), counts)
+        cells = first[triangle_idx] + np.stack([local // spans[triangle_idx, 1],
+                                                local % spans[triangle_idx, 1]], axis=1)
+        flat = np.ravel_multi_index(cells.T, dims)
+        order = np.argsort(flat, kind='stable')
+        bins = RaggedArray.from_counts(np.bincount(flat, minlength=int(np.prod(dims))), triangle_idx[order])
+        self._columns = (lo, size, dims, bins, vertices, heights)
+
+        return self._columns
+
+
+def _extrusion_distance(excess: np.ndarray) -> np.ndarray:
+    """
+    Computes the signed distance of an intersection of slabs.
+
+    Parameters
+    ----------
+    excess : np.ndarray
+        The signed distance outside of each slab, of shape (M, D), e.g.
+        `max(lower - p, p - upper)` per axis of a box.
+
+    Returns
+    -------
+    np.ndarray
+        The distances, of shape (M,), positive inside.
+    """
+    outside = np.linalg.norm(np.maximum(excess, 0.0), axis=1)
+    inside = np.minimum(excess.max(axis=1), 0.0)
+
+    return -(outside + inside)
+
+
+def _edge_lengths(triangles: np.ndarray) -> np.ndarray:
+    """
+    Returns the edge lengths of triangles.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        The triangle vertices, of shape (F, 3, 3).
+
+    Returns
+    -------
+    np.ndarray
+        The lengths, of shape (F, 3).
+    """
+    return np.linalg.norm(triangles - np.roll(triangles, 1, axis=1), axis=2)
+
+
+def _subdivide(triangles: np.ndarray,
+               resolution: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Samples triangles by the centroids of a longest edge bisection.
+
+    Triangles with an edge longer than `resolution` are split in two at the
+    midpoint of their longest edge, repeatedly, all long triangles of a level
+    at once. Unlike a split into four, slivers are only split across, so the
+    number of pieces follows the area of the surface.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        The triangle vertices, of shape (F, 3, 3).
+    resolution : float
+        The maximum edge length.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sample points, of shape (S, 3), and the index of the triangle of
+        each sample.
+    """
+    samples = []
+    owners = []
+    pieces = triangles
+    piece_owners = np.arange(len(triangles))
+    while len(pieces):
+        lengths = _edge_lengths(pieces)
+        long = lengths.max(axis=1) > resolution
+        samples.append(pieces[~long].mean(axis=1))
+        owners.append(piece_owners[~long])
+
+        # Rotate the vertices so the longest edge runs from the first to the second
+        pieces = pieces[long]
+        first = (np.argmax(lengths[long], axis=1) + 2) % 3
+        order = (first[:, None] + np.arange(3)) % 3
+        a, b, c = np.moveaxis(np.take_along_axis(pieces, order[..., None], axis=1), 1, 0)
+        middle = (a + b) / 2
+        pieces = np.concatenate([np.stack((a, middle, c), axis=1),
+                                 np.stack((middle, b, c), axis=1)])
+        piece_owners = np.tile(piece_owners[long], 2)
+
+    return np.concatenate(samples), np.concatenate(owners)
+
+
+def _closest_points(points: np.ndarray,
+                    triangles: np.ndarray) -> np.ndarray:
+    """
+    Computes the closest points on triangles, vectorized over all pairs.
+
+    Uses the Voronoi regions of the vertices, edges and face of each
+    triangle (Ericson, Real-Time Collision Detection, 5.1.5).
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The points, broadcastable to the leading shape of `triangles` plus (3,).
+    triangles : np.ndarray
+        The triangle vertices, of shape (..., 3, 3).
+
+    Returns
+    -------
+    np.ndarray
+        The closest points, of the leading shape of `triangles` plus (3,).
+    """
+    a, b, c = triangles[..., 0, :], triangles[..., 1, :], triangles[..., 2, :]
+    ab, ac = b - a, c - a
+    ap, bp, cp = points - a, points - b, points - c
+    d1, d2 = np.einsum('...d,...d->...', ab, ap), np.einsum('...d,...d->...', ac, ap)
+    d3, d4 = np.einsum('...d,...d->...', ab, bp), np.einsum('...d,...d->...', ac, bp)
+    d5, d6 = np.einsum('...d,...d->...', ab, cp), np.einsum('...d,...d->...', ac, cp)
+    va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Face interior, then the regions by increasing priority
+        denominator = va + vb + vc
+        closest = a + ab * (vb / denominator)[..., None] + ac * (vc / denominator)[..., None]
+        regions = (
+            ((va <= 0) & (d4 >= d3) & (d5 >= d6),
+             b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[..., None]),
+            ((vb <= 0) & (d2 >= 0) & (d6 <= 0), a + ac * (d2 / (d2 - d6))[..., None]),
+            ((d6 >= 0) & (d5 <= d6), c),
+            ((vc <= 0) & (d1 >= 0) & (d3 <= 0), a + ab * (d1 / (d1 - d3))[..., None]),
+            ((d3 >= 0) & (d4 <= d3), b),
+            ((d1 <= 0) & (d2 <= 0), a)
+        )
+        for region, point in regions:
+            closest = np.where(region[..., None], point, closest)
+
+    return closest
+
+
+def _edge_function(start: np.ndarray,
+                   end: np.ndarray,
+                   points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates the 2D edge function of directed edges and their top-left flag.
+
+    The function is twice the signed area of the triangle of the edge and
+    the point, positive left of the edge. It is evaluated with the endpoints
+    in lexicographic order and negated for reversed edges, so the two
+    triangles sharing an edge get exactly opposite values.
+
+    Parameters
+    ----------
+    start : np.ndarray
+        The edge start points, of shape (P, 2).
+    end : np.ndarray
+        The edge end points, of shape (P, 2).
+    points : np.ndarray
+        The evaluated points, of shape (P, 2).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The edge function values, and whether each edge is a top or a left
+        edge of a counter-clockwise triangle, i.e. owns the points on it.
+    """
+    reverse = (start[:, 0] > end[:, 0]) | ((start[:, 0] == end[:, 0]) & (start[:, 1] > end[:, 1]))
+    low = np.where(reverse[:, None], end, start)
+    high = np.where(reverse[:, None], start, end)
+    value = ((high[:, 0] - low[:, 0]) * (points[:, 1] - low[:, 1])
+             - (high[:, 1] - low[:, 1]) * (points[:, 0] - low[:, 0]))
+    direction = end - start
+    top_left = (direction[:, 1] < 0) | ((direction[:, 1] == 0) & (direction[:, 0] < 0))
+
+    return np.where(reverse, -value, value), top_left
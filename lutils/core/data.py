@@ -1,10 +1,23 @@
+from collections.abc import Callable
+from functools import partial
 import numpy as np
+import hashlib
 from pathlib import Path
 import subprocess
 
-from lutils.io.parser import parse_internal_field, parse_residuals
-from lutils.utils.misc import get_of_version, check_dir
-from lutils.core.types import DataFrame
+from lutils.io.parser import parse_internal_field, parse_residuals, parse_interpolation_info
+from lutils.io.follower import ResidualsFollower
+from lutils.io.foam_parser import (is_foam_file, parse_foam_header, parse_foam_field,
+                                   get_field_type, get_component_names, get_n_cells)
+from lutils.io.log_parser import parse_solver_log
+from lutils.io.decomposed import get_processor_dirs, parse_decomposed_field
+from lutils.io.cache import FieldCache
+from lutils.io.mesh_parser import (parse_foam_list, parse_foam_faces, parse_foam_boundary,
+                                   parse_foam_set, parse_foam_zones)
+from lutils.utils.misc import get_of_version, check_dir, find_in_file
+from lutils.core.types import DataFrame, RaggedArray, Query
+from lutils.core.spatial import SpatialIndex, sorted_ranges
+from lutils.core.sampling import InterpolationWeights, line_points, plane_points
 
 
 class FoamCase:
@@ -26,6 +39,17 @@ class FoamCase:
     of_version : int, optional
         The specific OpenFOAM version used. If 0, the version is auto-detected
         from existing logs. Default is 0.
+    cache_dir : str, optional
+        If given, parsed CSV fields are cached in this directory, relative to
+        `case_path`, and memory-mapped on later loads. Default is None.
+    cache_size : int, optional
+        The size budget of the field cache in bytes. Default is 1 GiB.
+    spill_dir : str, optional
+        If given, CSV fields are parsed out-of-core into memory-mapped spill
+        files in this directory, relative to `case_path`. Default is None.
+    field_dtype : np.dtype, optional
+        The default storage dtype of the floating point field columns,
+        including the coordinates, see `add_field`. Default is np.float64.
 
     Attributes
     ----------
@@ -40,7 +64,11 @@ class FoamCase:
                  case_path: str,
                  label: str,
                  log_dir: str = 'logs/',
-                 of_version: int = 0) -> None:
+                 of_version: int = 0,
+                 cache_dir: str | None = None,
+                 cache_size: int = 1 << 30,
+                 spill_dir: str | None = None,
+                 field_dtype: np.dtype = np.float64) -> None:
         if not Path(case_path).is_dir():
             raise FileNotFoundError(
                 f'Case path not found or in not a directory.')
@@ -48,6 +76,15 @@ class FoamCase:
         self._log_dir = log_dir
         self._label = label
         self._fields = {}
+        self._interpolation = {}
+        self._geometry = None
+        self._cell_sets = CellSets(self._case_path)
+        self._cache = None
+        if cache_dir is not None:
+            self._cache = FieldCache(self._case_path / cache_dir, cache_size)
+        self._spill_dir = self._case_path / spill_dir if spill_dir is not None else None
+        self._field_dtype = np.dtype(field_dtype)
+        self._coordinates = CoordinateStore()
 
         # Check if log folder exists, otherwise create new one
         check_dir(self._case_path / self._log_dir)
@@ -78,6 +115,36 @@ class FoamCase:
         """dict[str, FieldData]: A dictionary mapping field names to their corresponding FieldData objects. """
         return self._fields
 
+    @property
+    def interpolation(self):
+        """dict[str, InterpolationData]: A dictionary mapping labels to the loaded interpolation info."""
+        return self._interpolation
+
+    @property
+    def geometry(self):
+        """GeometryData | None: The case mesh, None until loaded by `add_geometry`."""
+        return self._geometry
+
+    @property
+    def cache(self):
+        """FieldCache | None: The field cache, None if caching is disabled."""
+        return self._cache
+
+    @property
+    def is_decomposed(self):
+        """bool: True if the case has 'processor<N>' directories."""
+        return bool(get_processor_dirs(self._case_path))
+
+    @property
+    def cell_sets(self):
+        """CellSets: The cached cell sets and zones of the case."""
+        return self._cell_sets
+
+    @property
+    def coordinates(self):
+        """CoordinateStore: The cell centre coordinates shared by the fields."""
+        return self._coordinates
+
     def run_script(self,
                    file_name: str) -> None:
         """
@@ -128,9 +195,26 @@ class FoamCase:
 
     def add_field(self,
                   file_path: str,
-                  field_name: str) -> None:
+                  field_name: str,
+                  dtype: np.dtype | None = None,
+                  keep_raw: bool = False) -> None:
         """
-        Loads field data from a file and registers it to the case.
+        Registers field data from a file to the case.
+
+        The field is a lazy handle, the file is parsed on the first access of
+        its data. The coordinates are stored once in the shared coordinate
+        store of the case.
+
+        Both CSV exports and native OpenFOAM field files (e.g. '2000/U') are
+        supported, the format is detected from the file header. Native fields
+        without a 'C' file use the cell centres of the geometry loaded when
+        the field is first read, also if `add_geometry` is called later. Fields
+        of decomposed cases are read from the processor directories if the
+        reconstructed file does not exist.
+
+        Storing the field as np.float32 halves its memory, reductions such as
+        `DataFrame.reduce` still accumulate in float64. Accuracy-sensitive
+        comparisons should load their fields with dtype=np.float64.
 
         Parameters
         ----------
@@ -138,9 +222,17 @@ class FoamCase:
             The path to the data file, relative to the case directory.
         field_name : str
             The unique name (key) to assign to this field data.
+        dtype : np.dtype, optional
+            The storage dtype of the floating point columns. If None, the
+            `field_dtype` of the case is used. Default is None.
+        keep_raw : bool, optional
+            If True, the parsed CSV table with all its columns is kept, see
+            `FieldData.internal_field`. Default is False.
         """
         self.fields[field_name] = FieldData(
-            self.case_path, file_path, field_name)
+            self.case_path, file_path, field_name, lambda: self._geometry, self._cell_sets, self._cache,
+            self._spill_dir / field_name if self._spill_dir is not None else None,
+            dtype if dtype is not None else self._field_dtype, self._coordinates, keep_raw)
 
     def del_field(self,
                   field_name: str) -> None:
@@ -160,7 +252,8 @@ class FoamCase:
 
     def add_residuals(self,
                       file_path: str,
-                      fields: list[str] = []) -> None:
+                      fields: list[str] = [],
+                      follow: bool = False) -> None:
         """
         Loads residual data from a specified file.
 
@@ -171,15 +264,85 @@ class FoamCase:
         fields : list[str], optional
             A list of specific residual fields to load. If empty, all available
             fields are loaded. Default is an empty list.
+        follow : bool, optional
+            If True, the file is followed incrementally, see `ResidualsData.refresh`.
+            Default is False.
         """
         self.residuals = ResidualsData(
-            self.case_path, file_path, fields)
+            self.case_path, file_path, fields, follow)
+
+    def add_interpolation(self,
+                          file_path: str,
+                          label: str) -> None:
+        """
+        Loads an interpolation info file and registers it to the case.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the interpolation info file, relative to the case directory
+            (e.g. 'ZZ_python/interpolationInfo_boundary.dat').
+        label : str
+            The unique name (key) to assign to this interpolation info.
+        """
+        self.interpolation[label] = InterpolationData(self.case_path, file_path)
+
+    def add_geometry(self,
+                     mesh_dir: str = 'constant/polyMesh') -> None:
+        """
+        Loads the case mesh from a polyMesh directory.
+
+        Parameters
+        ----------
+        mesh_dir : str, optional
+            The polyMesh directory, relative to the case directory.
+            Default is 'constant/polyMesh'.
+        """
+        self._geometry = GeometryData(self.case_path, mesh_dir)
+
+    def add_solver_log(self,
+                       file_path: str | None = None) -> None:
+        """
+        Loads per time step solver records and timings from a solver log.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The path to the log file, relative to the case directory. If None,
+            the log of the application specified in 'system/controlDict' is
+            used (e.g. 'log.simpleFoam'). Default is None.
+
+        Raises
+        ------
+        ValueError
+            If `file_path` is None and the application name cannot be found.
+        """
+        if file_path is None:
+            application = find_in_file(
+                self.case_path / 'system/controlDict', 'application')
+            if not application:
+                raise ValueError('Solver name not found in controlDict')
+            file_path = f'log.{application.strip(";")}'
+
+        self.solver_log = parse_solver_log(self.case_path / file_path)
 
 
 class FieldData:
     """
     A container for field data loaded from OpenFOAM output files.
 
+    The data is either a CSV export with 'x', 'y', 'z' and `field_name`
+    columns, or a native OpenFOAM field file. Native vector and tensor fields
+    are split into component columns (e.g. 'Ux', 'Uy', 'Uz'), cell centre
+    coordinates are read from the 'C' field in the same directory if present.
+    Native fields of decomposed cases are assembled from the processor
+    directories when the reconstructed file does not exist.
+
+    The file is parsed on the first access of `data`. The coordinate columns
+    are taken from the coordinate store, so fields on the same cells share
+    one copy of them. Unless `keep_raw` is set, the parsed CSV table is
+    released once the relevant columns are projected.
+
     Parameters
     ----------
     case_path : Path
@@ -188,19 +351,181 @@ class FieldData:
         The path to the specific data file, relative to `case_path`.
     field_name : str
         The name identifying this field.
+    geometry : GeometryData or Callable[[], GeometryData | None], optional
+        The case mesh, provides the cell centres of native fields without a
+        'C' file. A callable is resolved when the file is parsed, so a mesh
+        loaded after the field is registered is still used. Default is None.
+    cell_sets : CellSets, optional
+        The cell sets of the case, used to select cells by set name. If None,
+        the sets are read from the case on demand. Default is None.
+    cache : FieldCache, optional
+        The cache used for parsed CSV files. Default is None.
+    spill_dir : Path, optional
+        If given, CSV files are parsed out-of-core into memory-mapped
+        columns in this directory, see `parse_internal_field`. Default is None.
+    dtype : np.dtype, optional
+        The storage dtype of the floating point columns, including the
+        coordinates. Default is np.float64.
+    coordinates : CoordinateStore, optional
+        The coordinate store shared by the fields of a case. If None, the
+        field uses its own store. Default is None.
+    keep_raw : bool, optional
+        If True, the parsed CSV table with all its columns is kept in
+        `internal_field`. Default is False.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist and the case is not decomposed.
     """
 
     def __init__(self,
                  case_path: Path,
                  file_path: str,
-                 field_name: str) -> None:
-        # Parse data into DataFrame
-        self._internal_field = parse_internal_field(case_path / file_path)
+                 field_name: str,
+                 geometry: 'GeometryData | Callable[[], GeometryData | None] | None' = None,
+                 cell_sets: 'CellSets | None' = None,
+                 cache: FieldCache | None = None,
+                 spill_dir: Path | None = None,
+                 dtype: np.dtype = np.float64,
+                 coordinates: 'CoordinateStore | None' = None,
+                 keep_raw: bool = False) -> None:
+        path = case_path / file_path
+        if not path.exists() and not get_processor_dirs(case_path):
+            raise FileNotFoundError(f'Field file not found at: {path}')
+
+        self._case_path = case_path
+        self._file_path = file_path
         self._name = field_name
+        self._geometry = geometry
+        self._cell_sets = cell_sets if cell_sets is not None else CellSets(case_path)
+        self._cache = cache
+        self._spill_dir = spill_dir
+        self._dtype = np.dtype(dtype)
+        self._coordinates = coordinates if coordinates is not None else CoordinateStore()
+        self._keep_raw = keep_raw
+
+        # Parsed on first access
+        self._data = None
+        self._internal_field = None
+        self._coordinate_key = None
+
+    def _load(self) -> None:
+        """Parses the field file and takes the coordinates from the store."""
+        path = self._case_path / self._file_path
+
+        # Parse native OpenFOAM field, the table is already projected
+        if path.exists() and is_foam_file(path):
+            data = self._parse_foam_field(False)
+        # Read the processor directories of a decomposed case
+        elif not path.exists():
+            data = self._parse_foam_field(True)
+        else:
+            data = self._parse_csv_field(path)
+
+        # Replace the coordinates by the shared copy of identical ones
+        if self._coordinate_key is None and {'x', 'y', 'z'} <= set(data.header):
+            self._coordinate_key, _ = self._coordinates.intern(
+                {axis: data[axis] for axis in ('x', 'y', 'z')})
+        if self._coordinate_key is not None:
+            shared = self._coordinates[self._coordinate_key]
+            data = DataFrame(data.header, {name: shared.get(name, data[name])
+                                           for name in data.header})
+
+        self._data = data
+
+    def _parse_csv_field(self,
+                         path: Path) -> DataFrame:
+        """
+        Parses a CSV export and projects its relevant columns.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the CSV file.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the 'x', 'y', 'z' and field columns. If the table
+            is not kept, the field column is compacted so the parsed block
+            can be released.
+        """
+        # Parse data into DataFrame, or load it from the cache
+        parser = parse_internal_field
+        if self._spill_dir is not None:
+            parser = partial(parse_internal_field, spill_dir=self._spill_dir)
+        # The cache keeps full precision, the storage dtype is applied on load
+        if self._cache is not None:
+            internal_field = _astype_floats(self._cache.load(path, parser), self._dtype)
+        else:
+            internal_field = parser(path, dtype=self._dtype)
 
-        # Filter relevant columns
+        # Project relevant columns, the view shares memory with the parsed table
         keys = ['x', 'y', 'z', self._name]
-        self._data = DataFrame(keys, self._internal_field[keys])
+        data = internal_field[keys]
+        if self._keep_raw:
+            self._internal_field = internal_field
+            return data
+
+        return DataFrame(keys, {name: np.ascontiguousarray(data[name]) for name in keys})
+
+    def _parse_foam_field(self,
+                          decomposed: bool) -> DataFrame:
+        """
+        Parses a native OpenFOAM field file together with its cell centres.
+
+        Cell centres from a 'C' file are loaded once per case through the
+        coordinate store.
+
+        Parameters
+        ----------
+        decomposed : bool
+            If True, the field is read from the processor directories and
+            assembled in global cell order.
+
+        Returns
+        -------
+        DataFrame
+            A columnar DataFrame with 'x', 'y', 'z' columns, if the cell
+            centres are available, followed by the field component columns.
+        """
+        case_path, file_path, dtype = self._case_path, self._file_path, self._dtype
+        if decomposed:
+            path = get_processor_dirs(case_path)[0] / file_path
+        else:
+            path = case_path / file_path
+        names = get_component_names(
+            self._name, get_field_type(parse_foam_header(path)))
+        data = {}
+
+        # Cell centres written by the writeCellCentres function object
+        centres_path = Path(file_path).parent / 'C'
+        geometry = self._geometry() if callable(self._geometry) else self._geometry
+        if (path.parent / 'C').exists():
+            self._coordinate_key, centres = self._coordinates.load(
+                f'{centres_path}:{decomposed}',
+                lambda: _read_foam_field(case_path, centres_path, get_n_cells(case_path), decomposed),
+                dtype)
+            data.update(centres)
+            n_cells = len(centres['x'])
+        # Cell centres computed from the mesh
+        elif geometry is not None:
+            for idx, axis in enumerate(['x', 'y', 'z']):
+                data[axis] = np.ascontiguousarray(geometry.cell_centres[:, idx], dtype=dtype)
+            n_cells = geometry.n_cells
+        else:
+            n_cells = get_n_cells(case_path)
+
+        # Store contiguous columns, scalar fields of the storage dtype are not copied
+        values = _read_foam_field(case_path, file_path, n_cells, decomposed)
+        if values.ndim == 1:
+            data[names[0]] = values.astype(dtype, copy=False)
+        else:
+            for idx, name in enumerate(names):
+                data[name] = np.ascontiguousarray(values[:, idx], dtype=dtype)
+
+        return DataFrame(list(data), data)
 
     @property
     def name(self):
@@ -209,14 +534,117 @@ class FieldData:
 
     @property
     def data(self):
-        """DataFrame: A DataFrame containing the parsed internal field data."""
+        """DataFrame: A DataFrame containing the parsed internal field data, parsed on first access."""
+        if self._data is None:
+            self._load()
         return self._data
 
+    @property
+    def is_loaded(self):
+        """bool: True if the field file has been parsed."""
+        return self._data is not None
+
+    @property
+    def internal_field(self):
+        """DataFrame | None: The parsed CSV table with all columns, None unless kept by `keep_raw`."""
+        return self._internal_field
+
+    def release_raw(self) -> None:
+        """
+        Releases the parsed CSV table kept by `keep_raw`.
+
+        The projected columns are compacted first, so the table memory is
+        freed once no other views of it exist.
+        """
+        if self._internal_field is None:
+            return
+
+        self._data = DataFrame(self._data.header, {name: np.ascontiguousarray(self._data[name])
+                                                   for name in self._data.header})
+        self._internal_field = None
+
+    @property
+    def dtypes(self):
+        """dict[str, np.dtype | str]: The storage dtype of each column."""
+        return self.data.dtypes
+
+    @property
+    def coordinate_key(self) -> str:
+        """
+        str: The coordinate store key of the cell centres, loading the field if needed.
+
+        Fields with the same key share their coordinates and spatial index.
+
+        Raises
+        ------
+        ValueError
+            If the field has no 'x', 'y', 'z' columns.
+        """
+        if not self.is_loaded:
+            self._load()
+        if self._coordinate_key is None:
+            raise ValueError(f'Field "{self._name}" has no cell centre coordinates')
+
+        return self._coordinate_key
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        SpatialIndex: The index of the cell centres, built on first use.
+
+        The index is kept in the coordinate store and shared with the other
+        fields of the case having the same coordinates.
+
+        Raises
+        ------
+        ValueError
+            If the field has no 'x', 'y', 'z' columns.
+        """
+        return self._coordinates.spatial_index(self.coordinate_key)
+
+    def get_set_mask(self,
+                     set_name: str) -> np.ndarray:
+        """
+        Returns a boolean mask selecting the rows of a cell set or zone.
+
+        The rows are assumed to be ordered by cell index, as in native fields
+        and cell data exports.
+
+        Parameters
+        ----------
+        set_name : str
+            The name of a cell set ('constant/polyMesh/sets') or cell zone.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array with one entry per row.
+        """
+        return self._cell_sets.mask(set_name, self.data.shape()[0])
+
+    def get_set(self,
+                set_name: str) -> DataFrame:
+        """
+        Extracts the cells of a cell set or zone.
+
+        Parameters
+        ----------
+        set_name : str
+            The name of a cell set ('constant/polyMesh/sets') or cell zone.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame containing the rows of the set members.
+        """
+        return self.data.select_rows(self.get_set_mask(set_name))
+
     def get_cells(self,
                   position_axis: str,
                   position_value: float,
                   data_axis: str,
-                  tol: float) -> DataFrame:
+                  tol: float,
+                  cell_set: str | None = None) -> DataFrame:
         """
         Extracts a subset of cells near a specific coordinate and sorts them.
 
@@ -230,35 +658,241 @@ class FieldData:
             The column name to use for sorting the resulting data.
         tol : float
             The tolerance radius around `position_value` for cell selection.
+        cell_set : str, optional
+            If given, only cells of this cell set or zone are selected.
+            Default is None.
 
         Returns
         -------
         DataFrame
             A DataFrame containing the filtered cells, sorted by `data_axis`.
         """
-        # Get position axis values
-        column_names = self.data._header
-        data_axis_values = self.data[position_axis]
+        return self.get_profiles(position_axis, [position_value], data_axis, tol, cell_set)[0]
+
+    def get_profiles(self,
+                     position_axis: str,
+                     position_values: np.ndarray,
+                     data_axis: str,
+                     tol: float,
+                     cell_set: str | None = None) -> list[DataFrame]:
+        """
+        Extracts the cells near several stations along an axis in one pass.
 
-        # Find all cells close to position value
-        absolute_diff = np.abs(data_axis_values-position_value)
-        filter_idx = np.where(absolute_diff < tol)[0]
+        The cells of all stations are found by one vectorized binary search,
+        in the spatial index for coordinate axes or in a sorted copy of other
+        columns. A single sort orders every profile by `data_axis` and all
+        columns are gathered at once.
 
-        # Filter data
-        filtered_data = self.data._data[filter_idx]
+        Parameters
+        ----------
+        position_axis : str
+            The axis name to filter by (e.g., 'x', 'y', or 'z').
+        position_values : np.ndarray
+            The station coordinates along `position_axis`.
+        data_axis : str
+            The column name to use for sorting each profile.
+        tol : float
+            The tolerance radius around each station for cell selection.
+        cell_set : str, optional
+            If given, only cells of this cell set or zone are selected.
+            Default is None.
 
-        # Sort filtered data
-        sort_column_idx = self.data._map[data_axis]
-        sorting_idx = np.argsort(filtered_data[:, sort_column_idx])
-        sorted_filtered_data = filtered_data[sorting_idx]
+        Returns
+        -------
+        list[DataFrame]
+            One DataFrame per station, sorted by `data_axis`. The profiles are
+            row views of one gathered table.
+        """
+        # Find the cells of every station
+        if position_axis in ('x', 'y', 'z') and {'x', 'y', 'z'} <= set(self.data.header):
+            stations = self.spatial_index.slabs(position_axis, position_values, tol)
+        else:
+            column = self.data[position_axis]
+            order = np.argsort(column, kind='stable')
+            stations = sorted_ranges(column[order], order, position_values, tol)
+        filter_idx = stations.values
+        station_idx = stations.row_index
+        if cell_set is not None:
+            in_set = self.get_set_mask(cell_set)[filter_idx]
+            filter_idx, station_idx = filter_idx[in_set], station_idx[in_set]
 
-        return DataFrame(column_names, sorted_filtered_data)
+        # Sort by station, then by the data axis, and gather all columns at once
+        sorting_idx = np.lexsort((self.data[data_axis][filter_idx], station_idx))
+        profiles = self.data.select_rows(filter_idx[sorting_idx])
+
+        # Split into per-station row views
+        offsets = np.zeros(len(stations) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(station_idx, minlength=len(stations)), out=offsets[1:])
+
+        return [profiles[int(start):int(end)] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def get_nearest(self,
+                    points: np.ndarray) -> DataFrame:
+        """
+        Extracts the cells nearest to probe points.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The probe points, of shape (M, 3) or (3,).
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the row of the nearest cell of each point.
+        """
+        cell_idx, _ = self.spatial_index.nearest(points)
+
+        return self.data.select_rows(cell_idx)
+
+    def get_radius(self,
+                   centre: np.ndarray,
+                   radius: float) -> DataFrame:
+        """
+        Extracts the cells within a distance of a point.
+
+        Parameters
+        ----------
+        centre : np.ndarray
+            The centre point, of shape (3,).
+        radius : float
+            The search radius.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame containing the cells within `radius`, in cell order.
+        """
+        cell_idx = self.spatial_index.radius(centre, radius)[0]
+
+        return self.data.select_rows(cell_idx)
+
+    def sample_points(self,
+                      points: np.ndarray,
+                      method: str = 'linear',
+                      k: int | None = None) -> DataFrame:
+        """
+        Interpolates the float columns of the field to arbitrary points.
+
+        The interpolation weights are cached in the coordinate store of the
+        case, so sampling the same points of another field or time step on
+        the same mesh only gathers and sums the neighbour values.
+        Points farther than one cell size from the cells of the field, e.g.
+        inside a step or past an outlet, are outside of the mesh and their
+        interpolated values are NaN.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The sample points, of shape (M, 3).
+        method : str, optional
+            The interpolation method, 'nearest', 'idw' or 'linear', see
+            `InterpolationWeights.compute`. Default is 'linear'.
+        k : int, optional
+            The number of neighbours, None for the method default.
+            Default is None.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the 'x', 'y', 'z' sample points followed by the
+            interpolated float64 columns.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        weights = self._coordinates.interpolation_weights(self.coordinate_key, points, method, k)
+
+        # Interpolate every float column except the coordinates
+        columns = {axis: points[:, idx] for idx, axis in enumerate(('x', 'y', 'z'))}
+        for name, dtype in self.dtypes.items():
+            if name not in columns and isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                columns[name] = weights.apply(self.data[name])
+
+        return DataFrame(list(columns), columns)
+
+    def sample_line(self,
+                    start: np.ndarray,
+                    end: np.ndarray,
+                    n: int,
+                    method: str = 'linear',
+                    k: int | None = None) -> DataFrame:
+        """
+        Samples the field at evenly spaced points of a line segment.
+
+        Parameters
+        ----------
+        start : np.ndarray
+            The first point of the line, of shape (3,).
+        end : np.ndarray
+            The last point of the line, of shape (3,).
+        n : int
+            The number of sample points.
+        method : str, optional
+            The interpolation method, see `sample_points`. Default is 'linear'.
+        k : int, optional
+            The number of neighbours, None for the method default.
+            Default is None.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the 'distance' from `start`, followed by the
+            columns of `sample_points`.
+        """
+        points, distance = line_points(start, end, n)
+        samples = self.sample_points(points, method, k)
+
+        return DataFrame(['distance'] + samples.header,
+                         {'distance': distance} | {name: samples[name] for name in samples.header})
+
+    def sample_plane(self,
+                     origin: np.ndarray,
+                     normal: np.ndarray,
+                     extent: float | tuple[float, float],
+                     n: int | tuple[int, int],
+                     method: str = 'linear',
+                     k: int | None = None) -> DataFrame:
+        """
+        Samples the field on a regular grid of a plane rectangle.
+
+        Parameters
+        ----------
+        origin : np.ndarray
+            The centre of the rectangle, of shape (3,).
+        normal : np.ndarray
+            The plane normal, of shape (3,).
+        extent : float or tuple[float, float]
+            The size of the rectangle along the in-plane axes u and v.
+        n : int or tuple[int, int]
+            The number of sample points along u and v.
+        method : str, optional
+            The interpolation method, see `sample_points`. Default is 'linear'.
+        k : int, optional
+            The number of neighbours, None for the method default.
+            Default is None.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the in-plane 'u', 'v' coordinates relative to
+            `origin`, followed by the columns of `sample_points`. The rows
+            are ordered by u, then v.
+        """
+        points, plane = plane_points(origin, normal, extent, n)
+        samples = self.sample_points(points, method, k)
+
+        return DataFrame(['u', 'v'] + samples.header,
+                         {'u': plane[:, 0], 'v': plane[:, 1]}
+                         | {name: samples[name] for name in samples.header})
 
 
 class ResidualsData:
     """
     A container for residual data loaded from OpenFOAM output files.
 
+    The residuals are stored in a columnar DataFrame with a dtype per column,
+    see `parse_residuals`. In follow mode, the file of a running case is read
+    incrementally, each call to `refresh` only parses the newly written rows.
+
     Parameters
     ----------
     case_path : Path
@@ -268,12 +902,24 @@ class ResidualsData:
     fields : list[str], optional
         A list of specific residual fields to extract. If empty, all fields are loaded.
         Default is an empty list.
+    follow : bool, optional
+        If True, the file is followed incrementally. Default is False.
     """
 
     def __init__(self,
                  case_path: Path,
                  file_path: str,
-                 fields: list[str] = []) -> None:
+                 fields: list[str] = [],
+                 follow: bool = False) -> None:
+        self._fields = fields
+        self._follower = None
+
+        # Follow the file, load all rows written so far
+        if follow:
+            self._follower = ResidualsFollower(case_path / file_path)
+            self.refresh()
+            return
+
         # Load residuals
         residuals = parse_residuals(case_path / file_path)
 
@@ -281,17 +927,649 @@ class ResidualsData:
         if not fields:
             self._data = residuals
         else:
-            self._data = DataFrame(fields, residuals[fields])
+            self._data = residuals[fields]
 
     @property
     def data(self):
         """DataFrame: A DataFrame containing the parsed residuals."""
         return self._data
 
+    def refresh(self) -> int:
+        """
+        Loads the rows appended to the residuals file since the last refresh.
+
+        Returns
+        -------
+        int
+            The number of new rows.
+
+        Raises
+        ------
+        RuntimeError
+            If the residuals were not loaded in follow mode.
+        """
+        if self._follower is None:
+            raise RuntimeError(
+                'Residuals not loaded in follow mode, cannot refresh.')
+
+        n_rows = self._follower.refresh()
+        residuals = self._follower.data
+
+        # If no fields given load all, else select provided
+        if not self._fields or not len(residuals):
+            self._data = residuals
+        else:
+            self._data = residuals[self._fields]
+
+        return n_rows
+
 
 class InterpolationData:
-    pass
+    """
+    A container for interpolation info loaded from openHFDIBRANS output files.
+
+    Scalar columns (e.g. 'cellI', 'yOrtho', 'order') are 1D arrays, vector
+    columns (e.g. 'cellCenter', 'surfNorm') are (N, 3) arrays and the
+    variable-length 'intPoints' and 'intCells' lists are RaggedArray columns
+    in CSR form.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root path of the OpenFOAM case.
+    file_path : str
+        The path to the interpolation info file, relative to `case_path`.
+    """
+
+    def __init__(self,
+                 case_path: Path,
+                 file_path: str) -> None:
+        self._columns = parse_interpolation_info(case_path / file_path)
+
+        # Per row scalar columns
+        header = [name for name, column in self._columns.items()
+                  if isinstance(column, np.ndarray) and column.ndim == 1]
+        self._data = DataFrame(header, {name: self._columns[name] for name in header})
+
+    @property
+    def columns(self):
+        """dict[str, np.ndarray | RaggedArray]: A dictionary mapping column names to the parsed columns."""
+        return self._columns
+
+    @property
+    def data(self):
+        """DataFrame: A columnar DataFrame of the scalar columns."""
+        return self._data
+
+    def __getitem__(self,
+                    key: str) -> np.ndarray | RaggedArray:
+        """
+        Returns a parsed column by name.
+
+        Parameters
+        ----------
+        key : str
+            The column name.
+
+        Returns
+        -------
+        np.ndarray or RaggedArray
+            The requested column.
+        """
+        return self._columns[key]
+
+    def __len__(self) -> int:
+        """Returns the number of interpolation info rows."""
+        return self._data.shape()[0]
 
 
 class GeometryData:
-    pass
+    """
+    A container for the polyMesh geometry of an OpenFOAM case.
+
+    The mesh is stored in compact connectivity arrays: float64 point
+    coordinates, the face point labels in CSR form and flat int32 owner and
+    neighbour arrays. Boundary patches are slices into the face arrays. Face
+    and cell centres, face area vectors and cell volumes are computed on first
+    access with vectorized operations over all faces.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root path of the OpenFOAM case.
+    mesh_dir : str, optional
+        The polyMesh directory, relative to `case_path`. Default is
+        'constant/polyMesh'.
+    """
+
+    def __init__(self,
+                 case_path: Path,
+                 mesh_dir: str = 'constant/polyMesh') -> None:
+        path = case_path / mesh_dir
+
+        # Parse mesh files into contiguous arrays
+        self._points = np.ascontiguousarray(
+            parse_foam_list(path / 'points'), dtype=np.float64)
+        faces = parse_foam_faces(path / 'faces')
+        self._faces = RaggedArray(faces.offsets.astype(np.int64, copy=False),
+                                  faces.values.astype(np.int32, copy=False))
+        self._owner = parse_foam_list(path / 'owner').astype(np.int32, copy=False)
+        self._neighbour = parse_foam_list(
+            path / 'neighbour').astype(np.int32, copy=False)
+        self._boundary = parse_foam_boundary(path / 'boundary')
+
+        if len(self._owner) != len(self._faces):
+            raise ValueError(
+                f'Owner size {len(self._owner)} does not match the number of faces {len(self._faces)}')
+
+        self._n_cells = int(self._owner.max()) + 1 if len(self._owner) else 0
+        if len(self._neighbour):
+            self._n_cells = max(self._n_cells, int(self._neighbour.max()) + 1)
+
+        # Patches are contiguous ranges of boundary faces
+        self._patches = {name: slice(patch['startFace'], patch['startFace'] + patch['nFaces'])
+                         for name, patch in self._boundary.items()}
+
+        self._face_centres = None
+        self._face_areas = None
+        self._cell_centres = None
+        self._cell_volumes = None
+
+    @property
+    def points(self):
+        """np.ndarray: The point coordinates, of shape (n_points, 3)."""
+        return self._points
+
+    @property
+    def faces(self):
+        """RaggedArray: The point labels of each face."""
+        return self._faces
+
+    @property
+    def owner(self):
+        """np.ndarray: The owner cell of each face."""
+        return self._owner
+
+    @property
+    def neighbour(self):
+        """np.ndarray: The neighbour cell of each internal face."""
+        return self._neighbour
+
+    @property
+    def boundary(self):
+        """dict[str, dict[str, str | int]]: The boundary patch entries."""
+        return self._boundary
+
+    @property
+    def patches(self):
+        """dict[str, slice]: The face range of each boundary patch."""
+        return self._patches
+
+    @property
+    def n_cells(self):
+        """int: The number of cells."""
+        return self._n_cells
+
+    @property
+    def n_faces(self):
+        """int: The number of faces."""
+        return len(self._faces)
+
+    @property
+    def n_internal_faces(self):
+        """int: The number of internal faces."""
+        return len(self._neighbour)
+
+    @property
+    def face_centres(self) -> np.ndarray:
+        """np.ndarray: The face centres, of shape (n_faces, 3)."""
+        if self._face_centres is None:
+            self._compute_faces()
+        return self._face_centres
+
+    @property
+    def face_areas(self) -> np.ndarray:
+        """np.ndarray: The face area vectors, of shape (n_faces, 3)."""
+        if self._face_areas is None:
+            self._compute_faces()
+        return self._face_areas
+
+    @property
+    def cell_centres(self) -> np.ndarray:
+        """np.ndarray: The cell centres, of shape (n_cells, 3)."""
+        if self._cell_centres is None:
+            self._compute_cells()
+        return self._cell_centres
+
+    @property
+    def cell_volumes(self) -> np.ndarray:
+        """np.ndarray: The cell volumes, of shape (n_cells,)."""
+        if self._cell_volumes is None:
+            self._compute_cells()
+        return self._cell_volumes
+
+    def _compute_faces(self) -> None:
+        """
+        Computes the face centres and area vectors.
+
+        Each face is split into triangles around the mean of its points, the
+        face centre is the area-weighted mean of the triangle centres.
+        """
+        n_faces = len(self._faces)
+        offsets = self._faces.offsets
+        counts = self._faces.counts
+        face_of = self._faces.row_index
+
+        # Next point of each face edge, wrapping around at the face end
+        following = np.arange(1, len(face_of) + 1)
+        following[offsets[1:] - 1] = offsets[:-1]
+
+        p = self._points[self._faces.values]
+        q = p[following]
+        estimate = _sum_by(face_of, p, n_faces) / counts[:, None]
+
+        # Triangles formed by each edge and the estimated centre
+        normals = np.cross(q - p, estimate[face_of] - p)
+        areas = np.linalg.norm(normals, axis=1)
+        centres = p + q + estimate[face_of]
+
+        sum_areas = np.bincount(face_of, areas, minlength=n_faces)
+        self._face_centres = (_sum_by(face_of, centres * areas[:, None], n_faces)
+                              / (3.0 * sum_areas[:, None]))
+        self._face_areas = 0.5 * _sum_by(face_of, normals, n_faces)
+
+    def _compute_cells(self) -> None:
+        """
+        Computes the cell centres and volumes.
+
+        Each cell is split into pyramids formed by its faces and the mean of
+        its face centres, the cell centre is the volume-weighted mean of the
+        pyramid centres.
+        """
+        n_internal = len(self._neighbour)
+        face_centres = self.face_centres
+        face_areas = self.face_areas
+
+        # Owner and neighbour side of every face, the neighbour sees the face flipped
+        cells = np.concatenate([self._owner, self._neighbour])
+        centres = np.concatenate([face_centres, face_centres[:n_internal]])
+        areas = np.concatenate([face_areas, -face_areas[:n_internal]])
+
+        n_faces = np.bincount(cells, minlength=self._n_cells)
+        estimate = _sum_by(cells, centres, self._n_cells) / n_faces[:, None]
+
+        # Pyramid volumes (times 3) and centres
+        volumes = np.einsum('ij,ij->i', areas, centres - estimate[cells])
+        pyramid_centres = 0.75 * centres + 0.25 * estimate[cells]
+
+        sum_volumes = np.bincount(cells, volumes, minlength=self._n_cells)
+        self._cell_centres = (_sum_by(cells, pyramid_centres * volumes[:, None], self._n_cells)
+                              / sum_volumes[:, None])
+        self._cell_volumes = sum_volumes / 3.0
+
+
+class CellSets:
+    """
+    A per case cache of cell sets and cell zones.
+
+    Sets are read from 'sets/<name>' and zones from 'cellZones' in the
+    polyMesh directory on first access, as int32 cell index arrays. Only
+    sets of the 'cellSet' class are listed, face and point sets in the same
+    directory are skipped. Boolean masks over all cells are built once per
+    set and reused for filtering.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root path of the OpenFOAM case.
+    mesh_dir : str, optional
+        The polyMesh directory, relative to `case_path`. Default is
+        'constant/polyMesh'.
+    """
+
+    def __init__(self,
+                 case_path: Path,
+                 mesh_dir: str = 'constant/polyMesh') -> None:
+        self._mesh_path = case_path / mesh_dir
+        self._cells = {}
+        self._masks = {}
+        self._zones = None
+
+    @property
+    def names(self) -> list[str]:
+        """list[str]: The names of the available cell sets and zones."""
+        sets_path = self._mesh_path / 'sets'
+        names = [path.name for path in sorted(sets_path.iterdir())
+                 if _is_cell_set(path)] if sets_path.is_dir() else []
+
+        return names + [name for name in self._get_zones() if name not in names]
+
+    def __getitem__(self,
+                    name: str) -> np.ndarray:
+        """
+        Returns the cell indices of a set or zone.
+
+        Parameters
+        ----------
+        name : str
+            The set or zone name. Sets take precedence over zones.
+
+        Returns
+        -------
+        np.ndarray
+            The int32 cell indices.
+
+        Raises
+        ------
+        KeyError
+            If no cell set or zone with the name exists.
+        """
+        if name not in self._cells:
+            set_path = self._mesh_path / 'sets' / name
+            if _is_cell_set(set_path):
+                self._cells[name] = parse_foam_set(set_path, 'cellSet')
+            elif name in self._get_zones():
+                self._cells[name] = self._get_zones()[name]
+            else:
+                raise KeyError(f'Cell set or zone "{name}" not found in: {self._mesh_path}')
+
+        return self._cells[name]
+
+    def mask(self,
+             name: str,
+             n_cells: int) -> np.ndarray:
+        """
+        Returns a boolean mask selecting the cells of a set or zone.
+
+        Parameters
+        ----------
+        name : str
+            The set or zone name.
+        n_cells : int
+            The number of cells of the mesh.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array of length `n_cells`, True for the set members.
+
+        Raises
+        ------
+        ValueError
+            If the set contains cell indices outside of the mesh.
+        """
+        mask = self._masks.get(name)
+        if mask is None or mask.shape[0] != n_cells:
+            cells = self[name]
+            if cells.size and cells.max() >= n_cells:
+                raise ValueError(
+                    f'Cell set "{name}" does not fit a mesh with {n_cells} cells')
+            mask = np.zeros(n_cells, dtype=bool)
+            mask[cells] = True
+            self._masks[name] = mask
+
+        return mask
+
+    def _get_zones(self) -> dict[str, np.ndarray]:
+        """
+        Returns the cell zones, parsed on first call.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            A dictionary mapping zone names to int32 cell indices.
+        """
+        if self._zones is None:
+            zones_path = self._mesh_path / 'cellZones'
+            self._zones = parse_foam_zones(zones_path) if zones_path.exists() else {}
+
+        return self._zones
+
+
+class CoordinateStore:
+    """
+    A per case store of the cell centre coordinates shared by the fields.
+
+    Each distinct set of coordinates is stored once as 'x', 'y', 'z' columns
+    under a content hash key. Fields on the same cells, e.g. several CSV
+    exports of one mesh, get the same key and reference the same arrays. The
+    spatial index of each set is built on first use, as are the interpolation
+    weights of each set of sample points, which are shared by all fields and
+    time steps on the same coordinates.
+    """
+
+    def __init__(self) -> None:
+        # Coordinate columns and spatial indices by content key
+        self._coordinates = {}
+        self._indices = {}
+        # Interpolation weights by content key, sample points, method and neighbours
+        self._weights = {}
+        # Content key of each loaded coordinate source
+        self._sources = {}
+
+    def __getitem__(self,
+                    key: str) -> dict[str, np.ndarray]:
+        """Returns the 'x', 'y', 'z' columns stored under a key."""
+        return self._coordinates[key]
+
+    def __len__(self) -> int:
+        """Returns the number of distinct coordinate sets."""
+        return len(self._coordinates)
+
+    def intern(self,
+               columns: dict[str, np.ndarray]) -> tuple[str, dict[str, np.ndarray]]:
+        """
+        Stores coordinate columns, or finds the stored copy of identical ones.
+
+        Parameters
+        ----------
+        columns : dict[str, np.ndarray]
+            The 'x', 'y' and 'z' columns.
+
+        Returns
+        -------
+        tuple[str, dict[str, np.ndarray]]
+            The content key and the stored contiguous columns. The columns
+            are shared by every field on the same cells and read-only, so a
+            DataFrame holding them copies a column before writing to it.
+        """
+        digest = hashlib.blake2b()
+        for axis in ('x', 'y', 'z'):
+            column = np.ascontiguousarray(columns[axis])
+            digest.update(column.dtype.str.encode())
+            digest.update(column)
+        key = digest.hexdigest()
+        if key not in self._coordinates:
+            self._coordinates[key] = {axis: np.ascontiguousarray(columns[axis])
+                                      for axis in ('x', 'y', 'z')}
+            for column in self._coordinates[key].values():
+                column.flags.writeable = False
+
+        return key, self._coordinates[key]
+
+    def load(self,
+             source: str,
+             loader: Callable[[], np.ndarray],
+             dtype: np.dtype = np.float64) -> tuple[str, dict[str, np.ndarray]]:
+        """
+        Returns the coordinates of a source, loading them only once.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source, e.g. the path of a 'C' file.
+        loader : Callable[[], np.ndarray]
+            Returns the cell centres of the source, of shape (N, 3).
+        dtype : np.dtype, optional
+            The storage dtype of the columns. Default is np.float64.
+
+        Returns
+        -------
+        tuple[str, dict[str, np.ndarray]]
+            The content key and the stored columns.
+        """
+        source_key = (source, np.dtype(dtype).str)
+        if source_key not in self._sources:
+            centres = loader()
+            self._sources[source_key], _ = self.intern(
+                {axis: np.ascontiguousarray(centres[:, idx], dtype=dtype)
+                 for idx, axis in enumerate(('x', 'y', 'z'))})
+        key = self._sources[source_key]
+
+        return key, self._coordinates[key]
+
+    def spatial_index(self,
+                      key: str) -> SpatialIndex:
+        """
+        Returns the spatial index of a coordinate set, building it on first use.
+
+        Parameters
+        ----------
+        key : str
+            The content key of the coordinates.
+
+        Returns
+        -------
+        SpatialIndex
+            The index of the points.
+        """
+        if key not in self._indices:
+            columns = self._coordinates[key]
+            self._indices[key] = SpatialIndex(
+                np.column_stack([columns[axis] for axis in ('x', 'y', 'z')]))
+
+        return self._indices[key]
+
+    def interpolation_weights(self,
+                              key: str,
+                              points: np.ndarray,
+                              method: str = 'linear',
+                              k: int | None = None) -> InterpolationWeights:
+        """
+        Returns the interpolation weights of sample points, computing them on first use.
+
+        Parameters
+        ----------
+        key : str
+            The content key of the source coordinates.
+        points : np.ndarray
+            The sample points, of shape (M, 3).
+        method : str, optional
+            The interpolation method, see `InterpolationWeights.compute`.
+            Default is 'linear'.
+        k : int, optional
+            The number of neighbours, None for the method default.
+            Default is None.
+
+        Returns
+        -------
+        InterpolationWeights
+            The weights of the sample points.
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64)
+        weights_key = (key, hashlib.blake2b(points).hexdigest(), points.shape, method, k)
+        if weights_key not in self._weights:
+            self._weights[weights_key] = InterpolationWeights.compute(
+                self.spatial_index(key), points, method, k)
+
+        return self._weights[weights_key]
+
+
+def _is_cell_set(path: Path) -> bool:
+    """
+    Checks whether a file is a topoSet file of the 'cellSet' class.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the set file.
+
+    Returns
+    -------
+    bool
+        True if the file exists and its header class is 'cellSet', False
+        otherwise.
+    """
+    return path.is_file() and is_foam_file(path) and parse_foam_header(path).get('class') == 'cellSet'
+
+
+def _read_foam_field(case_path: Path,
+                     file_path: str,
+                     n_cells: int | None,
+                     decomposed: bool) -> np.ndarray:
+    """
+    Reads a native field from the case or from its processor directories.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root path of the OpenFOAM case.
+    file_path : str
+        The path to the field file, relative to `case_path` (or to each
+        processor directory).
+    n_cells : int | None
+        The number of cells, required for uniform fields of reconstructed cases.
+    decomposed : bool
+        If True, the processor fields are assembled in global cell order.
+
+    Returns
+    -------
+    np.ndarray
+        The internal field values.
+    """
+    if decomposed:
+        return parse_decomposed_field(case_path, file_path)
+
+    return parse_foam_field(case_path / file_path, n_cells)
+
+
+def _astype_floats(frame: DataFrame,
+                   dtype: np.dtype) -> DataFrame:
+    """
+    Converts the floating point columns of a table to a storage dtype.
+
+    Parameters
+    ----------
+    frame : DataFrame
+        The table.
+    dtype : np.dtype
+        The storage dtype.
+
+    Returns
+    -------
+    DataFrame
+        The table itself if no column is converted, otherwise a new columnar
+        DataFrame sharing the unchanged columns.
+    """
+    converted = [name for name, column_dtype in frame.dtypes.items()
+                 if isinstance(column_dtype, np.dtype) and column_dtype.kind == 'f'
+                 and column_dtype != dtype]
+    if not converted:
+        return frame
+
+    return DataFrame(frame.header, {name: frame[name].astype(dtype) if name in converted
+                                    else frame[name] for name in frame.header})
+
+
+def _sum_by(index: np.ndarray,
+            values: np.ndarray,
+            size: int) -> np.ndarray:
+    """
+    Sums the rows of a (N, 3) array grouped by an index array.
+
+    Parameters
+    ----------
+    index : np.ndarray
+        The group of each row.
+    values : np.ndarray
+        The summed rows.
+    size : int
+        The number of groups.
+
+    Returns
+    -------
+    np.ndarray
+        The sums, of shape (size, 3).
+    """
+    return np.stack([np.bincount(index, values[:, i], minlength=size)
+                     for i in range(values.shape[1])], axis=1)
@@ -0,0 +1,331 @@
+from pathlib import Path
+import hashlib
+import shutil
+import tempfile
+import numpy as np
+
+from lutils.core.data import FoamCase, FieldData
+from lutils.core.types import DataFrame, Categorical
+from lutils.core.sampling import InterpolationWeights
+
+
+class CaseMapping:
+    """
+    A field mapping between the cells of two cases, e.g. an immersed boundary
+    case and a body-fitted reference on a different mesh.
+
+    The fields of the source case are interpolated to the cell centres of the
+    target case by a sparse operator built from the spatial index of the
+    source cells, see `InterpolationWeights`. One operator is built per pair
+    of source and target coordinate sets and shared by all fields on them.
+    Target cells farther than one cell size from the source cells are
+    outside of the source mesh, their mapped values are NaN. Closer to the
+    source cells, 'linear', the weighted least squares fit, extrapolates,
+    and 'nearest' and 'idw' take the values of the closest source cells.
+
+    Parameters
+    ----------
+    source : FoamCase
+        The case whose fields are interpolated.
+    target : FoamCase
+        The case whose cell centres the fields are interpolated to.
+    method : str, optional
+        The interpolation method, 'nearest', 'idw' or 'linear'.
+        Default is 'linear'.
+    k : int, optional
+        The number of neighbours, None for the method default.
+        Default is None.
+    cache_dir : str, optional
+        If given, the operators are stored in this directory, relative to
+        the target case path, keyed by the content hashes of both sets of
+        coordinates, and loaded memory-mapped on later runs. Default is None.
+    """
+
+    def __init__(self,
+                 source: FoamCase,
+                 target: FoamCase,
+                 method: str = 'linear',
+                 k: int | None = None,
+                 cache_dir: str | None = None) -> None:
+        self._source = source
+        self._target = target
+        self._method = method
+        self._k = k
+        self._cache_dir = target.case_path / cache_dir if cache_dir is not None else None
+        # Operators by source and target coordinate keys
+        self._operators = {}
+
+    @property
+    def source(self):
+        """FoamCase: The case whose fields are interpolated."""
+        return self._source
+
+    @property
+    def target(self):
+        """FoamCase: The case providing the target cell centres."""
+        return self._target
+
+    def operator(self,
+                 source_field: FieldData,
+                 target_field: FieldData) -> InterpolationWeights:
+        """
+        Returns the operator from the cells of one field to those of another.
+
+        Parameters
+        ----------
+        source_field : FieldData
+            A field of the source case.
+        target_field : FieldData
+            A field of the target case.
+
+        Returns
+        -------
+        InterpolationWeights
+            The operator, of one row per target cell.
+
+        Raises
+        ------
+        ValueError
+            If a field has no cell centre coordinates.
+        """
+        source_key = source_field.coordinate_key
+        target_key = target_field.coordinate_key
+        if (source_key, target_key) in self._operators:
+            return self._operators[(source_key, target_key)]
+
+        # Load the operator from the disk cache, or build and store it
+        entry = None
+        if self._cache_dir is not None:
+            name = f'{source_key}:{target_key}:{self._method}:{self._k}'
+            entry = self._cache_dir / hashlib.sha1(name.encode()).hexdigest()
+        if entry is not None and (entry / 'weights.npy').exists():
+            operator = InterpolationWeights.load(entry)
+        else:
+            columns = self._target.coordinates[target_key]
+            points = np.column_stack([columns[axis] for axis in ('x', 'y', 'z')])
+            operator = self._source.coordinates.interpolation_weights(
+                source_key, points, self._method, self._k)
+            if entry is not None:
+                _save_entry(entry, operator)
+        self._operators[(source_key, target_key)] = operator
+
+        return operator
+
+    def map_field(self,
+                  field_name: str) -> DataFrame:
+        """
+        Interpolates a source field to the target cells.
+
+        Parameters
+        ----------
+        field_name : str
+            The name of a field loaded in both cases.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the 'x', 'y', 'z' target cell centres followed
+            by the interpolated float64 columns of the source field.
+        """
+        source_field = self._source.fields[field_name]
+        target_field = self._target.fields[field_name]
+        operator = self.operator(source_field, target_field)
+
+        columns = _coordinates(target_field)
+        for name in _float_columns(source_field):
+            columns[name] = operator.apply(source_field.data[name])
+
+        return DataFrame(list(columns), columns)
+
+    def compare(self,
+                field_names: list[str] | None = None) -> tuple[dict[str, DataFrame], DataFrame]:
+        """
+        Computes the difference fields and error norms of the source case.
+
+        The columns of all fields on the same pair of meshes are stacked,
+        mapped by one operator application and differenced at once. The
+        norms are taken over the target cells inside of the source mesh,
+        weighted by the cell volumes if the target geometry is loaded,
+        otherwise uniformly:
+
+            L1 = sum(w |d|) / sum(w), L2 = sqrt(sum(w d^2) / sum(w)), Linf = max |d|
+
+        Parameters
+        ----------
+        field_names : list[str], optional
+            The fields to compare. If None, all fields loaded in both cases
+            are compared. Default is None.
+
+        Returns
+        -------
+        tuple[dict[str, DataFrame], DataFrame]
+            The difference fields (source minus target) by field name, with
+            the 'x', 'y', 'z' target cell centres and NaN outside of the
+            source mesh, and a DataFrame of the
+            norms with one row per compared column: 'column' (as
+            '<field>.<column>'), 'L1', 'L2' and 'Linf'.
+
+        Raises
+        ------
+        KeyError
+            If a field is not loaded in both cases.
+        """
+        if field_names is None:
+            field_names = [name for name in self._source.fields if name in self._target.fields]
+
+        # Group the compared columns by operator
+        groups = {}
+        for field_name in field_names:
+            source_field = self._source.fields[field_name]
+            target_field = self._target.fields[field_name]
+            target_columns = set(_float_columns(target_field))
+            names = [name for name in _float_columns(source_field) if name in target_columns]
+            key = (source_field.coordinate_key, target_field.coordinate_key)
+            if key not in groups:
+                groups[key] = (self.operator(source_field, target_field), [])
+            groups[key][1].append((field_name, source_field, target_field, names))
+
+        differences = {}
+        labels = []
+        norms = []
+        for operator, members in groups.values():
+            # Map and difference all columns of the group at once
+            source_values = np.column_stack([field.data[name] for _, field, _, names in members
+                                             for name in names])
+            target_values = np.column_stack([field.data[name] for _, _, field, names in members
+                                             for name in names])
+            difference = operator.apply(source_values) - target_values
+            weights = self._cell_weights(len(difference))
+            inside = ~operator.outside
+            norms.append(_norms(difference[inside], weights[inside] if weights is not None else None))
+
+            # Split into per field DataFrames
+            start = 0
+            for field_name, _, field, names in members:
+                columns = _coordinates(field)
+                for idx, name in enumerate(names):
+                    columns[name] = difference[:, start + idx]
+                    labels.append(f'{field_name}.{name}')
+                start += len(names)
+                differences[field_name] = DataFrame(list(columns), columns)
+
+        norms = np.concatenate(norms) if norms else np.empty((0, 3))
+        table = DataFrame(['column', 'L1', 'L2', 'Linf'],
+                          {'column': Categorical.from_values(np.array(labels, dtype=str)),
+                           'L1': norms[:, 0],
+                           'L2': norms[:, 1],
+                           'Linf': norms[:, 2]})
+
+        return differences, table
+
+    def _cell_weights(self,
+                      n_cells: int) -> np.ndarray | None:
+        """
+        Returns the target cell volumes if the target geometry has `n_cells` cells.
+
+        Parameters
+        ----------
+        n_cells : int
+            The number of target cells.
+
+        Returns
+        -------
+        np.ndarray or None
+            The cell volumes, or None for uniform weights.
+        """
+        geometry = self._target.geometry
+        if geometry is None or geometry.n_cells != n_cells:
+            return None
+
+        return geometry.cell_volumes
+
+
+def _float_columns(field: FieldData) -> list[str]:
+    """
+    Returns the names of the float columns of a field, except the coordinates.
+
+    Parameters
+    ----------
+    field : FieldData
+        The field.
+
+    Returns
+    -------
+    list[str]
+        The column names, in header order.
+    """
+    return [name for name, dtype in field.dtypes.items()
+            if name not in ('x', 'y', 'z') and isinstance(dtype, np.dtype) and dtype.kind == 'f']
+
+
+def _coordinates(field: FieldData) -> dict[str, np.ndarray]:
+    """
+    Returns the 'x', 'y', 'z' columns of a field.
+
+    Parameters
+    ----------
+    field : FieldData
+        The field.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The shared coordinate columns.
+    """
+    return {axis: field.data[axis] for axis in ('x', 'y', 'z')}
+
+
+def _norms(difference: np.ndarray,
+           weights: np.ndarray | None) -> np.ndarray:
+    """
+    Computes the L1, L2 and Linf norms of difference columns.
+
+    Parameters
+    ----------
+    difference : np.ndarray
+        The differences, of shape (M, C).
+    weights : np.ndarray or None
+        The cell weights, of shape (M,), None for uniform weights.
+
+    Returns
+    -------
+    np.ndarray
+        The norms, of shape (C, 3).
+    """
+    magnitude = np.abs(difference)
+    if weights is None:
+        weights = np.ones(len(difference))
+    weights = weights / weights.sum()
+
+    return np.column_stack([weights @ magnitude,
+                            np.sqrt(weights @ magnitude ** 2),
+                            magnitude.max(axis=0, initial=0.0)])
+
+
+def _save_entry(entry: Path,
+                operator: InterpolationWeights) -> None:
+    """
+    Saves an operator into a cache entry directory.
+
+    The operator is written into a temporary directory unique to the
+    writer, then renamed in place, so concurrent runs never load a partial
+    entry. If another run renamed its entry first, that entry is kept.
+
+    Parameters
+    ----------
+    entry : Path
+        The entry directory.
+    operator : InterpolationWeights
+        The operator.
+    """
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f'{entry.name}.', suffix='.tmp', dir=entry.parent))
+    try:
+        operator.save(tmp)
+        tmp.rename(entry)
+    except OSError:
+        # Lost the race against a complete entry of another run
+        if not (entry / 'weights.npy').exists():
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,299 @@
+from pathlib import Path
+import numpy as np
+
+from lutils.core.data import FoamCase
+from lutils.core.types import DataFrame, Categorical
+from lutils.core.bodies import Body
+from lutils.utils.sub_logger import DsLog, DsHistogramLog, DS_DTYPE, DS_HISTOGRAM_DTYPE
+
+
+# Cell regions, by region code
+_REGIONS = ('fluid', 'interface', 'solid')
+
+
+def expected_lambda(distances: np.ndarray,
+                    cell_size: float | np.ndarray,
+                    interface_span: float = 1.0) -> np.ndarray:
+    """
+    Computes the signed distance based lambda of an immersed body.
+
+    The solid fraction follows the smoothed Heaviside profile of the
+    signed distance based lambda of HFDIB-DEM:
+
+        lambda = 0.5 * (1 + tanh(sd / (interface_span * cell_size)))
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The signed distances, positive inside the body.
+    cell_size : float or np.ndarray
+        The cell size, e.g. the cube root of the cell volume, scalar or per
+        cell.
+    interface_span : float, optional
+        The interface width in cell sizes, the 'interfaceSpan' of the
+        HFDIBDEMDict. Default is 1.0.
+
+    Returns
+    -------
+    np.ndarray
+        The expected lambda, in [0, 1].
+    """
+    return 0.5 * (1.0 + np.tanh(distances / (interface_span * cell_size)))
+
+
+class LambdaMetrics:
+    """
+    Accuracy metrics of a lambda field against the body it represents.
+
+    The signed distance of every cell centre to the body gives its expected
+    lambda, see `expected_lambda`, and the error is the field minus the
+    expected value. The cells are split into the 'interface' region, where
+    the field or the expected value lies within (threshold, 1 - threshold),
+    and the 'fluid' and 'solid' regions by the sign of the distance. All
+    metrics are computed over whole arrays, the regions are reduced with
+    `np.bincount`, so millions of cells are handled without Python loops.
+
+    Bodies with a clipped distance, such as `TriSurface`, need a band that
+    covers the interface, i.e. at least atanh(1 - 2 * threshold) (about 5)
+    interface widths.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The cell centres, of shape (M, 3).
+    values : np.ndarray
+        The lambda field, of shape (M,).
+    body : Body
+        The body geometry.
+    cell_size : float or np.ndarray
+        The cell size, scalar or of shape (M,).
+    interface_span : float, optional
+        The interface width in cell sizes. Default is 1.0.
+    threshold : float, optional
+        The lambda threshold of the interface region, the 'surfaceThreshold'
+        of the HFDIBDEMDict. Default is 1e-4.
+    weights : np.ndarray, optional
+        The cell weights of the norms, e.g. the cell volumes, None for
+        uniform weights. Default is None.
+    """
+
+    def __init__(self,
+                 points: np.ndarray,
+                 values: np.ndarray,
+                 body: Body,
+                 cell_size: float | np.ndarray,
+                 interface_span: float = 1.0,
+                 threshold: float = 1e-4,
+                 weights: np.ndarray | None = None) -> None:
+        self._body = body
+        self._values = np.asarray(values, dtype=np.float64)
+        self._distances = body.signed_distance(points)
+        self._expected = expected_lambda(self._distances, cell_size, interface_span)
+        self._error = self._values - self._expected
+        self._weights = np.ones(len(self._values)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+        # Interface cells of either field, the others by the sign of the distance
+        interface = ((self._values > threshold) & (self._values < 1 - threshold)) \
+            | ((self._expected > threshold) & (self._expected < 1 - threshold))
+        self._regions = np.where(interface, 1, np.where(self._distances > 0, 2, 0)).astype(np.int8)
+
+    @classmethod
+    def from_case(cls,
+                  case: FoamCase,
+                  field_name: str,
+                  body: Body,
+                  cell_size: float | np.ndarray | None = None,
+                  interface_span: float = 1.0,
+                  threshold: float = 1e-4) -> 'LambdaMetrics':
+        """
+        Creates the metrics of a lambda field loaded in a case.
+
+        If the case geometry is loaded, the norms are weighted by the cell
+        volumes.
+
+        Parameters
+        ----------
+        case : FoamCase
+            The case.
+        field_name : str
+            The name of the lambda field, e.g. added from '2000/lambda'.
+        body : Body
+            The body geometry.
+        cell_size : float or np.ndarray, optional
+            The cell size. If None, the cube root of the cell volumes of the
+            case geometry is used. Default is None.
+        interface_span : float, optional
+            The interface width in cell sizes. Default is 1.0.
+        threshold : float, optional
+            The lambda threshold of the interface region. Default is 1e-4.
+
+        Returns
+        -------
+        LambdaMetrics
+            The metrics of the field.
+
+        Raises
+        ------
+        ValueError
+            If the field has no cell centres, or if `cell_size` is None and
+            the case geometry is not loaded.
+        """
+        field = case.fields[field_name]
+        if 'x' not in field.data.header:
+            raise ValueError(f'Field "{field_name}" has no cell centre coordinates')
+        points = np.column_stack([field.data[axis] for axis in ('x', 'y', 'z')])
+
+        geometry = case.geometry
+        weights = None
+        if geometry is not None and geometry.n_cells == len(points):
+            weights = geometry.cell_volumes
+        if cell_size is None:
+            if weights is None:
+                raise ValueError(f'No cell size given and no geometry loaded for case "{case.label}"')
+            cell_size = np.cbrt(weights)
+
+        return cls(points, field.data[field_name], body, cell_size, interface_span, threshold, weights)
+
+    @property
+    def body(self):
+        """Body: The body geometry."""
+        return self._body
+
+    @property
+    def values(self):
+        """np.ndarray: The lambda field."""
+        return self._values
+
+    @property
+    def signed_distance(self):
+        """np.ndarray: The signed distances of the cell centres, positive inside the body."""
+        return self._distances
+
+    @property
+    def expected(self):
+        """np.ndarray: The expected lambda."""
+        return self._expected
+
+    @property
+    def error(self):
+        """np.ndarray: The lambda field minus the expected lambda."""
+        return self._error
+
+    @property
+    def regions(self):
+        """np.ndarray: The region code of each cell, indexing ('fluid', 'interface', 'solid')."""
+        return self._regions
+
+    def histogram(self,
+                  bins: int = 50) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the error histograms of all cells and of each region.
+
+        Parameters
+        ----------
+        bins : int, optional
+            The number of equal bins on [-1, 1]. Default is 50.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The bin edges, of shape (bins + 1,), and the cell counts, of
+            shape (4, bins), for all cells followed by the 'fluid',
+            'interface' and 'solid' regions.
+        """
+        edges = np.linspace(-1.0, 1.0, bins + 1)
+        idx = np.clip(((self._error + 1.0) * (bins / 2)).astype(np.int64), 0, bins - 1)
+        counts = np.bincount(self._regions.astype(np.int64) * bins + idx,
+                             minlength=len(_REGIONS) * bins).reshape(len(_REGIONS), bins)
+
+        return edges, np.vstack([counts.sum(axis=0), counts])
+
+    def norms(self) -> DataFrame:
+        """
+        Computes the error norms of all cells and of each region.
+
+        The norms are weighted by the cell weights:
+
+            L1 = sum(w |e|) / sum(w), L2 = sqrt(sum(w e^2) / sum(w)), Linf = max |e|
+
+        'bias' is the weighted mean error and 'misclassified' the weighted
+        fraction of cells whose lambda >= 0.5 disagrees with the sign of the
+        distance.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with one row per region, 'all', 'fluid', 'interface'
+            and 'solid', and the columns 'region', 'cells', 'L1', 'L2',
+            'Linf', 'bias' and 'misclassified'.
+        """
+        n_regions = len(_REGIONS)
+        magnitude = np.abs(self._error)
+        misclassified = (self._values >= 0.5) != (self._distances > 0)
+
+        # Weighted sums of each region, followed by the totals
+        sums = np.array([np.bincount(self._regions, weights=weights, minlength=n_regions)
+                         for weights in (np.ones(len(magnitude)),
+                                         self._weights,
+                                         self._weights * magnitude,
+                                         self._weights * magnitude ** 2,
+                                         self._weights * self._error,
+                                         self._weights * misclassified)])
+        sums = np.column_stack([sums.sum(axis=1), sums])
+        linf = np.zeros(n_regions)
+        np.maximum.at(linf, self._regions, magnitude)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            total = sums[1]
+            return DataFrame(['region', 'cells', 'L1', 'L2', 'Linf', 'bias', 'misclassified'],
+                             {'region': Categorical.from_values(np.array(('all',) + _REGIONS)),
+                              'cells': sums[0].astype(np.int64),
+                              'L1': sums[2] / total,
+                              'L2': np.sqrt(sums[3] / total),
+                              'Linf': np.concatenate([[linf.max(initial=0.0)], linf]),
+                              'bias': sums[4] / total,
+                              'misclassified': sums[5] / total})
+
+    def write(self,
+              case_path: Path,
+              log_dir: str = 'logs/',
+              bins: int = 50,
+              prefix: str = 'lambda') -> None:
+        """
+        Writes the norms and the error histograms to the case logs.
+
+        The norms are written to '<prefix>Norms.dat' by a `DsLog` and the
+        histograms to '<prefix>Histogram.dat' by a `DsHistogramLog`.
+
+        Parameters
+        ----------
+        case_path : Path
+            The path to the case directory.
+        log_dir : str, optional
+            The log directory, relative to `case_path`. Default is 'logs/'.
+        bins : int, optional
+            The number of histogram bins. Default is 50.
+        prefix : str, optional
+            The prefix of the log file names. Default is 'lambda'.
+        """
+        case_path = Path(case_path)
+        header = f'Body: {type(self._body).__name__}, cells: {len(self._values)}'
+
+        norms = self.norms()
+        norms_log = DsLog(case_path, log_dir)
+        batch = np.empty(len(norms['cells']), dtype=DS_DTYPE)
+        batch['region'] = np.asarray(norms['region'])
+        for name in batch.dtype.names[1:]:
+            batch[name] = norms[name]
+        norms_log.add_batch(batch)
+        norms_log.write(f'{prefix}Norms.dat', header)
+
+        edges, counts = self.histogram(bins)
+        histogram_log = DsHistogramLog(case_path, log_dir)
+        batch = np.empty(bins, dtype=DS_HISTOGRAM_DTYPE)
+        batch['lower'] = edges[:-1]
+        batch['upper'] = edges[1:]
+        for idx, region in enumerate(('all',) + _REGIONS):
+            batch[region] = counts[idx]
+        histogram_log.add_batch(batch)
+        histogram_log.write(f'{prefix}Histogram.dat', header)
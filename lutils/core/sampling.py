@@ -0,0 +1,372 @@
+from pathlib import Path
+import numpy as np
+
+from lutils.core.spatial import SpatialIndex
+
+
+# Interpolation methods and their default number of neighbours
+_METHOD_NEIGHBOURS = {
+    'nearest': 1,
+    'idw': 8,
+    'linear': 8
+}
+# Exponent of the inverse distance weights
+_IDW_POWER = 2
+# Relative cutoff of the singular values of the linear fits
+_RCOND = 1e-8
+# Number of neighbours spanning the estimated cell size, the faces of a hexahedron
+_CELL_NEIGHBOURS = 6
+
+
+class InterpolationWeights:
+    """
+    A sparse interpolation operator from source points to sample points.
+
+    The operator is stored in ELLPACK form: every sample point has the same
+    number of source neighbours, given by an index and a weight array of
+    shape (M, K). Applying it to a field is a single gather and weighted sum,
+    so the weights are computed once and reused for every field and time
+    step on the same source points. Sample points outside of the source
+    points have NaN weights, so their interpolated values are NaN.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        The source point indices, of shape (M, K).
+    weights : np.ndarray
+        The weights of the source points, of shape (M, K). The weights of
+        each sample point sum to one, or are NaN for points outside.
+    """
+
+    def __init__(self,
+                 indices: np.ndarray,
+                 weights: np.ndarray) -> None:
+        self._indices = indices
+        self._weights = weights
+
+    @classmethod
+    def compute(cls,
+                index: SpatialIndex,
+                points: np.ndarray,
+                method: str = 'linear',
+                k: int | None = None,
+                cell_size: float | np.ndarray | None = None) -> 'InterpolationWeights':
+        """
+        Computes the interpolation weights of sample points.
+
+        Sample points farther than one cell size from their nearest source
+        point lie outside of the source cells, e.g. inside a step or past an
+        outlet. They get NaN weights instead of extrapolated values. Without
+        `cell_size`, the size of a cell is estimated as the distance from its
+        point to the farthest of its 6 nearest source points, which follows
+        the smaller cell dimensions of strongly stretched cells.
+
+        Methods
+        -------
+        - **nearest**: the value of the nearest source point.
+        - **idw**: inverse distance weighting of the `k` nearest points.
+        - **linear**: a weighted least squares linear fit of the `k` nearest
+          points. Like barycentric interpolation it reproduces linear fields
+          exactly, without requiring a tetrahedralization of the points.
+          Directions without spread (e.g. of 2D meshes) are left out.
+
+        Parameters
+        ----------
+        index : SpatialIndex
+            The spatial index of the source points.
+        points : np.ndarray
+            The sample points, of shape (M, 3).
+        method : str, optional
+            The interpolation method, 'nearest', 'idw' or 'linear'.
+            Default is 'linear'.
+        k : int, optional
+            The number of neighbours. If None, the method default is used
+            (1 for 'nearest', 8 otherwise). Default is None.
+        cell_size : float or np.ndarray, optional
+            The cell size of the source points, scalar or of shape (N,), e.g.
+            the cube root of the cell volumes. If None, it is estimated from
+            the source points. Default is None.
+
+        Returns
+        -------
+        InterpolationWeights
+            The weights of the sample points.
+
+        Raises
+        ------
+        ValueError
+            If the method is not supported.
+        """
+        if method not in _METHOD_NEIGHBOURS:
+            raise ValueError(f'Unsupported interpolation method: "{method}"')
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        if method == 'nearest':
+            k = 1
+        elif k is None:
+            k = _METHOD_NEIGHBOURS[method]
+
+        indices, distances = index.k_nearest(points, k)
+        if method == 'nearest':
+            weights = np.ones(indices.shape)
+        elif method == 'idw':
+            weights = _idw_weights(distances)
+        else:
+            weights = _linear_weights(index.points[indices] - points[:, None, :], distances)
+
+        # Sample points beyond one cell size of the nearest source point are outside
+        if cell_size is None:
+            cell_size = _cell_sizes(index, indices[:, 0])
+        elif np.ndim(cell_size):
+            cell_size = np.asarray(cell_size, dtype=np.float64)[indices[:, 0]]
+        weights[distances[:, 0] > cell_size] = np.nan
+
+        return cls(indices, weights)
+
+    @classmethod
+    def load(cls,
+             directory: Path) -> 'InterpolationWeights':
+        """
+        Loads weights saved by `save`, as memory-mapped arrays (copy-on-write).
+
+        Parameters
+        ----------
+        directory : Path
+            The directory of the saved weights.
+
+        Returns
+        -------
+        InterpolationWeights
+            The loaded weights.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the directory does not contain saved weights.
+        """
+        directory = Path(directory)
+        if not (directory / 'weights.npy').exists():
+            raise FileNotFoundError(f'No interpolation weights found in: {directory}')
+
+        return cls(np.load(directory / 'indices.npy', mmap_mode='c'),
+                   np.load(directory / 'weights.npy', mmap_mode='c'))
+
+    def save(self,
+             directory: Path) -> None:
+        """
+        Saves the index and weight arrays as '.npy' files.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory, created if it does not exist.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / 'indices.npy', np.ascontiguousarray(self._indices))
+        np.save(directory / 'weights.npy', np.ascontiguousarray(self._weights))
+
+    @property
+    def indices(self):
+        """np.ndarray: The source point indices, of shape (M, K)."""
+        return self._indices
+
+    @property
+    def weights(self):
+        """np.ndarray: The source point weights, of shape (M, K)."""
+        return self._weights
+
+    @property
+    def outside(self):
+        """np.ndarray: True for the sample points outside of the source points, of shape (M,)."""
+        return np.isnan(self._weights).any(axis=1)
+
+    def apply(self,
+              values: np.ndarray) -> np.ndarray:
+        """
+        Interpolates source values to the sample points.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The source values, of shape (N,) or (N, C) to interpolate C
+            columns at once.
+
+        Returns
+        -------
+        np.ndarray
+            The float64 sampled values, of shape (M,) or (M, C), NaN at the
+            sample points outside of the source points.
+        """
+        gathered = np.asarray(values)[self._indices]
+        if gathered.ndim == 2:
+            return np.einsum('mk,mk->m', self._weights, gathered)
+
+        return np.einsum('mk,mkc->mc', self._weights, gathered)
+
+    def __len__(self) -> int:
+        """Returns the number of sample points."""
+        return len(self._indices)
+
+
+def line_points(start: np.ndarray,
+                end: np.ndarray,
+                n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns evenly spaced points on a line segment.
+
+    Parameters
+    ----------
+    start : np.ndarray
+        The first point, of shape (3,).
+    end : np.ndarray
+        The last point, of shape (3,).
+    n : int
+        The number of points.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The points, of shape (n, 3), and their distance from `start`.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    fraction = np.linspace(0, 1, n)
+
+    return start + fraction[:, None] * (end - start), fraction * np.linalg.norm(end - start)
+
+
+def plane_points(origin: np.ndarray,
+                 normal: np.ndarray,
+                 extent: float | tuple[float, float],
+                 n: int | tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a regular grid of points on a rectangle of a plane.
+
+    The in-plane axes u and v are orthonormal to `normal`, with u in the
+    plane spanned by `normal` and the coordinate axis least aligned with it.
+
+    Parameters
+    ----------
+    origin : np.ndarray
+        The centre of the rectangle, of shape (3,).
+    normal : np.ndarray
+        The plane normal, of shape (3,), not necessarily normalized.
+    extent : float or tuple[float, float]
+        The size of the rectangle along u and v.
+    n : int or tuple[int, int]
+        The number of points along u and v.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The points, of shape (n_u * n_v, 3), and their (u, v) coordinates
+        relative to `origin`, of shape (n_u * n_v, 2).
+    """
+    origin = np.asarray(origin, dtype=np.float64)
+    normal = np.asarray(normal, dtype=np.float64)
+    normal = normal / np.linalg.norm(normal)
+    width, height = np.broadcast_to(np.asarray(extent, dtype=np.float64), (2,))
+    n_u, n_v = np.broadcast_to(np.asarray(n), (2,))
+
+    # In-plane basis from the least aligned coordinate axis
+    axis = np.zeros(3)
+    axis[np.argmin(np.abs(normal))] = 1.0
+    u = axis - normal @ axis * normal
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+
+    uu, vv = np.meshgrid(np.linspace(-width / 2, width / 2, n_u),
+                         np.linspace(-height / 2, height / 2, n_v), indexing='ij')
+    plane = np.column_stack([uu.ravel(), vv.ravel()])
+
+    return origin + plane[:, :1] * u + plane[:, 1:] * v, plane
+
+
+def _cell_sizes(index: SpatialIndex,
+                sources: np.ndarray) -> np.ndarray:
+    """
+    Estimates the cell sizes of source points from their neighbours.
+
+    Parameters
+    ----------
+    index : SpatialIndex
+        The spatial index of the source points.
+    sources : np.ndarray
+        The source point indices, of shape (M,).
+
+    Returns
+    -------
+    np.ndarray
+        The distance from each source point to the farthest of its 6 nearest
+        other source points, of shape (M,), infinite for a single point.
+    """
+    unique, inverse = np.unique(sources, return_inverse=True)
+    _, distances = index.k_nearest(index.points[unique], _CELL_NEIGHBOURS + 1)
+    sizes = distances[:, -1] if distances.shape[1] > 1 else np.full(len(unique), np.inf)
+
+    return sizes[inverse]
+
+
+def _idw_weights(distances: np.ndarray) -> np.ndarray:
+    """
+    Computes normalized inverse distance weights.
+
+    Sample points coinciding with a source point take its value.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The neighbour distances ordered by distance, of shape (M, K).
+
+    Returns
+    -------
+    np.ndarray
+        The weights, of shape (M, K).
+    """
+    exact = distances[:, 0] == 0
+    with np.errstate(divide='ignore'):
+        weights = 1.0 / distances ** _IDW_POWER
+    weights[exact] = 0.0
+    weights[exact, 0] = 1.0
+
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def _linear_weights(offsets: np.ndarray,
+                    distances: np.ndarray) -> np.ndarray:
+    """
+    Computes the weights of weighted least squares linear fits.
+
+    For each sample point the fit `a + b . (p - c)` is centred on the
+    weighted mean `c` of its neighbours, so the constant and the linear terms
+    decouple: neighbours without spread in a direction (e.g. in one plane of
+    a stretched mesh) drop that direction without biasing the constant, and
+    the weights always sum to one. The offsets are scaled by the neighbourhood
+    size to make the cutoff of rank deficient fits independent of the mesh
+    size.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        The neighbour positions relative to the sample points, of shape (M, K, 3).
+    distances : np.ndarray
+        The neighbour distances, of shape (M, K).
+
+    Returns
+    -------
+    np.ndarray
+        The weights, of shape (M, K).
+    """
+    scale = np.maximum(distances[:, -1:], np.finfo(np.float64).tiny)
+    fit_weights = 1.0 / ((distances / scale) ** 2 + 1e-2)
+    offsets = offsets / scale[..., None]
+    centre = np.einsum('mk,mkd->md', fit_weights, offsets) / fit_weights.sum(axis=1, keepdims=True)
+    design = np.concatenate([np.ones(distances.shape + (1,)), offsets - centre[:, None, :]], axis=2)
+
+    # Fit coefficients evaluated at the sample point, i.e. at -centre
+    weighted = np.swapaxes(design, 1, 2) * fit_weights[:, None, :]
+    normal = weighted @ design
+    evaluation = np.concatenate([np.ones((len(design), 1)), -centre], axis=1)
+    coefficients = np.einsum('mi,mij->mj', evaluation, np.linalg.pinv(normal, rcond=_RCOND, hermitian=True))
+
+    return np.einsum('mj,mjk->mk', coefficients, weighted)
@@ -0,0 +1,488 @@
+import numpy as np
+
+from lutils.core.types import RaggedArray
+
+
+# Column index of the axis names
+_AXES = {
+    'x': 0,
+    'y': 1,
+    'z': 2
+}
+# Mean number of points per grid bin
+_BIN_OCCUPANCY = 2.0
+# Number of query points processed at once
+_QUERY_BATCH = 1 << 14
+
+
+class SpatialIndex:
+    """
+    A spatial index over 3D points, e.g. cell centres, implemented in NumPy.
+
+    Two structures are built lazily on first use and reused by later queries:
+
+    - a sorted order of the points along each axis, answering slab queries
+      by binary search in O(log N + k),
+    - a uniform grid of bins holding about two points each, stored in CSR
+      form, answering nearest point and radius queries by visiting only the
+      bins around each query point.
+
+    Queries of many points are vectorized over the points.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The point coordinates, of shape (N, 3).
+    """
+
+    def __init__(self,
+                 points: np.ndarray) -> None:
+        self._points = np.ascontiguousarray(points, dtype=np.float64)
+        # Sorted order and sorted coordinates per axis
+        self._orders = {}
+        self._sorted = {}
+        # Grid origin, bin size, bins per axis and the points of each bin
+        self._grid = None
+
+    @property
+    def points(self):
+        """np.ndarray: The indexed points, of shape (N, 3)."""
+        return self._points
+
+    def slab(self,
+             axis: str | int,
+             value: float,
+             tol: float) -> np.ndarray:
+        """
+        Returns the points close to a plane normal to an axis.
+
+        Parameters
+        ----------
+        axis : str or int
+            The axis name ('x', 'y' or 'z') or index.
+        value : float
+            The coordinate of the plane along `axis`.
+        tol : float
+            The half-thickness of the slab.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the points with `value - tol < coordinate < value + tol`,
+            ordered by the coordinate.
+        """
+        return self.slabs(axis, [value], tol)[0]
+
+    def slabs(self,
+              axis: str | int,
+              values: np.ndarray,
+              tol: float) -> RaggedArray:
+        """
+        Returns the points close to several planes normal to an axis.
+
+        All slab faces are located with one vectorized binary search in the
+        sorted order of the axis, built on first use. A point may belong to
+        several overlapping slabs.
+
+        Parameters
+        ----------
+        axis : str or int
+            The axis name ('x', 'y' or 'z') or index.
+        values : np.ndarray
+            The coordinates of the planes along `axis`.
+        tol : float
+            The half-thickness of the slabs.
+
+        Returns
+        -------
+        RaggedArray
+            The indices of the points of each slab, ordered by the coordinate.
+        """
+        idx = _AXES[axis] if isinstance(axis, str) else axis
+        if idx not in self._orders:
+            order = np.argsort(self._points[:, idx], kind='stable')
+            self._orders[idx] = order
+            self._sorted[idx] = self._points[order, idx]
+
+        return sorted_ranges(self._sorted[idx], self._orders[idx], values, tol)
+
+    def nearest(self,
+                points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the nearest indexed point of each query point.
+
+        The bins are visited in cubic shells of growing radius around the bin
+        of each query point, until no unvisited bin can hold a closer point.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The query points, of shape (M, 3) or (3,).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The indices of the nearest points and their distances, of shape (M,).
+        """
+        queries = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        indices = np.full(len(queries), -1, dtype=np.int64)
+        distances = np.full(len(queries), np.inf)
+        if not len(self._points):
+            return indices, distances
+
+        for start in range(0, len(queries), _QUERY_BATCH):
+            batch = slice(start, start + _QUERY_BATCH)
+            indices[batch], distances[batch] = self._nearest_batch(queries[batch])
+
+        return indices, distances
+
+    def k_nearest(self,
+                  points: np.ndarray,
+                  k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the `k` nearest indexed points of each query point.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The query points, of shape (M, 3) or (3,).
+        k : int
+            The number of neighbours, at most the number of indexed points.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The indices and distances of the neighbours ordered by distance,
+            both of shape (M, k).
+        """
+        queries = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        k = min(k, len(self._points))
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf)
+        if not k:
+            return indices, distances
+
+        for start in range(0, len(queries), _QUERY_BATCH):
+            batch = slice(start, start + _QUERY_BATCH)
+            indices[batch], distances[batch] = self._k_nearest_batch(queries[batch], k)
+
+        return indices, distances
+
+    def radius(self,
+               points: np.ndarray,
+               radius: float) -> RaggedArray:
+        """
+        Finds the indexed points within a distance of each query point.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The query points, of shape (M, 3) or (3,).
+        radius : float
+            The search radius.
+
+        Returns
+        -------
+        RaggedArray
+            The indices of the points within `radius` of each query point, in
+            ascending order.
+        """
+        queries = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        if not len(self._points):
+            return RaggedArray.from_counts(np.zeros(len(queries), dtype=np.int64),
+                                           np.zeros(0, dtype=np.int64))
+
+        lo, size, dims, _ = self._get_grid()
+        reach = int(np.ceil(radius / size))
+        offsets = _cube_offsets(reach, dims)
+
+        counts, values = [], []
+        for start in range(0, len(queries), _QUERY_BATCH):
+            batch = queries[start:start + _QUERY_BATCH]
+            query_idx, point_idx = self._candidates(_bin_of(batch, lo, size, dims), offsets)
+            dist2 = ((batch[query_idx] - self._points[point_idx]) ** 2).sum(axis=1)
+            inside = dist2 <= radius ** 2
+
+            # Candidates are grouped by query, sort the indices of each group
+            order = np.lexsort((point_idx[inside], query_idx[inside]))
+            counts.append(np.bincount(query_idx[inside], minlength=len(batch)))
+            values.append(point_idx[inside][order])
+
+        return RaggedArray.from_counts(np.concatenate(counts), np.concatenate(values))
+
+    def _nearest_batch(self,
+                       queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the nearest points of a batch of query points, see `nearest`.
+        """
+        lo, size, dims, _ = self._get_grid()
+        home = _bin_of(queries, lo, size, dims)
+        best = np.full(len(queries), np.inf)
+        best_idx = np.full(len(queries), -1, dtype=np.int64)
+
+        active = np.arange(len(queries))
+        ring = 0
+        while active.size:
+            offsets = _cube_offsets(ring, dims, shell=True)
+            query_idx, point_idx = self._candidates(home[active], offsets)
+
+            # Closest candidate of each active query, candidates are grouped by query
+            if point_idx.size:
+                diff = queries[active[query_idx]] - self._points[point_idx]
+                dist2 = np.einsum('ij,ij->i', diff, diff)
+                starts = np.flatnonzero(np.r_[True, query_idx[1:] != query_idx[:-1]])
+                group_min = np.minimum.reduceat(dist2, starts)
+                closest = np.flatnonzero(dist2 == np.repeat(group_min, np.diff(np.r_[starts, len(dist2)])))
+                closest = closest[np.r_[True, query_idx[closest[1:]] != query_idx[closest[:-1]]]]
+                target = active[query_idx[closest]]
+                closer = dist2[closest] < best[target]
+                best[target[closer]] = dist2[closest][closer]
+                best_idx[target[closer]] = point_idx[closest][closer]
+
+            # Stop when no unvisited bin can hold a closer point
+            bound = _search_bound(queries[active], home[active], ring, lo, size, dims)
+            done = (best[active] <= bound ** 2) | (ring >= dims.max())
+            active = active[~done]
+            ring += 1
+
+        return best_idx, np.sqrt(best)
+
+    def _k_nearest_batch(self,
+                         queries: np.ndarray,
+                         k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the `k` nearest points of a batch of query points, see `k_nearest`.
+        """
+        lo, size, dims, _ = self._get_grid()
+        home = _bin_of(queries, lo, size, dims)
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        distances = np.empty((len(queries), k))
+
+        active = np.arange(len(queries))
+        ring = 1
+        while active.size:
+            # Candidates of the whole cube, padded into one row per query
+            query_idx, point_idx = self._candidates(home[active], _cube_offsets(ring, dims))
+            counts = np.bincount(query_idx, minlength=len(active))
+            column = np.arange(len(query_idx)) - np.repeat(np.cumsum(counts) - counts, counts)
+            dist2 = np.full((len(active), max(counts.max(initial=0), k)), np.inf)
+            points = np.zeros(dist2.shape, dtype=np.int64)
+            diff = queries[active[query_idx]] - self._points[point_idx]
+            dist2[query_idx, column] = np.einsum('ij,ij->i', diff, diff)
+            points[query_idx, column] = point_idx
+
+            # The k closest candidates of each query, ordered by distance
+            nearest = np.argpartition(dist2, k - 1, axis=1)[:, :k]
+            nearest = np.take_along_axis(
+                nearest, np.argsort(np.take_along_axis(dist2, nearest, axis=1), axis=1), axis=1)
+            best = np.take_along_axis(dist2, nearest, axis=1)
+
+            # Done when the k-th candidate is closer than any unvisited bin
+            bound = _search_bound(queries[active], home[active], ring, lo, size, dims)
+            done = (counts >= k) & ((best[:, -1] <= bound ** 2) | (ring >= dims.max()))
+            indices[active[done]] = np.take_along_axis(points, nearest, axis=1)[done]
+            distances[active[done]] = np.sqrt(best[done])
+            active = active[~done]
+            ring += 1
+
+        return indices, distances
+
+    def _get_grid(self) -> tuple[np.ndarray, float, np.ndarray, RaggedArray]:
+        """
+        Returns the uniform grid, building it on first use.
+
+        The bin size is chosen for `_BIN_OCCUPANCY` points per bin on
+        average, axes without extent (e.g. of 2D meshes) get a single bin.
+
+        Returns
+        -------
+        tuple[np.ndarray, float, np.ndarray, RaggedArray]
+            The grid origin, the bin size, the number of bins per axis and
+            the point indices of each bin in flat bin order.
+        """
+        if self._grid is not None:
+            return self._grid
+
+        lo = self._points.min(axis=0)
+        extent = self._points.max(axis=0) - lo
+        spread = extent > 0
+        if spread.any():
+            size = float((np.prod(extent[spread]) * _BIN_OCCUPANCY / len(self._points))
+                         ** (1 / spread.sum()))
+        else:
+            size = 1.0
+        dims = np.maximum(np.ceil(extent / size).astype(np.int64), 1)
+
+        # Sort the points by bin
+        flat = np.ravel_multi_index(_bin_of(self._points, lo, size, dims).T, dims)
+        counts = np.bincount(flat, minlength=int(np.prod(dims)))
+        order = np.argsort(flat, kind='stable')
+        self._grid = (lo, size, dims, RaggedArray.from_counts(counts, order))
+
+        return self._grid
+
+    def _candidates(self,
+                    home: np.ndarray,
+                    offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gathers the points of the bins at given offsets from the home bins.
+
+        Parameters
+        ----------
+        home : np.ndarray
+            The home bin of each query, of shape (M, 3).
+        offsets : np.ndarray
+            The visited bin offsets, of shape (S, 3).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The query index and the point index of each candidate, grouped
+            by query in ascending order.
+        """
+        _, _, dims, bins = self._grid
+        neighbours = home[:, None, :] + offsets[None, :, :]
+        valid = np.all((neighbours >= 0) & (neighbours < dims), axis=2)
+        query_idx, offset_idx = np.nonzero(valid)
+        flat = np.ravel_multi_index(neighbours[query_idx, offset_idx].T, dims)
+
+        # Expand the bins into their points
+        starts = bins.offsets[flat]
+        counts = bins.offsets[flat + 1] - starts
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        return np.repeat(query_idx, counts), bins.values[np.repeat(starts, counts) + local]
+
+
+def sorted_ranges(sorted_values: np.ndarray,
+                  order: np.ndarray,
+                  values: np.ndarray,
+                  tol: float) -> RaggedArray:
+    """
+    Selects the items within a tolerance of several values by binary search.
+
+    Parameters
+    ----------
+    sorted_values : np.ndarray
+        The item values in ascending order.
+    order : np.ndarray
+        The item index of each sorted value, e.g. from `np.argsort`.
+    values : np.ndarray
+        The target values.
+    tol : float
+        The tolerance, the ranges are open intervals of half-width `tol`.
+
+    Returns
+    -------
+    RaggedArray
+        The indices of the items with `value - tol < item < value + tol` for
+        each target value, in sorted order.
+    """
+    values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    starts = np.searchsorted(sorted_values, values - tol, side='right')
+    ends = np.maximum(np.searchsorted(sorted_values, values + tol, side='left'), starts)
+
+    # Concatenate the ranges of the sorted order
+    counts = ends - starts
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    return RaggedArray.from_counts(counts, order[np.repeat(starts, counts) + local])
+
+
+def _bin_of(points: np.ndarray,
+            lo: np.ndarray,
+            size: float,
+            dims: np.ndarray) -> np.ndarray:
+    """
+    Returns the grid bin of each point, clipped to the grid.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The points, of shape (M, 3).
+    lo : np.ndarray
+        The grid origin.
+    size : float
+        The bin size.
+    dims : np.ndarray
+        The number of bins per axis.
+
+    Returns
+    -------
+    np.ndarray
+        The integer bin coordinates, of shape (M, 3).
+    """
+    bins = np.floor((points - lo) / size).astype(np.int64)
+
+    return np.clip(bins, 0, dims - 1)
+
+
+def _cube_offsets(reach: int,
+                  dims: np.ndarray,
+                  shell: bool = False) -> np.ndarray:
+    """
+    Returns the bin offsets of a cube around a bin.
+
+    Offsets beyond the number of bins of an axis are left out.
+
+    Parameters
+    ----------
+    reach : int
+        The half-width of the cube in bins.
+    dims : np.ndarray
+        The number of bins per axis.
+    shell : bool, optional
+        If True, only the offsets on the surface of the cube are returned.
+        Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        The integer offsets, of shape (S, 3).
+    """
+    ranges = [np.arange(-min(reach, n - 1), min(reach, n - 1) + 1) for n in dims]
+    offsets = np.stack(np.meshgrid(*ranges, indexing='ij'), axis=-1).reshape(-1, 3)
+    if shell:
+        offsets = offsets[np.abs(offsets).max(axis=1) == reach]
+
+    return offsets
+
+
+def _search_bound(queries: np.ndarray,
+                  home: np.ndarray,
+                  ring: int,
+                  lo: np.ndarray,
+                  size: float,
+                  dims: np.ndarray) -> np.ndarray:
+    """
+    Returns a lower bound of the distance to any unvisited point.
+
+    The visited bins form a box around the home bin, every unvisited point
+    lies beyond one of its faces inside the grid.
+
+    Parameters
+    ----------
+    queries : np.ndarray
+        The query points, of shape (M, 3).
+    home : np.ndarray
+        The home bin of each query, of shape (M, 3).
+    ring : int
+        The radius of the visited box in bins.
+    lo : np.ndarray
+        The grid origin.
+    size : float
+        The bin size.
+    dims : np.ndarray
+        The number of bins per axis.
+
+    Returns
+    -------
+    np.ndarray
+        The distance bound of each query, infinite if all bins were visited.
+    """
+    low_bin = home - ring
+    high_bin = home + ring + 1
+    low = np.where(low_bin > 0, np.abs(queries - (lo + low_bin * size)), np.inf)
+    high = np.where(high_bin < dims, np.abs(queries - (lo + high_bin * size)), np.inf)
+
+    return np.minimum(low, high).min(axis=1)
@@ -0,0 +1,375 @@
+from pathlib import Path
+import numpy as np
+
+from lutils.core.data import FoamCase, GeometryData
+from lutils.core.types import RaggedArray
+from lutils.core.spatial import SpatialIndex
+from lutils.utils.sub_logger import InterpLog, INTERP_DTYPE
+
+
+# Number of point and cell pairs tested against the cell faces at once
+_FACE_BATCH = 1 << 18
+
+
+class StencilValidator:
+    """
+    A bulk consistency check of openHFDIBRANS interpolation stencils.
+
+    Every row of an interpolation info file describes the stencil of one
+    interface cell: the surface point `intPoints[0]`, the interpolation
+    points `intPoints[1:]` along the surface normal and the cells
+    `intCells` containing them. The stencils are checked as flat arrays over
+    the CSR packed lists, without iterating over rows:
+
+    - **order**: `order` equals the number of cells and the number of
+      points minus one.
+    - **sigma**: `sigma` equals the distance of the cell centre to the
+      surface point.
+    - **collinear**: the cell centre and the points lie on the normal line
+      through the surface point.
+    - **spacing**: the cell centre and the points follow each other
+      outwards along the normal.
+    - **yOrtho**: `yOrtho` lies between the surface and the first
+      interpolation point, if the file has a 'yOrtho' column (e.g. not the
+      surface stencils).
+    - **cells**: each point lies inside its claimed cell, by the face planes
+      of the mesh (exact for convex cells), or without a mesh, its claimed
+      cell centre is the nearest one.
+
+    Lengths are compared relative to the stencil length, the distance from
+    the surface point to the last point along the normal.
+
+    Parameters
+    ----------
+    columns : dict[str, np.ndarray | RaggedArray]
+        The parsed interpolation info columns, see `parse_interpolation_info`.
+    geometry : GeometryData, optional
+        The case mesh, for the cells check. Default is None.
+    centres : np.ndarray, optional
+        The cell centres, of shape (n_cells, 3), for the cells check without
+        a mesh. If None, the centres of `geometry` are used. If neither is
+        given, the cells check is skipped. Default is None.
+    tolerance : float, optional
+        The relative tolerance of the length comparisons. Default is 1e-5.
+    """
+
+    def __init__(self,
+                 columns: dict[str, np.ndarray | RaggedArray],
+                 geometry: GeometryData | None = None,
+                 centres: np.ndarray | None = None,
+                 tolerance: float = 1e-5) -> None:
+        self._columns = columns
+        self._geometry = geometry
+        if centres is None and geometry is not None:
+            centres = geometry.cell_centres
+        self._centres = centres
+        self._tolerance = tolerance
+        # Failing rows and stencil point positions by check, computed on first use
+        self._failures = None
+
+    @classmethod
+    def from_case(cls,
+                  case: FoamCase,
+                  label: str,
+                  centres: np.ndarray | None = None,
+                  tolerance: float = 1e-5) -> 'StencilValidator':
+        """
+        Creates the validator of an interpolation info file loaded in a case.
+
+        The cells check uses the case geometry if it is loaded.
+
+        Parameters
+        ----------
+        case : FoamCase
+            The case.
+        label : str
+            The label of the interpolation info, see `FoamCase.add_interpolation`.
+        centres : np.ndarray, optional
+            The cell centres, if the case geometry is not loaded. Default is None.
+        tolerance : float, optional
+            The relative tolerance of the length comparisons. Default is 1e-5.
+
+        Returns
+        -------
+        StencilValidator
+            The validator of the stencils.
+        """
+        return cls(case.interpolation[label].columns, case.geometry, centres, tolerance)
+
+    def validate(self) -> dict[str, np.ndarray]:
+        """
+        Runs all checks.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The sorted indices of the failing rows of each check, 'order',
+            'sigma', 'collinear', 'spacing', 'yOrtho' if the 'yOrtho' column
+            exists and, if cell centres are available, 'cells'.
+        """
+        if self._failures is None:
+            self._failures = self._run()
+
+        return {check: np.unique(rows) for check, (rows, _) in self._failures.items()}
+
+    def write(self,
+              case_path: Path,
+              log_dir: str = 'logs/',
+              file_name: str = 'interpolationCheck.dat') -> None:
+        """
+        Writes the failures to the case logs through an `InterpLog`.
+
+        Every failure is one entry of the check name, the row index, the
+        `cellI` of the row and the position of the failing point in the
+        stencil (-1 for checks of the whole row). The header counts the
+        failing rows of each check.
+
+        Parameters
+        ----------
+        case_path : Path
+            The path to the case directory.
+        log_dir : str, optional
+            The log directory, relative to `case_path`. Default is 'logs/'.
+        file_name : str, optional
+            The name of the log file. Default is 'interpolationCheck.dat'.
+        """
+        failures = self.validate()
+        cell_labels = self._columns['cellI']
+
+        log = InterpLog(Path(case_path), log_dir)
+        for check, (rows, points) in self._failures.items():
+            batch = np.empty(len(rows), dtype=INTERP_DTYPE)
+            batch['check'] = check
+            batch['row'] = rows
+            batch['cellI'] = cell_labels[rows]
+            batch['point'] = points
+            log.add_batch(batch)
+
+        counts = ', '.join(f'{check} {len(rows)}' for check, rows in failures.items())
+        log.write(file_name, f'Stencils: {len(cell_labels)}, failing rows: {counts}')
+
+    def _run(self) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Runs all checks over the flat stencil arrays.
+
+        Returns
+        -------
+        dict[str, tuple[np.ndarray, np.ndarray]]
+            The failing rows and stencil point positions of each check.
+        """
+        columns = self._columns
+        int_points = columns['intPoints']
+        int_cells = columns['intCells']
+        n_points = int_points.counts
+        n_cells = int_cells.counts
+        order = columns['order']
+        failures = {}
+
+        # Rows without a surface and an interpolation point are only checked for their order
+        failures['order'] = _rows((order != n_cells) | (n_points != order + 1))
+        valid = n_points >= 2
+        first = np.minimum(int_points.offsets[:-1], max(len(int_points.values) - 1, 0))
+
+        # Positions along and across the normal line through the surface point
+        normals = columns['surfNorm'] / np.linalg.norm(columns['surfNorm'], axis=1, keepdims=True)
+        surface = int_points.values[first]
+        row_of = int_points.row_index
+        position = np.arange(len(row_of)) - int_points.offsets[row_of]
+        along, across = _line_coordinates(int_points.values - surface[row_of], normals[row_of])
+        centre_along, centre_across = _line_coordinates(columns['cellCenter'] - surface, normals)
+
+        # Length scale of each stencil
+        length = np.zeros(len(order))
+        np.maximum.at(length, row_of, along)
+        tol = self._tolerance * length
+
+        distance = np.linalg.norm(columns['cellCenter'] - surface, axis=1)
+        failures['sigma'] = _rows(valid & (np.abs(distance - columns['sigma']) > tol))
+
+        bent = across > tol[row_of]
+        failures['collinear'] = _merge(_rows(valid & (centre_across > tol)),
+                                       (row_of[bent], position[bent]))
+
+        # Points follow each other outwards, the cell centre lies before the first point
+        step = np.zeros(len(along), dtype=bool)
+        later = position > 0
+        step[later] = along[later] - along[np.flatnonzero(later) - 1] <= tol[row_of[later]]
+        step &= valid[row_of]
+        first_along = np.where(valid, along[np.minimum(first + 1, max(len(along) - 1, 0))], 0.0)
+        centre = valid & ((centre_along < -tol) | (centre_along > first_along - tol))
+        failures['spacing'] = _merge(_rows(centre), (row_of[step], position[step]))
+
+        if 'yOrtho' in columns:
+            y_ortho = columns['yOrtho']
+            failures['yOrtho'] = _rows(valid & ((y_ortho <= 0) | (y_ortho > first_along + tol)))
+
+        if self._centres is not None:
+            failures['cells'] = self._check_cells(int_points, int_cells, position, row_of, tol)
+
+        return failures
+
+    def _check_cells(self,
+                     int_points: RaggedArray,
+                     int_cells: RaggedArray,
+                     position: np.ndarray,
+                     row_of: np.ndarray,
+                     tol: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Checks that the interpolation points lie inside their claimed cells.
+
+        Parameters
+        ----------
+        int_points : RaggedArray
+            The stencil points.
+        int_cells : RaggedArray
+            The claimed cells of the interpolation points.
+        position : np.ndarray
+            The position of each point in its stencil.
+        row_of : np.ndarray
+            The row of each point.
+        tol : np.ndarray
+            The length tolerance of each row.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The failing rows and stencil point positions.
+        """
+        # Pair interpolation point k with cell k - 1 of its row
+        paired = (position > 0) & (position <= int_cells.counts[row_of])
+        point_idx = np.flatnonzero(paired)
+        rows = row_of[point_idx]
+        cells = int_cells.values[int_cells.offsets[rows] + position[point_idx] - 1].astype(np.int64)
+        points = int_points.values[point_idx]
+
+        n_cells = len(self._centres)
+        inside = (cells >= 0) & (cells < n_cells)
+        known = np.flatnonzero(inside)
+        if self._geometry is not None:
+            inside[known] = _inside_cells(self._geometry, points[known], cells[known], tol[rows[known]])
+        else:
+            _, nearest = SpatialIndex(self._centres).nearest(points[known])
+            claimed = np.linalg.norm(points[known] - self._centres[cells[known]], axis=1)
+            inside[known] = claimed <= nearest + tol[rows[known]]
+
+        return rows[~inside], position[point_idx[~inside]]
+
+
+def _line_coordinates(offsets: np.ndarray,
+                      normals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits offsets into their components along and across unit normals.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        The offsets, of shape (M, 3).
+    normals : np.ndarray
+        The unit normals, of shape (M, 3).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The signed distance along and the distance across the normals.
+    """
+    along = np.einsum('ij,ij->i', offsets, normals)
+
+    return along, np.linalg.norm(offsets - along[:, None] * normals, axis=1)
+
+
+def _rows(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the failing rows of a row check, without stencil point positions.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        The failure mask of the rows.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The failing rows and -1 positions.
+    """
+    rows = np.flatnonzero(mask)
+
+    return rows, np.full(len(rows), -1, dtype=np.int64)
+
+
+def _merge(*failures: tuple[np.ndarray, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenates failures and sorts them by row and position.
+
+    Parameters
+    ----------
+    *failures : tuple[np.ndarray, np.ndarray]
+        The failing rows and positions of each part.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The merged rows and positions.
+    """
+    rows = np.concatenate([rows for rows, _ in failures]).astype(np.int64)
+    positions = np.concatenate([positions for _, positions in failures]).astype(np.int64)
+    order = np.lexsort((positions, rows))
+
+    return rows[order], positions[order]
+
+
+def _inside_cells(geometry: GeometryData,
+                  points: np.ndarray,
+                  cells: np.ndarray,
+                  tol: np.ndarray) -> np.ndarray:
+    """
+    Tests points against the face planes of their cells.
+
+    A point lies inside a convex cell if it lies behind all its faces, i.e.
+    the distance to each face plane along the outward face normal is not
+    positive.
+
+    Parameters
+    ----------
+    geometry : GeometryData
+        The case mesh.
+    points : np.ndarray
+        The points, of shape (P, 3).
+    cells : np.ndarray
+        The cell of each point, of shape (P,).
+    tol : np.ndarray
+        The distance tolerance of each point, of shape (P,).
+
+    Returns
+    -------
+    np.ndarray
+        True for the points inside their cells.
+    """
+    # Faces of each cell with their outward unit normals
+    n_internal = geometry.n_internal_faces
+    face_cells = np.concatenate([geometry.owner, geometry.neighbour]).astype(np.int64)
+    order = np.argsort(face_cells, kind='stable')
+    faces = RaggedArray.from_counts(np.bincount(face_cells, minlength=geometry.n_cells),
+                                    np.concatenate([np.arange(geometry.n_faces),
+                                                    np.arange(n_internal)])[order])
+    areas = geometry.face_areas
+    normals = areas / np.linalg.norm(areas, axis=1, keepdims=True)
+    signs = np.where(order < geometry.n_faces, 1.0, -1.0)
+
+    inside = np.ones(len(points), dtype=bool)
+    if not len(points):
+        return inside
+
+    for start in range(0, len(points), _FACE_BATCH):
+        batch = slice(start, start + _FACE_BATCH)
+        counts = faces.counts[cells[batch]]
+        pair = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(len(pair)) - np.repeat(np.cumsum(counts) - counts, counts)
+        entry = faces.offsets[cells[batch]][pair] + local
+        face = faces.values[entry]
+
+        distance = signs[entry] * np.einsum('ij,ij->i', points[batch][pair] - geometry.face_centres[face],
+                                            normals[face])
+        starts = np.cumsum(counts) - counts
+        inside[batch] = np.maximum.reduceat(distance, starts) <= tol[batch]
+
+    return inside
@@ -1,8 +1,371 @@
 from collections.abc import MutableMapping, Iterator
+from pathlib import Path
 import numpy as np
-import csv
+import gzip
+import json
 
 from lutils.utils.misc import is_list_str
+from lutils.utils.buffer import GrowableArray
+from lutils.utils.formatting import to_chars, string_chars, quote_strings, join_chars
+
+
+# Number of rows processed at once by the chunked column operations
+_CHUNK_ROWS = 1 << 20
+# Column reductions, the partial results of the chunks are reduced again
+_REDUCTIONS = {
+    'sum': np.sum,
+    'mean': np.sum,
+    'min': np.min,
+    'max': np.max
+}
+
+class Categorical:
+    """
+    A compact column of repeated string values.
+
+    The values are stored as small unsigned integer codes into an array of
+    unique categories, e.g. solver names in residual files.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        A 1D array of indices into `categories`.
+    categories : np.ndarray
+        A 1D array of the unique string values.
+    """
+
+    def __init__(self,
+                 codes: np.ndarray,
+                 categories: np.ndarray) -> None:
+        self._codes = codes
+        self._categories = categories
+
+    @classmethod
+    def from_values(cls,
+                    values: np.ndarray) -> 'Categorical':
+        """
+        Creates a Categorical from an array of string values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 1D array of strings.
+
+        Returns
+        -------
+        Categorical
+            The encoded column, using the smallest sufficient code dtype.
+        """
+        categories, codes = np.unique(values, return_inverse=True)
+        code_dtype = np.min_scalar_type(max(len(categories) - 1, 0))
+
+        return cls(codes.astype(code_dtype), categories)
+
+    @property
+    def codes(self):
+        """np.ndarray: The integer codes of the values."""
+        return self._codes
+
+    @property
+    def categories(self):
+        """np.ndarray: The unique string values."""
+        return self._categories
+
+    @property
+    def shape(self):
+        """tuple[int]: The shape of the column."""
+        return self._codes.shape
+
+    @property
+    def dtype(self):
+        """np.dtype: The dtype of the codes."""
+        return self._codes.dtype
+
+    def __getitem__(self,
+                    key):
+        """
+        Returns a single value for an integer key, otherwise a Categorical subset.
+        """
+        if isinstance(key, (int, np.integer)):
+            return self._categories[self._codes[key]]
+        return Categorical(self._codes[key], self._categories)
+
+    def __eq__(self,
+               other) -> np.ndarray:
+        """
+        Compares all values to a single string.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean mask of matching values.
+        """
+        match = np.flatnonzero(self._categories == other)
+        if match.size == 0:
+            return np.zeros(self._codes.shape, dtype=bool)
+        return self._codes == match[0]
+
+    def __array__(self,
+                  dtype=None,
+                  copy=None) -> np.ndarray:
+        """Returns the decoded string values."""
+        values = self._categories[self._codes]
+        return values if dtype is None else values.astype(dtype)
+
+    def __len__(self) -> int:
+        """Returns the number of values."""
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        """Returns the string representation of the Categorical."""
+        return f'Categorical({np.asarray(self)}, categories={self._categories})'
+
+
+class RaggedArray:
+    """
+    A column of variable-length lists stored in compressed sparse row form.
+
+    The lists are concatenated into a single `values` array, list `i` spans
+    `values[offsets[i]:offsets[i+1]]`.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        A 1D array of N+1 increasing start offsets into `values`.
+    values : np.ndarray
+        The concatenated list items, of shape (nnz,) or (nnz, n_components).
+    """
+
+    def __init__(self,
+                 offsets: np.ndarray,
+                 values: np.ndarray) -> None:
+        self._offsets = offsets
+        self._values = values
+
+    @classmethod
+    def from_counts(cls,
+                    counts: np.ndarray,
+                    values: np.ndarray) -> 'RaggedArray':
+        """
+        Creates a RaggedArray from the list lengths and the concatenated items.
+
+        Parameters
+        ----------
+        counts : np.ndarray
+            A 1D array of the list lengths.
+        values : np.ndarray
+            The concatenated list items.
+
+        Returns
+        -------
+        RaggedArray
+            The packed lists.
+        """
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return cls(offsets, values)
+
+    @property
+    def offsets(self):
+        """np.ndarray: The start offsets of the lists, of length N+1."""
+        return self._offsets
+
+    @property
+    def values(self):
+        """np.ndarray: The concatenated list items."""
+        return self._values
+
+    @property
+    def counts(self) -> np.ndarray:
+        """np.ndarray: The length of each list."""
+        return np.diff(self._offsets)
+
+    @property
+    def row_index(self) -> np.ndarray:
+        """np.ndarray: The list index of each item in `values`."""
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    def __getitem__(self,
+                    key):
+        """
+        Returns a single list for an integer key, otherwise a RaggedArray subset.
+        """
+        if isinstance(key, (int, np.integer)):
+            return self._values[self._offsets[key]:self._offsets[key + 1]]
+
+        # Gather the selected lists
+        rows = np.arange(len(self))[key]
+        counts = self.counts[rows]
+        starts = np.repeat(self._offsets[rows], counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        return RaggedArray.from_counts(counts, self._values[starts + local])
+
+    def __len__(self) -> int:
+        """Returns the number of lists."""
+        return len(self._offsets) - 1
+
+    def __repr__(self) -> str:
+        """Returns the string representation of the RaggedArray."""
+        return f'RaggedArray(lists={len(self)}, items={len(self._values)})'
+
+
+class Query:
+    """
+    A row selection condition evaluated on whole DataFrame columns.
+
+    Conditions are created with `isclose`, `between` and `isin` and combined
+    with `&` (and), `|` (or) and `~` (not). Evaluating a query produces one
+    boolean mask over all rows without iterating the rows in Python.
+
+    Parameters
+    ----------
+    op : str
+        The operation, one of 'isclose', 'between', 'isin', 'and', 'or', 'not'.
+    *args
+        The operands of the operation.
+    """
+
+    def __init__(self,
+                 op: str,
+                 *args) -> None:
+        self._op = op
+        self._args = args
+
+    @classmethod
+    def isclose(cls,
+                column: str,
+                value: float,
+                rtol: float = 1e-05,
+                atol: float = 1e-08) -> 'Query':
+        """
+        Selects rows where a column equals a value within a tolerance.
+
+        Parameters
+        ----------
+        column : str
+            The column name.
+        value : float
+            The target value.
+        rtol : float, optional
+            The relative tolerance, see `np.isclose`. Default is 1e-05.
+        atol : float, optional
+            The absolute tolerance, see `np.isclose`. Default is 1e-08.
+
+        Returns
+        -------
+        Query
+            The condition.
+        """
+        return cls('isclose', column, value, rtol, atol)
+
+    @classmethod
+    def between(cls,
+                column: str,
+                low: float | None = None,
+                high: float | None = None,
+                inclusive: bool = True) -> 'Query':
+        """
+        Selects rows where a column lies in a range.
+
+        Parameters
+        ----------
+        column : str
+            The column name.
+        low : float, optional
+            The lower bound, None for no bound. Default is None.
+        high : float, optional
+            The upper bound, None for no bound. Default is None.
+        inclusive : bool, optional
+            If True, the bounds are part of the range. Default is True.
+
+        Returns
+        -------
+        Query
+            The condition.
+        """
+        return cls('between', column, low, high, inclusive)
+
+    @classmethod
+    def isin(cls,
+             column: str,
+             values) -> 'Query':
+        """
+        Selects rows where a column value is one of the given values.
+
+        Parameters
+        ----------
+        column : str
+            The column name, numeric or categorical.
+        values : array_like
+            The accepted values.
+
+        Returns
+        -------
+        Query
+            The condition.
+        """
+        return cls('isin', column, values)
+
+    def mask(self,
+             frame: 'DataFrame') -> np.ndarray:
+        """
+        Evaluates the condition on a DataFrame.
+
+        Parameters
+        ----------
+        frame : DataFrame
+            The queried table.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array with one entry per row.
+        """
+        op, args = self._op, self._args
+        if op == 'and':
+            return args[0].mask(frame) & args[1].mask(frame)
+        elif op == 'or':
+            return args[0].mask(frame) | args[1].mask(frame)
+        elif op == 'not':
+            return ~args[0].mask(frame)
+
+        values = frame[args[0]]
+        if op == 'isclose':
+            return np.isclose(values, args[1], rtol=args[2], atol=args[3])
+        elif op == 'between':
+            low, high, inclusive = args[1:]
+            mask = np.ones(len(values), dtype=bool)
+            if low is not None:
+                mask &= values >= low if inclusive else values > low
+            if high is not None:
+                mask &= values <= high if inclusive else values < high
+            return mask
+        else:
+            return np.isin(np.asarray(values), np.asarray(args[1]))
+
+    def __and__(self,
+                other: 'Query') -> 'Query':
+        """Returns a query matching rows that match both queries."""
+        return Query('and', self, other)
+
+    def __or__(self,
+               other: 'Query') -> 'Query':
+        """Returns a query matching rows that match either query."""
+        return Query('or', self, other)
+
+    def __invert__(self) -> 'Query':
+        """Returns a query matching rows that do not match this query."""
+        return Query('not', self)
+
+    def __repr__(self) -> str:
+        """Returns the string representation of the Query."""
+        if self._op in ('and', 'or'):
+            return f'({self._args[0]!r} {self._op} {self._args[1]!r})'
+        elif self._op == 'not':
+            return f'not {self._args[0]!r}'
+        return f'{self._op}{self._args}'
 
 
 class DataFrame(MutableMapping):
@@ -13,25 +376,168 @@ class DataFrame(MutableMapping):
     supporting column access via string keys, row access via integer indices,
     and cell access via tuples.
 
+    The data is either stored as a single 2D block, or, if `data` is a
+    dictionary, as separate 1D columns with their own dtypes (e.g. float32,
+    float64, int, bool or Categorical). The columnar storage is used for
+    heterogeneous tables, such as residuals with solver names and convergence
+    flags. Columns are added, dropped and converted independently, without
+    copying the other columns.
+
+    Column projections and row slices are views sharing memory with the
+    parent DataFrame. Shared data is copied only when either DataFrame is
+    modified (copy-on-write).
+
+    Tables larger than the memory are built with `from_chunks`, which spills
+    the rows into raw column files and memory-maps them. Queries and
+    reductions process the rows in chunks, so their temporaries stay bounded.
+
     Parameters
     ----------
     header : list[str]
         A list of strings representing the column names.
-    data : np.ndarray
+    data : np.ndarray or dict[str, np.ndarray]
         A 2D NumPy array containing the table data. The shape must be
-        (rows, len(header)).
+        (rows, len(header)). Alternatively, a dictionary mapping each column
+        name to a 1D array (or Categorical) of equal length.
     """
 
     def __init__(self,
                  header: list[str],
-                 data: np.ndarray) -> None:
+                 data: np.ndarray | dict[str, np.ndarray]) -> None:
         self._header = header
-        self._data = data
         self._map = {name: idx for idx, name in enumerate(header)}
+        # Columns sharing memory with another DataFrame, copied before writing
+        self._shared = set()
+        # Growable column buffers, created by the first `append_rows`
+        self._buffers = {}
+        # Columnar storage
+        if isinstance(data, dict):
+            self._columns = {name: data[name] for name in header}
+            self._data = None
+            if len({len(column) for column in self._columns.values()}) > 1:
+                raise ValueError('All columns must have the same length')
+        # Block storage
+        else:
+            self._columns = None
+            self._data = data
+
+    @property
+    def is_columnar(self) -> bool:
+        """bool: True if the data is stored as separate columns."""
+        return self._columns is not None
+
+    @property
+    def header(self) -> list[str]:
+        """list[str]: The column names."""
+        return self._header
+
+    @property
+    def dtypes(self) -> dict[str, np.dtype | str]:
+        """dict[str, np.dtype | str]: The dtype of each column, 'category' for Categorical columns."""
+        if not self.is_columnar:
+            return {name: self._data.dtype for name in self._header}
+        return {name: 'category' if isinstance(column, Categorical) else column.dtype
+                for name, column in self._columns.items()}
+
+    def to_columnar(self) -> None:
+        """
+        Converts block storage into columnar storage.
+
+        Each column is copied once into its own contiguous array. Columnar
+        DataFrames are left unchanged.
+        """
+        if self.is_columnar:
+            return
+
+        self._columns = {name: np.ascontiguousarray(self._data[:, idx])
+                         for idx, name in enumerate(self._header)}
+        self._data = None
+        self._shared = set()
+
+    def add_column(self,
+                   name: str,
+                   values: np.ndarray | Categorical) -> None:
+        """
+        Appends a column, without copying the existing columns.
+
+        Block storage is converted to columnar storage first.
+
+        Parameters
+        ----------
+        name : str
+            The new column name.
+        values : np.ndarray or Categorical
+            A 1D array (or Categorical) with one value per row.
+
+        Raises
+        ------
+        KeyError
+            If a column with the name already exists.
+        ValueError
+            If the number of values does not match the number of rows.
+        """
+        if name in self._map:
+            raise KeyError(f'Column "{name}" already exists')
+        if not isinstance(values, Categorical):
+            values = np.ascontiguousarray(values)
+        if self._header and len(values) != self.shape()[0]:
+            raise ValueError(
+                f'Column "{name}" has {len(values)} values, expected {self.shape()[0]}')
+
+        self.to_columnar()
+        self._columns[name] = values
+        self._header = self._header + [name]
+        self._map[name] = len(self._header) - 1
+
+    def drop_column(self,
+                    name: str) -> None:
+        """
+        Removes a column, without copying the remaining columns.
+
+        Block storage is converted to columnar storage first.
+
+        Parameters
+        ----------
+        name : str
+            The name of the removed column.
+        """
+        self.to_columnar()
+        del self._columns[name]
+        self._shared.discard(name)
+        self._buffers.pop(name, None)
+        self._header = [col for col in self._header if col != name]
+        self._map = {col: idx for idx, col in enumerate(self._header)}
+
+    def astype(self,
+               name: str,
+               dtype: np.dtype | str) -> None:
+        """
+        Converts a single column to another dtype.
+
+        Block storage is converted to columnar storage first.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+        dtype : np.dtype or str
+            The new dtype (e.g. np.float32, np.int32, bool), or 'category'
+            to store the column as a Categorical.
+        """
+        self.to_columnar()
+        if self._buffers:
+            self.trim()
+        column = self._columns[name]
+        self._shared.discard(name)
+        if isinstance(dtype, str) and dtype == 'category':
+            if not isinstance(column, Categorical):
+                self._columns[name] = Categorical.from_values(column)
+        else:
+            self._columns[name] = np.asarray(column).astype(dtype)
 
     def filter_rows(self,
                     column: str,
-                    value: float) -> np.ndarray:
+                    value: float) -> 'DataFrame':
         """
         Selects rows where the specified column matches a value.
 
@@ -44,21 +550,248 @@ class DataFrame(MutableMapping):
         value : float
             The target value to compare against.
 
+        Returns
+        -------
+        DataFrame
+            A new DataFrame containing only the rows that match the criteria.
+        """
+        return self.query(Query.isclose(column, value))
+
+    def mask(self,
+             query: Query,
+             chunk_size: int = _CHUNK_ROWS) -> np.ndarray:
+        """
+        Evaluates a query in chunks of rows.
+
+        Parameters
+        ----------
+        query : Query
+            The condition.
+        chunk_size : int, optional
+            The number of rows evaluated at once. Default is 1048576.
+
         Returns
         -------
         np.ndarray
-            A new NumPy array containing only the rows that match the criteria.
+            A boolean array with one entry per row.
+        """
+        mask = np.empty(self.shape()[0], dtype=bool)
+        for start in range(0, len(mask), chunk_size):
+            rows = slice(start, start + chunk_size)
+            mask[rows] = query.mask(self._rows(rows))
+
+        return mask
+
+    def query(self,
+              query: Query,
+              chunk_size: int = _CHUNK_ROWS) -> 'DataFrame':
+        """
+        Selects the rows matching a query.
+
+        Parameters
+        ----------
+        query : Query
+            The condition, e.g. `Query.between('x', 0, 1) & ~Query.isin('cellI', [1, 2])`.
+        chunk_size : int, optional
+            The number of rows evaluated at once, see `mask`. Default is 1048576.
+
+        Returns
+        -------
+        DataFrame
+            A new DataFrame with the same header containing the matching rows.
+        """
+        return self.select_rows(self.mask(query, chunk_size))
+
+    def reduce(self,
+               column: str,
+               op: str = 'sum',
+               chunk_size: int = _CHUNK_ROWS) -> float:
+        """
+        Reduces a column chunk by chunk.
+
+        Floating point columns are accumulated in float64.
+
+        Parameters
+        ----------
+        column : str
+            The column name.
+        op : str, optional
+            The reduction, one of 'sum', 'mean', 'min' and 'max'. Default is 'sum'.
+        chunk_size : int, optional
+            The number of rows reduced at once. Default is 1048576.
+
+        Returns
+        -------
+        float
+            The reduced value.
+
+        Raises
+        ------
+        ValueError
+            If the reduction is not supported, or the column is empty and the
+            reduction is not 'sum'.
+        TypeError
+            If the column is categorical.
+        """
+        if op not in _REDUCTIONS:
+            raise ValueError(f'Unsupported reduction: "{op}"')
+        values = self[column]
+        if isinstance(values, Categorical):
+            raise TypeError(f'Cannot reduce categorical column "{column}"')
+        if not len(values) and op != 'sum':
+            raise ValueError(f'Cannot compute the {op} of empty column "{column}"')
+
+        # Reduce every chunk, then the partial results
+        reduction = _REDUCTIONS[op]
+        accumulate = values.dtype.kind == 'f' and op in ('sum', 'mean')
+        kwargs = {'dtype': np.float64} if accumulate else {}
+        partials = [reduction(values[start:start + chunk_size], **kwargs)
+                    for start in range(0, len(values), chunk_size)]
+        result = reduction(np.array(partials)) if partials else 0.0
+        if op == 'mean':
+            result = result / len(values)
+
+        return result.item() if isinstance(result, np.generic) else result
+
+    def iter_chunks(self,
+                    chunk_size: int = _CHUNK_ROWS) -> Iterator['DataFrame']:
+        """
+        Iterates over the rows in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of rows per chunk. Default is 1048576.
+
+        Yields
+        ------
+        DataFrame
+            A view of the next `chunk_size` rows.
+        """
+        for start in range(0, self.shape()[0], chunk_size):
+            yield self[start:start + chunk_size]
+
+    def append_rows(self,
+                    rows: 'DataFrame | dict[str, np.ndarray] | np.ndarray') -> None:
+        """
+        Appends rows to the end of the DataFrame.
+
+        The columns are moved into growable buffers whose capacity doubles
+        when exhausted, so appending N rows in batches costs O(N) in total.
+        Call `trim` once appending is finished to release the spare capacity.
+        Block storage is converted to columnar storage first.
+
+        Parameters
+        ----------
+        rows : DataFrame, dict[str, np.ndarray] or np.ndarray
+            The new rows, as a DataFrame or a dictionary with every column of
+            the header, or a 2D array with the columns in header order.
+
+        Raises
+        ------
+        ValueError
+            If the new columns have different lengths.
+        """
+        if isinstance(rows, np.ndarray):
+            rows = {name: rows[:, idx] for idx, name in enumerate(self._header)}
+        if len({len(rows[name]) for name in self._header}) > 1:
+            raise ValueError('All appended columns must have the same length')
+
+        self.to_columnar()
+        for name in self._header:
+            column = self._columns[name]
+            values = rows[name]
+
+            # Move the column into a buffer on the first append
+            buffer = self._buffers.get(name)
+            if buffer is None:
+                codes = column.codes if isinstance(column, Categorical) else column
+                buffer = GrowableArray(np.int32 if isinstance(column, Categorical) else codes.dtype,
+                                       2 * (len(codes) + len(values)))
+                buffer.append(codes)
+                self._buffers[name] = buffer
+                self._shared.discard(name)
+
+            if isinstance(column, Categorical):
+                categories, codes = _merge_categories(column.categories, values)
+                buffer.append(codes)
+                self._columns[name] = Categorical(buffer.data, categories)
+            else:
+                buffer.append(values)
+                self._columns[name] = buffer.data
+
+    def trim(self) -> None:
+        """Releases the spare capacity of the buffers created by `append_rows`."""
+        for name, buffer in self._buffers.items():
+            column = self._columns[name]
+            if isinstance(column, Categorical):
+                codes = buffer.trim().astype(np.min_scalar_type(max(len(column.categories) - 1, 0)))
+                self._columns[name] = Categorical(codes, column.categories)
+            else:
+                self._columns[name] = buffer.trim()
+        self._buffers = {}
+
+    @classmethod
+    def concat(cls,
+               frames: list['DataFrame']) -> 'DataFrame':
+        """
+        Concatenates DataFrames with the same header row-wise.
+
+        Each column is allocated once with the total length and filled by
+        one copy per DataFrame.
+
+        Parameters
+        ----------
+        frames : list[DataFrame]
+            The concatenated DataFrames, in order.
+
+        Returns
+        -------
+        DataFrame
+            A new columnar DataFrame with the header of the first DataFrame.
         """
-        # Get id of column
-        idx = self._map[column]
+        header = list(frames[0].header)
+        columns = {}
+        for name in header:
+            parts = [frame[name] for frame in frames]
+            if isinstance(parts[0], Categorical):
+                categories = parts[0].categories
+                codes = []
+                for part in parts:
+                    categories, part_codes = _merge_categories(categories, part)
+                    codes.append(part_codes)
+                columns[name] = Categorical(
+                    np.concatenate(codes).astype(np.min_scalar_type(max(len(categories) - 1, 0))),
+                    categories)
+            else:
+                columns[name] = np.concatenate(parts)
 
-        arr = []
-        # Check if value in columns is close to specified value for each row
-        for row in self._data:
-            if np.isclose(row[idx], value):
-                arr.append(row)
+        return cls(header, columns)
 
-        return np.array(arr)
+    def select_rows(self,
+                    rows: np.ndarray) -> 'DataFrame':
+        """
+        Selects a subset of rows with a boolean mask or an index array.
+
+        Parameters
+        ----------
+        rows : np.ndarray or slice
+            A boolean mask of length equal to the number of rows, an integer
+            array of row indices, or a slice, which returns a view.
+
+        Returns
+        -------
+        DataFrame
+            A new DataFrame with the same header containing the selected rows.
+        """
+        if isinstance(rows, slice):
+            return self[rows]
+
+        if self.is_columnar:
+            return DataFrame(self._header, {name: self._columns[name][rows]
+                                            for name in self._header})
+
+        return DataFrame(self._header, self._data[rows])
 
     def __getitem__(self,
                     key):
@@ -67,15 +800,17 @@ class DataFrame(MutableMapping):
 
         Parameters
         ----------
-        key : str, int, tuple, or list[str]
+        key : str, int, slice, tuple, or list[str]
             - **str**: Returns the column as a 1D array.
-            - **int**: Returns the row as a 1D array.
+            - **int**: Returns the row as a 1D array (a tuple for columnar data).
+            - **slice**: Returns a DataFrame view of the rows.
             - **tuple (row, col)**: Returns the scalar value at the specific cell.
-            - **list[str]**: Returns a subset of columns as a 2D array.
+            - **list[str]**: Returns a DataFrame view of the columns, in the
+              order of `key`.
 
         Returns
         -------
-        np.ndarray or scalar
+        np.ndarray, DataFrame or scalar
             The requested data slice or value.
 
         Raises
@@ -85,6 +820,9 @@ class DataFrame(MutableMapping):
         KeyError
             If a column string is provided that does not exist in the header.
         """
+        if self.is_columnar:
+            return self._get_columnar(key)
+
         # Column access using str key
         if isinstance(key, str):
             col_idx = self._map[key]
@@ -92,22 +830,129 @@ class DataFrame(MutableMapping):
         # Row access using int key
         elif isinstance(key, int):
             return self._data[key]
+        # Row slice view using slice key
+        elif isinstance(key, slice):
+            return self._view(self._header, self._data[key])
         # Cell access using tuple key
         elif isinstance(key, tuple):
             row, col = key
             col_idx = self._map[col] if isinstance(col, str) else col
             return self._data[row, col_idx]
-        # List of columns using list[str]
+        # Column view using list[str], the columns are strided views of the block
         elif is_list_str(key):
-            col_idx = []
-            for col in key:
-                col_idx.append(self._map[col])
-            col_idx.sort()
-            return self._data[:, col_idx]
+            return self._view(key, {name: self._data[:, self._map[name]] for name in key})
         else:
             raise TypeError(
                 'Invalid key type. Try again with str, int, tuple or list[str].')
 
+    def _get_columnar(self,
+                      key):
+        """
+        Retrieves data from columnar storage, see `__getitem__`.
+        """
+        # Column access using str key
+        if isinstance(key, str):
+            return self._columns[key]
+        # Row access using int key
+        elif isinstance(key, int):
+            return tuple(self._columns[name][key] for name in self._header)
+        # Row slice view using slice key
+        elif isinstance(key, slice):
+            return self._view(self._header, {name: self._columns[name][key]
+                                             for name in self._header})
+        # Cell access using tuple key
+        elif isinstance(key, tuple):
+            row, col = key
+            name = col if isinstance(col, str) else self._header[col]
+            return self._columns[name][row]
+        # Column view using list[str], the columns are not copied
+        elif is_list_str(key):
+            return self._view(key, {name: self._columns[name] for name in key})
+        else:
+            raise TypeError(
+                'Invalid key type. Try again with str, int, tuple or list[str].')
+
+    def _rows(self,
+              rows: slice) -> 'DataFrame':
+        """
+        Returns a read-only row slice for internal chunked evaluation.
+
+        Unlike `__getitem__`, the columns are not marked as shared, so
+        evaluating chunks does not force later writes to copy the data.
+
+        Parameters
+        ----------
+        rows : slice
+            The row range.
+
+        Returns
+        -------
+        DataFrame
+            The rows, sharing memory with this DataFrame.
+        """
+        if self.is_columnar:
+            return DataFrame(self._header, {name: self._columns[name][rows]
+                                            for name in self._header})
+
+        return DataFrame(self._header, self._data[rows])
+
+    def _view(self,
+              header: list[str],
+              data: np.ndarray | dict[str, np.ndarray]) -> 'DataFrame':
+        """
+        Creates a DataFrame sharing memory with this one.
+
+        The shared columns are marked in both DataFrames, so either one copies
+        them before the first write.
+
+        Parameters
+        ----------
+        header : list[str]
+            The column names of the view.
+        data : np.ndarray or dict[str, np.ndarray]
+            The shared block or columns.
+
+        Returns
+        -------
+        DataFrame
+            The view.
+        """
+        view = DataFrame(header, data)
+        view._shared = set(header)
+        self._shared.update(header)
+
+        return view
+
+    def _detach(self,
+                names: list[str]) -> None:
+        """
+        Copies shared or read-only data before it is modified.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the modified columns. Block storage is copied as a
+            whole.
+        """
+        # Writes must not diverge from the append buffers
+        if self._buffers:
+            self.trim()
+
+        if not self.is_columnar:
+            if self._shared or not self._data.flags.writeable:
+                self._data = self._data.copy()
+                self._shared = set()
+            return
+
+        for name in names:
+            column = self._columns[name]
+            if isinstance(column, Categorical):
+                if name in self._shared:
+                    self._columns[name] = Categorical(column.codes.copy(), column.categories)
+            elif name in self._shared or not column.flags.writeable:
+                self._columns[name] = np.array(column)
+            self._shared.discard(name)
+
     def __setitem__(self,
                     key,
                     value) -> None:
@@ -121,9 +966,15 @@ class DataFrame(MutableMapping):
         value : scalar or array_like
             The value(s) to assign to the specified location.
         """
+        if self.is_columnar:
+            self._set_columnar(key, value)
+            return
+
+        self._detach(self._header)
+
         # Overwrite column
         if isinstance(key, str):
-            self._data[:, key] = value
+            self._data[:, self._map[key]] = value
         # Overwrite row
         elif isinstance(key, int):
             self._data[key] = value
@@ -134,22 +985,233 @@ class DataFrame(MutableMapping):
         # Overwrite multiple columns
         elif is_list_str(key):
             for col in key:
-                self._data[col] = value
+                self._data[:, self._map[col]] = value
+
+    def _set_columnar(self,
+                      key,
+                      value) -> None:
+        """
+        Modifies data in columnar storage, see `__setitem__`.
+        """
+        # Overwrite column, or add a new one
+        if isinstance(key, str):
+            if key not in self._columns:
+                self.add_column(key, value)
+            else:
+                self._detach([key])
+                self._columns[key][:] = value
+        # Overwrite row
+        elif isinstance(key, int):
+            self._detach(self._header)
+            for name, item in zip(self._header, value):
+                self._columns[name][key] = item
+        # Overwrite cell value
+        elif isinstance(key, tuple):
+            row, col = key
+            name = col if isinstance(col, str) else self._header[col]
+            self._detach([name])
+            self._columns[name][row] = value
+        # Overwrite multiple columns
+        elif is_list_str(key):
+            self._detach(key)
+            for col in key:
+                self._columns[col][:] = value
 
     def to_csv(self,
-               path: str) -> None:
+               path: str,
+               precision: int = 17,
+               compress: bool | None = None,
+               delimiter: str = ',',
+               chunk_size: int = 1 << 16) -> None:
         """
         Exports the DataFrame to a CSV file.
 
+        The rows are formatted in blocks of `chunk_size` rows with vectorized
+        NumPy operations. Floating point values are written in scientific
+        notation with `precision` significant digits, the default of 17
+        digits reads back to the same float64 values. String values and
+        column names containing the delimiter, a quote or a line break are
+        quoted, as by the `csv` module.
+
         Parameters
         ----------
         path : str
             The destination file path.
+        precision : int, optional
+            The number of significant digits of floating point values.
+            Default is 17.
+        compress : bool, optional
+            If True, the file is gzip-compressed (fastest level) while
+            writing. If None, it is compressed if `path` ends with '.gz'.
+            Default is None.
+        delimiter : str, optional
+            The column delimiter. Default is ','.
+        chunk_size : int, optional
+            The number of rows formatted at once. Default is 65536.
         """
-        with open(path, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(self._header)
-            writer.writerows(self._data)
+        if compress is None:
+            compress = str(path).endswith('.gz')
+        n_rows = self.shape()[0]
+
+        with (gzip.open(path, 'wb', compresslevel=1) if compress else open(path, 'wb')) as f:
+            f.write((delimiter.join(quote_strings(self._header, delimiter)) + '\n').encode())
+
+            # Categories are quoted once, before gathering their codes
+            categories = {name: string_chars(quote_strings(self[name].categories, delimiter))
+                          for name in self._header if isinstance(self[name], Categorical)}
+            for start in range(0, n_rows, chunk_size):
+                rows = slice(start, start + chunk_size)
+                blocks = []
+                for name in self._header:
+                    column = self[name]
+                    if name in categories:
+                        blocks.append(categories[name][column.codes[rows]])
+                    elif column.dtype.kind in 'USO':
+                        blocks.append(string_chars(quote_strings(column[rows], delimiter)))
+                    else:
+                        blocks.append(to_chars(column[rows], precision))
+                f.write(join_chars(blocks, delimiter))
+
+    def to_npz(self,
+               path: str,
+               compressed: bool = False) -> None:
+        """
+        Exports the DataFrame to a NumPy '.npz' archive.
+
+        Parameters
+        ----------
+        path : str
+            The destination file path.
+        compressed : bool, optional
+            If True, the archive is zip-compressed. Default is False.
+        """
+        arrays = {'header': np.array(self._header)}
+        for idx, name in enumerate(self._header):
+            column = self[name]
+            if isinstance(column, Categorical):
+                arrays[f'{idx}_codes'] = column.codes
+                arrays[f'{idx}_categories'] = column.categories
+            else:
+                arrays[str(idx)] = column
+
+        (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+    @classmethod
+    def from_npz(cls,
+                 path: str) -> 'DataFrame':
+        """
+        Loads a DataFrame exported by `to_npz`.
+
+        Parameters
+        ----------
+        path : str
+            The '.npz' archive path.
+
+        Returns
+        -------
+        DataFrame
+            A columnar DataFrame with the exported header and dtypes.
+        """
+        with np.load(path) as archive:
+            header = archive['header'].tolist()
+            columns = {}
+            for idx, name in enumerate(header):
+                if f'{idx}_codes' in archive:
+                    columns[name] = Categorical(archive[f'{idx}_codes'],
+                                                archive[f'{idx}_categories'])
+                else:
+                    columns[name] = archive[str(idx)]
+
+        return cls(header, columns)
+
+    def to_raw(self,
+               directory: str) -> None:
+        """
+        Exports the DataFrame as raw binary columns.
+
+        Each column is written as a headerless '<idx>.bin' file, next to a
+        'header.json' with the column names, dtypes and categories, so the
+        columns can also be read by other tools (e.g. `np.fromfile`).
+        Categorical codes are stored as int32.
+
+        Parameters
+        ----------
+        directory : str
+            The destination directory, created if it does not exist.
+        """
+        _write_raw(Path(directory), self._header, [self])
+
+    @classmethod
+    def from_raw(cls,
+                 directory: str,
+                 mmap: bool = True) -> 'DataFrame':
+        """
+        Loads a DataFrame exported by `to_raw`.
+
+        Parameters
+        ----------
+        directory : str
+            The directory written by `to_raw`.
+        mmap : bool, optional
+            If True, the columns are memory-mapped (copy-on-write) instead of
+            read into memory. Default is True.
+
+        Returns
+        -------
+        DataFrame
+            A columnar DataFrame with the exported header and dtypes.
+        """
+        path = Path(directory)
+        with (path / 'header.json').open() as f:
+            meta = json.load(f)
+
+        columns = {}
+        for idx, entry in enumerate(meta['columns']):
+            dtype = np.dtype(entry['dtype'])
+            file = path / f'{idx}.bin'
+            if mmap and meta['rows']:
+                column = np.memmap(file, dtype=dtype, mode='c', shape=(meta['rows'],))
+            else:
+                column = np.fromfile(file, dtype=dtype)
+            if 'categories' in entry:
+                column = Categorical(column, np.array(entry['categories']))
+            columns[entry['name']] = column
+
+        return cls([entry['name'] for entry in meta['columns']], columns)
+
+    @classmethod
+    def from_chunks(cls,
+                    header: list[str],
+                    chunks,
+                    directory: str) -> 'DataFrame':
+        """
+        Streams row chunks into a spill directory and memory-maps it.
+
+        Each chunk is appended to the raw column files of `to_raw` and then
+        released, so only one chunk is held in memory at a time. The columns
+        of the returned DataFrame are memory-mapped copy-on-write, modified
+        pages stay in memory and the spill files are never changed.
+
+        Parameters
+        ----------
+        header : list[str]
+            The column names.
+        chunks : iterable
+            The rows, as DataFrames, dictionaries of columns or 2D arrays with
+            the columns in header order. The dtype of each column is set by
+            the first chunk.
+        directory : str
+            The spill directory, created if it does not exist. It is not
+            removed when the DataFrame is released.
+
+        Returns
+        -------
+        DataFrame
+            A columnar DataFrame of memory-mapped columns.
+        """
+        _write_raw(Path(directory), header, chunks)
+
+        return cls.from_raw(directory, mmap=True)
 
     def __delitem__(self,
                     key) -> None:
@@ -162,8 +1224,17 @@ class DataFrame(MutableMapping):
         Parameters
         ----------
         key : str, int, tuple, or list[str]
-            The location to mask with NaN.
+            The location to mask with NaN. Columnar data only supports
+            masking whole floating point columns.
         """
+        if self.is_columnar:
+            names = [key] if isinstance(key, str) else key
+            self._detach(names)
+            for col in names:
+                self._columns[col][:] = np.nan
+            return
+
+        self._detach(self._header)
         self._data[key] = np.nan
 
     def __iter__(self) -> Iterator[str]:
@@ -179,6 +1250,8 @@ class DataFrame(MutableMapping):
 
     def __repr__(self) -> str:
         """Returns the string representation of the DataFrame."""
+        if self.is_columnar:
+            return '\n'.join(f'{name}: {self._columns[name]}' for name in self._header)
         return f'{self._header}\n{self._data}'
 
     def __len__(self) -> int:
@@ -201,4 +1274,89 @@ class DataFrame(MutableMapping):
         tuple[int, int]
             A tuple representing (number_of_rows, number_of_columns).
         """
+        if self.is_columnar:
+            n_rows = len(self._columns[self._header[0]]) if self._header else 0
+            return (n_rows, len(self._header))
         return self._data.shape
+
+
+def _write_raw(path: Path,
+               header: list[str],
+               chunks) -> None:
+    """
+    Appends row chunks to raw binary column files, see `DataFrame.to_raw`.
+
+    Parameters
+    ----------
+    path : Path
+        The destination directory, created if it does not exist.
+    header : list[str]
+        The column names.
+    chunks : iterable
+        The rows, as DataFrames, dictionaries of columns or 2D arrays with
+        the columns in header order.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    files = [(path / f'{idx}.bin').open('wb') for idx in range(len(header))]
+    dtypes = [None] * len(header)
+    categories = [None] * len(header)
+    n_rows = 0
+
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, np.ndarray):
+                chunk = {name: chunk[:, idx] for idx, name in enumerate(header)}
+            for idx, name in enumerate(header):
+                column = chunk[name]
+                # Encode categorical chunks against the categories seen so far
+                if isinstance(column, Categorical):
+                    if categories[idx] is None:
+                        categories[idx] = column.categories[:0]
+                    categories[idx], column = _merge_categories(categories[idx], column)
+                if dtypes[idx] is None:
+                    dtypes[idx] = np.asarray(column).dtype
+                np.ascontiguousarray(column, dtype=dtypes[idx]).tofile(files[idx])
+            n_rows += len(chunk[header[0]]) if header else 0
+    finally:
+        for f in files:
+            f.close()
+
+    columns = []
+    for name, dtype, column_categories in zip(header, dtypes, categories):
+        entry = {'name': name}
+        if column_categories is not None:
+            entry['categories'] = column_categories.tolist()
+        entry['dtype'] = np.dtype(dtype if dtype is not None else np.float64).str
+        columns.append(entry)
+
+    with (path / 'header.json').open('w') as f:
+        json.dump({'rows': n_rows, 'columns': columns}, f)
+
+
+def _merge_categories(categories: np.ndarray,
+                      values) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes values against existing categories, adding the unseen ones.
+
+    Parameters
+    ----------
+    categories : np.ndarray
+        The existing categories.
+    values : Categorical or array_like
+        The encoded values.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The extended categories and the int32 codes of `values`.
+    """
+    if not isinstance(values, Categorical):
+        values = Categorical.from_values(np.asarray(values))
+
+    # Append unseen categories, keeping the existing codes valid
+    new = values.categories[~np.isin(values.categories, categories)]
+    merged = np.concatenate([categories, new]) if len(new) else categories
+    order = np.argsort(merged, kind='stable')
+    mapping = order[np.searchsorted(merged, values.categories, sorter=order)]
+
+    return merged, mapping.astype(np.int32)[values.codes]
@@ -1,8 +1,32 @@
-from lutils.io.parser import parse_internal_field, parse_residuals, parse_yaml_config
+from lutils.io.parser import (parse_internal_field, parse_residuals, parse_yaml_config,
+                              parse_interpolation_info)
+from lutils.io.foam_parser import parse_foam_header, parse_foam_field
+from lutils.io.follower import FileFollower, ResidualsFollower
+from lutils.io.log_parser import parse_solver_log
+from lutils.io.mesh_parser import (parse_foam_list, parse_foam_faces, parse_foam_boundary,
+                                   parse_foam_set, parse_foam_zones)
+from lutils.io.decomposed import get_processor_dirs, parse_decomposed_field
+from lutils.io.cache import FieldCache
+from lutils.io.stl_parser import parse_stl
 
 
 __all__ = [
     'parse_internal_field',
     'parse_residuals',
-    'parse_yaml_config'
+    'parse_yaml_config',
+    'parse_interpolation_info',
+    'parse_foam_header',
+    'parse_foam_field',
+    'FileFollower',
+    'ResidualsFollower',
+    'parse_solver_log',
+    'parse_foam_list',
+    'parse_foam_faces',
+    'parse_foam_boundary',
+    'parse_foam_set',
+    'parse_foam_zones',
+    'get_processor_dirs',
+    'parse_decomposed_field',
+    'FieldCache',
+    'parse_stl'
 ]
@@ -0,0 +1,281 @@
+from collections.abc import Callable
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+
+from lutils.core.types import DataFrame
+
+
+# Name of the entry header file, its mtime marks the last access
+_HEADER_FILE = 'header.json'
+# Size of the blocks hashed at once
+_HASH_BLOCK = 1 << 20
+
+
+class FieldCache:
+    """
+    A persistent on-disk cache of parsed tables.
+
+    Each cached table is stored in its own directory as one '.npy' file per
+    column plus a JSON header holding the column names and the size, mtime
+    and content hash of the source file. Cached tables are loaded as
+    memory-mapped columns (copy-on-write), so reloading does not parse or
+    read the whole file.
+
+    An entry is invalidated if the source size changes, or if its mtime
+    changes and the content hash differs. When the total cache size exceeds
+    `max_size`, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        The cache directory, created if it does not exist.
+    max_size : int, optional
+        The total size budget of the cache in bytes. Default is 1 GiB.
+    verify_hash : bool, optional
+        If True, the content hash is checked on every load, even if the
+        mtime is unchanged. Default is False.
+    """
+
+    def __init__(self,
+                 cache_dir: Path,
+                 max_size: int = 1 << 30,
+                 verify_hash: bool = False) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+        self._verify_hash = verify_hash
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._evict()
+
+    @property
+    def cache_dir(self):
+        """Path: The cache directory."""
+        return self._cache_dir
+
+    @property
+    def max_size(self):
+        """int: The total size budget in bytes."""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """int: The total size of the cached entries in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def load(self,
+             source: Path,
+             parser: Callable[[Path], DataFrame]) -> DataFrame:
+        """
+        Returns the cached table of a source file, parsing and storing it on a miss.
+
+        Parameters
+        ----------
+        source : Path
+            The source file.
+        parser : Callable[[Path], DataFrame]
+            The function parsing the source file, e.g. `parse_internal_field`.
+
+        Returns
+        -------
+        DataFrame
+            The cached or freshly parsed table.
+        """
+        frame = self.get(source)
+        if frame is None:
+            frame = parser(source)
+            self.put(source, frame)
+
+        return frame
+
+    def get(self,
+            source: Path) -> DataFrame | None:
+        """
+        Loads the cached table of a source file.
+
+        Parameters
+        ----------
+        source : Path
+            The source file.
+
+        Returns
+        -------
+        DataFrame or None
+            A columnar DataFrame of memory-mapped columns, or None if there is
+            no valid entry for the source.
+        """
+        entry = self._entry_dir(source)
+        header_path = entry / _HEADER_FILE
+        if not header_path.exists() or not source.exists():
+            return None
+
+        with header_path.open() as f:
+            header = json.load(f)
+
+        # Validate the entry against the current source file
+        stat = source.stat()
+        if stat.st_size != header['size']:
+            self._remove(entry)
+            return None
+        if stat.st_mtime_ns != header['mtime'] or self._verify_hash:
+            if _hash_file(source) != header['hash']:
+                self._remove(entry)
+                return None
+            header['mtime'] = stat.st_mtime_ns
+            _write_header(header_path, header)
+
+        # Mark the entry as recently used
+        os.utime(header_path)
+
+        columns = {name: np.load(entry / f'{idx}.npy', mmap_mode='c')
+                   for idx, name in enumerate(header['columns'])}
+
+        return DataFrame(header['columns'], columns)
+
+    def put(self,
+            source: Path,
+            frame: DataFrame) -> None:
+        """
+        Stores the table parsed from a source file.
+
+        Tables with non-array columns (e.g. Categorical) are not cached.
+
+        Parameters
+        ----------
+        source : Path
+            The source file.
+        frame : DataFrame
+            The parsed table.
+        """
+        columns = [frame[name] for name in frame]
+        if not all(isinstance(column, np.ndarray) for column in columns):
+            return
+
+        stat = source.stat()
+        header = {
+            'source': str(source.resolve()),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': _hash_file(source),
+            'columns': list(frame)
+        }
+
+        # Write into a temporary directory, then move it in place
+        entry = self._entry_dir(source)
+        tmp = entry.with_name(f'{entry.name}.tmp')
+        self._remove(tmp)
+        tmp.mkdir()
+        for idx, column in enumerate(columns):
+            np.save(tmp / f'{idx}.npy', np.ascontiguousarray(column))
+        _write_header(tmp / _HEADER_FILE, header)
+        self._remove(entry)
+        tmp.rename(entry)
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        for entry, _, _ in self._entries():
+            self._remove(entry)
+
+    def _entry_dir(self,
+                   source: Path) -> Path:
+        """
+        Returns the entry directory of a source file.
+
+        Parameters
+        ----------
+        source : Path
+            The source file.
+
+        Returns
+        -------
+        Path
+            The directory named by the hash of the absolute source path.
+        """
+        key = hashlib.sha1(str(source.resolve()).encode()).hexdigest()
+
+        return self._cache_dir / key
+
+    def _entries(self) -> list[tuple[Path, float, int]]:
+        """
+        Lists the cached entries.
+
+        Returns
+        -------
+        list[tuple[Path, float, int]]
+            The entry directory, the last access time and the size in bytes
+            of each entry.
+        """
+        entries = []
+        for entry in self._cache_dir.iterdir():
+            header_path = entry / _HEADER_FILE
+            if entry.suffix == '.tmp' or not header_path.exists():
+                continue
+            size = sum(path.stat().st_size for path in entry.iterdir())
+            entries.append((entry, header_path.stat().st_mtime, size))
+
+        return entries
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the size budget is met."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for entry, _, size in entries:
+            if total <= self._max_size:
+                break
+            self._remove(entry)
+            total -= size
+
+    @staticmethod
+    def _remove(entry: Path) -> None:
+        """
+        Removes an entry directory if it exists.
+
+        Parameters
+        ----------
+        entry : Path
+            The entry directory.
+        """
+        if entry.exists():
+            shutil.rmtree(entry)
+
+
+def _hash_file(path: Path) -> str:
+    """
+    Computes the content hash of a file.
+
+    Parameters
+    ----------
+    path : Path
+        The file to hash.
+
+    Returns
+    -------
+    str
+        The hex digest of the BLAKE2b hash of the file content.
+    """
+    digest = hashlib.blake2b()
+    with path.open('rb') as f:
+        while block := f.read(_HASH_BLOCK):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _write_header(path: Path,
+                  header: dict) -> None:
+    """
+    Writes an entry header as JSON.
+
+    Parameters
+    ----------
+    path : Path
+        The header file path.
+    header : dict
+        The entry header.
+    """
+    with path.open('w') as f:
+        json.dump(header, f)
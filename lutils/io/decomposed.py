@@ -0,0 +1,178 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+import numpy as np
+import re
+
+from lutils.io.foam_parser import (_N_COMPONENTS, parse_foam_field, parse_foam_header,
+                                   get_field_type, get_n_cells)
+from lutils.io.mesh_parser import parse_foam_list
+
+
+# Precompile regex to save time
+_PROCESSOR_DIR = re.compile(r'processor(\d+)')
+
+
+def get_processor_dirs(case_path: Path) -> list[Path]:
+    """
+    Returns the processor directories of a decomposed case.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root directory of the OpenFOAM case.
+
+    Returns
+    -------
+    list[Path]
+        The 'processor<N>' directories sorted by processor number, empty if
+        the case is not decomposed.
+    """
+    dirs = []
+    for path in case_path.glob('processor*'):
+        match = _PROCESSOR_DIR.fullmatch(path.name)
+        if match and path.is_dir():
+            dirs.append((int(match.group(1)), path))
+
+    return [path for _, path in sorted(dirs)]
+
+
+def parse_decomposed_field(case_path: Path,
+                           file_path: str,
+                           n_workers: int | None = None) -> np.ndarray:
+    """
+    Parses a field of a decomposed case without reconstructing it.
+
+    Each processor field and its 'cellProcAddressing' are parsed in a process
+    pool. The workers scatter their values directly into one preallocated
+    global array in shared memory, ordered by the global cell index. The
+    result is copied out of the shared memory before it is released, so the
+    peak memory use is twice the size of the global field.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root directory of the OpenFOAM case.
+    file_path : str
+        The path to the field file relative to each processor directory
+        (e.g. '2000/U').
+    n_workers : int, optional
+        The number of worker processes. If None, one per CPU is used.
+        Default is None.
+
+    Returns
+    -------
+    np.ndarray
+        A float64 array of shape (N,) for scalar fields or (N, n_components)
+        for vector and tensor fields.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the case is not decomposed or the field is missing in a processor
+        directory.
+    ValueError
+        If the processor addressing holds labels outside of the global mesh
+        or does not cover every global cell exactly once.
+    """
+    processor_dirs = get_processor_dirs(case_path)
+    if not processor_dirs:
+        raise FileNotFoundError(f'No processor directories found in: {case_path}')
+
+    for processor_dir in processor_dirs:
+        if not (processor_dir / file_path).exists():
+            raise FileNotFoundError(
+                f'Field file not found at: {processor_dir / file_path}')
+
+    # Global size from the processor cell counts
+    n_components = _N_COMPONENTS[get_field_type(
+        parse_foam_header(processor_dirs[0] / file_path))]
+    local_cells = [_get_local_cells(processor_dir) for processor_dir in processor_dirs]
+    n_cells = sum(local_cells)
+    shape = (n_cells, n_components) if n_components > 1 else (n_cells,)
+
+    shm = SharedMemory(create=True, size=max(n_cells * n_components * 8, 1))
+    try:
+        # Scatter every processor into the shared global array
+        tasks = [(processor_dir, file_path, n_local, shm.name, shape)
+                 for processor_dir, n_local in zip(processor_dirs, local_cells)]
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            addressing = np.concatenate(list(pool.map(_scatter_processor, tasks)))
+        # Every global cell must be written by exactly one processor cell
+        n_covered = np.count_nonzero(np.bincount(addressing, minlength=n_cells) == 1)
+        if n_covered != n_cells:
+            raise ValueError(
+                f'Processor addressing covers {n_covered} of {n_cells} cells once in: {case_path}')
+
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return values
+
+
+def _get_local_cells(processor_dir: Path) -> int:
+    """
+    Returns the number of cells of a processor mesh.
+
+    Parameters
+    ----------
+    processor_dir : Path
+        The processor directory.
+
+    Returns
+    -------
+    int
+        The number of cells, from the owner header note if present,
+        otherwise from the size of 'cellProcAddressing'.
+    """
+    n_cells = get_n_cells(processor_dir)
+    if n_cells is None:
+        n_cells = len(parse_foam_list(
+            processor_dir / 'constant/polyMesh/cellProcAddressing'))
+
+    return n_cells
+
+
+def _scatter_processor(task: tuple[Path, str, int, str, tuple[int, ...]]) -> np.ndarray:
+    """
+    Parses one processor field and writes it into the shared global array.
+
+    Parameters
+    ----------
+    task : tuple[Path, str, int, str, tuple[int, ...]]
+        The processor directory, the field path, the number of local cells,
+        the shared memory name and the global array shape.
+
+    Returns
+    -------
+    np.ndarray
+        The global cell labels of the processor cells.
+
+    Raises
+    ------
+    ValueError
+        If the addressing does not match the field size or holds labels
+        outside of the global mesh.
+    """
+    processor_dir, file_path, n_local, shm_name, shape = task
+    addressing = parse_foam_list(processor_dir / 'constant/polyMesh/cellProcAddressing')
+    values = parse_foam_field(processor_dir / file_path, n_local)
+    if len(addressing) != len(values):
+        raise ValueError(
+            f'Addressing size {len(addressing)} does not match the field size '
+            f'{len(values)} in: {processor_dir}')
+    if addressing.size and (addressing.min() < 0 or addressing.max() >= shape[0]):
+        raise ValueError(
+            f'Addressing labels outside of the {shape[0]} global cells in: {processor_dir}')
+
+    shm = SharedMemory(name=shm_name)
+    try:
+        target = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        target[addressing] = values.reshape((len(values),) + shape[1:])
+        del target
+    finally:
+        shm.close()
+
+    return addressing
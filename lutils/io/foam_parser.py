@@ -0,0 +1,469 @@
+from pathlib import Path
+import numpy as np
+import mmap
+import re
+
+
+# Number of components of the OpenFOAM primitive types
+_N_COMPONENTS = {
+    'scalar': 1,
+    'vector': 3,
+    'sphericalTensor': 1,
+    'symmTensor': 6,
+    'tensor': 9
+}
+# Component suffixes used when splitting fields into DataFrame columns
+_COMPONENT_NAMES = {
+    'scalar': [''],
+    'vector': ['x', 'y', 'z'],
+    'sphericalTensor': ['ii'],
+    'symmTensor': ['xx', 'xy', 'xz', 'yy', 'yz', 'zz'],
+    'tensor': ['xx', 'xy', 'xz', 'yx', 'yy', 'yz', 'zx', 'zy', 'zz']
+}
+_FIELD_TYPES = {
+    'Scalar': 'scalar',
+    'Vector': 'vector',
+    'SphericalTensor': 'sphericalTensor',
+    'SymmTensor': 'symmTensor',
+    'Tensor': 'tensor'
+}
+
+# Precompile regex to save time
+_HEADER = re.compile(rb'FoamFile\s*\{(.*?)\}', re.DOTALL)
+_HEADER_ENTRY = re.compile(rb'(\w+)\s+("[^"]*"|[^;{}]*?)\s*;')
+_COMMENTS = re.compile(rb'//[^\n]*|/\*.*?\*/', re.DOTALL)
+_INTERNAL_FIELD = re.compile(rb'internalField\s+(uniform|nonuniform)\s+')
+_LIST_START = re.compile(rb'List<(\w+)>\s*(\d+)\s*([({])')
+_N_CELLS = re.compile(r'nCells:\s*(\d+)')
+_PARENTHESES_TO_SPACES = bytes.maketrans(b'()', b'  ')
+
+# Size of the file head searched for the FoamFile header
+_HEAD_SIZE = 4096
+
+
+def is_foam_file(path: Path) -> bool:
+    """
+    Checks whether a file is a native OpenFOAM file with a FoamFile header.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the file.
+
+    Returns
+    -------
+    bool
+        True if a FoamFile header is found at the top of the file, False otherwise.
+    """
+    with path.open('rb') as f:
+        head = f.read(_HEAD_SIZE)
+
+    return _HEADER.search(_COMMENTS.sub(b'', head)) is not None
+
+
+def parse_foam_header(path: Path) -> dict[str, str]:
+    """
+    Parses the FoamFile header of a native OpenFOAM file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the OpenFOAM file.
+
+    Returns
+    -------
+    dict[str, str]
+        A dictionary mapping header keywords (e.g. 'format', 'class', 'arch')
+        to their values, with enclosing quotes removed.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If no FoamFile header is found.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'OpenFOAM file not found at: {path}')
+
+    with path.open('rb') as f:
+        head = f.read(_HEAD_SIZE)
+
+    return _parse_header(head, path)
+
+
+def parse_foam_field(path: Path,
+                     n_cells: int | None = None) -> np.ndarray:
+    """
+    Parses the internal field of a native OpenFOAM field file.
+
+    Handles `nonuniform List<type>` fields, including the compact `N{value}`
+    notation, and `uniform` fields. The boundaryField is skipped.
+
+    Files written with `format binary` are memory-mapped and the list payload
+    is returned as a read-only view into the mapping, using the label and
+    scalar widths and the byte order given by the `arch` header entry.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the field file (e.g. '<case>/2000/U').
+    n_cells : int, optional
+        The number of cells, required to expand uniform fields. Default is None.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (N,) for scalar fields or (N, n_components) for
+        vector and tensor fields. ASCII fields are parsed to float64, binary
+        fields keep the stored scalar width.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file is not a valid field file, or if a uniform field is parsed
+        without `n_cells`.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Field file not found at: {path}')
+
+    data = _map_file(path)
+    header = _parse_header(data[:_HEAD_SIZE], path)
+    value_type = get_field_type(header)
+
+    # Find the start of the internal field
+    match = _INTERNAL_FIELD.search(data)
+    if not match:
+        raise ValueError(f'Internal field not found in file: {path}')
+
+    if match.group(1) == b'uniform':
+        return _parse_uniform(data, match.end(), value_type, n_cells, path)
+
+    # Binary payloads are read with the scalar width given in arch
+    if header.get('format') == 'binary':
+        scalar_dtype = get_binary_dtypes(header)[1]
+    else:
+        scalar_dtype = None
+
+    return _parse_list(data, match.end(), path, scalar_dtype)
+
+
+def get_binary_dtypes(header: dict[str, str]) -> tuple[np.dtype, np.dtype]:
+    """
+    Returns the label and scalar dtypes of a binary OpenFOAM file.
+
+    The widths and byte order are read from the `arch` header entry, e.g.
+    "LSB;label=32;scalar=64". Missing entries default to little-endian
+    32-bit labels and 64-bit scalars.
+
+    Parameters
+    ----------
+    header : dict[str, str]
+        The parsed FoamFile header.
+
+    Returns
+    -------
+    tuple[np.dtype, np.dtype]
+        The label (integer) and scalar (floating point) dtypes.
+
+    Raises
+    ------
+    ValueError
+        If the `arch` entry specifies unsupported widths.
+    """
+    arch = dict(item.partition('=')[::2]
+                for item in header.get('arch', '').split(';'))
+    byte_order = '>' if 'MSB' in arch else '<'
+
+    label_width = int(arch.get('label', 32)) // 8
+    scalar_width = int(arch.get('scalar', 64)) // 8
+    if label_width not in (4, 8) or scalar_width not in (4, 8):
+        raise ValueError(f'Unsupported arch: "{header.get("arch")}"')
+
+    return (np.dtype(f'{byte_order}i{label_width}'),
+            np.dtype(f'{byte_order}f{scalar_width}'))
+
+
+def get_field_type(header: dict[str, str]) -> str:
+    """
+    Returns the primitive value type of a geometric field from its header.
+
+    Parameters
+    ----------
+    header : dict[str, str]
+        The parsed FoamFile header.
+
+    Returns
+    -------
+    str
+        The value type (e.g. 'scalar' for volScalarField, 'vector' for volVectorField).
+
+    Raises
+    ------
+    ValueError
+        If the header class is not a supported field class.
+    """
+    field_class = header.get('class', '')
+    for key, value in _FIELD_TYPES.items():
+        if field_class.endswith(f'{key}Field'):
+            return value
+
+    raise ValueError(f'Unsupported field class: "{field_class}"')
+
+
+def get_component_names(field_name: str,
+                        value_type: str) -> list[str]:
+    """
+    Returns the column names of the field components.
+
+    Parameters
+    ----------
+    field_name : str
+        The field name (e.g. 'U').
+    value_type : str
+        The primitive value type (e.g. 'vector').
+
+    Returns
+    -------
+    list[str]
+        The component column names (e.g. ['Ux', 'Uy', 'Uz']).
+    """
+    return [field_name + suffix for suffix in _COMPONENT_NAMES[value_type]]
+
+
+def get_n_cells(case_path: Path) -> int | None:
+    """
+    Reads the number of cells from the note in the polyMesh owner header.
+
+    Parameters
+    ----------
+    case_path : Path
+        The root directory of the OpenFOAM case.
+
+    Returns
+    -------
+    int or None
+        The number of cells if found, otherwise None.
+    """
+    path = case_path / 'constant/polyMesh/owner'
+    if not path.exists():
+        return None
+
+    found = _N_CELLS.search(parse_foam_header(path).get('note', ''))
+
+    return int(found.group(1)) if found else None
+
+
+def _parse_header(head: bytes,
+                  path: Path) -> dict[str, str]:
+    """
+    Extracts the FoamFile header entries from the head of a file.
+
+    Parameters
+    ----------
+    head : bytes
+        The leading bytes of the file.
+    path : Path
+        The file path, used in error messages.
+
+    Returns
+    -------
+    dict[str, str]
+        The header entries.
+    """
+    match = _HEADER.search(_COMMENTS.sub(b'', head))
+    if not match:
+        raise ValueError(f'FoamFile header not found in file: {path}')
+
+    return {key.decode(): value.decode().strip('"')
+            for key, value in _HEADER_ENTRY.findall(match.group(1))}
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    """
+    Memory-maps a file for reading.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the file.
+
+    Returns
+    -------
+    mmap.mmap
+        A read-only mapping of the whole file.
+    """
+    with path.open('rb') as f:
+        if not path.stat().st_size:
+            raise ValueError(f'FoamFile header not found in file: {path}')
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _parse_uniform(data: bytes,
+                   start: int,
+                   value_type: str,
+                   n_cells: int | None,
+                   path: Path) -> np.ndarray:
+    """
+    Expands a uniform internal field value to all cells.
+
+    Parameters
+    ----------
+    data : bytes
+        The file content.
+    start : int
+        The offset of the value following the `uniform` keyword.
+    value_type : str
+        The primitive value type.
+    n_cells : int or None
+        The number of cells.
+    path : Path
+        The file path, used in error messages.
+
+    Returns
+    -------
+    np.ndarray
+        The expanded field.
+    """
+    if n_cells is None:
+        raise ValueError(
+            f'Number of cells required to expand uniform field: {path}')
+
+    end = data.find(b';', start)
+    value = _tokenize(data[start:end].strip(b'()'), path)
+    if value.size != _N_COMPONENTS[value_type]:
+        raise ValueError(f'Invalid uniform value in field file: {path}')
+
+    if value_type == 'scalar':
+        return np.full(n_cells, value[0])
+
+    return np.tile(value, (n_cells, 1))
+
+
+def _parse_list(data: mmap.mmap,
+                start: int,
+                path: Path,
+                scalar_dtype: np.dtype | None = None) -> np.ndarray:
+    """
+    Parses a `List<type>` following the `nonuniform` keyword.
+
+    Parameters
+    ----------
+    data : mmap.mmap
+        The mapped file content.
+    start : int
+        The offset of the list type following the `nonuniform` keyword.
+    path : Path
+        The file path, used in error messages.
+    scalar_dtype : np.dtype, optional
+        The scalar dtype of a binary payload. If None, the list is parsed
+        as ASCII. Default is None.
+
+    Returns
+    -------
+    np.ndarray
+        The parsed list, reshaped to (N,) or (N, n_components).
+    """
+    match = _LIST_START.match(data, start)
+    if not match or match.group(1).decode() not in _N_COMPONENTS:
+        raise ValueError(f'Invalid list in field file: {path}')
+
+    n_components = _N_COMPONENTS[match.group(1).decode()]
+    size = int(match.group(2))
+    body_start = match.end()
+
+    # Binary compact notation stores a single raw value
+    if scalar_dtype is not None and match.group(3) == b'{':
+        value = _read_binary(data, body_start, n_components,
+                             scalar_dtype, b'}', path)
+        values = np.tile(value, size)
+    elif scalar_dtype is not None:
+        values = _read_binary(data, body_start, size * n_components,
+                              scalar_dtype, b')', path)
+    # Compact notation for a list of equal values, e.g. 100{0}
+    elif match.group(3) == b'{':
+        body_end = data.find(b'}', body_start)
+        value = _tokenize(data[body_start:body_end].strip(b'()'), path)
+        values = np.tile(value, size)
+    else:
+        # The list ends at the first ';' after its body
+        body_end = data.find(b';', body_start)
+        body = data[body_start:body_end].rstrip().removesuffix(b')')
+        if n_components > 1:
+            body = body.translate(_PARENTHESES_TO_SPACES)
+        # Tokenize the whole list at once
+        values = _tokenize(body, path)
+
+    if values.size != size * n_components:
+        raise ValueError(
+            f'Expected {size} values of {n_components} components, '
+            f'found {values.size} components in field file: {path}')
+
+    if n_components == 1:
+        return values
+
+    return values.reshape(size, n_components)
+
+
+def _read_binary(data: mmap.mmap,
+                 start: int,
+                 count: int,
+                 dtype: np.dtype,
+                 closing: bytes,
+                 path: Path) -> np.ndarray:
+    """
+    Creates a zero-copy view of a binary list payload.
+
+    Parameters
+    ----------
+    data : mmap.mmap
+        The mapped file content.
+    start : int
+        The offset of the first payload byte.
+    count : int
+        The number of values (list size times number of components).
+    dtype : np.dtype
+        The dtype of the stored values.
+    closing : bytes
+        The closing bracket expected right after the payload.
+    path : Path
+        The file path, used in error messages.
+
+    Returns
+    -------
+    np.ndarray
+        A read-only 1D array backed by the mapping.
+    """
+    end = start + count * dtype.itemsize
+    if end >= len(data) or data[end:end + 1] != closing:
+        raise ValueError(f'Truncated binary list in field file: {path}')
+
+    return np.frombuffer(data, dtype=dtype, count=count, offset=start)
+
+
+def _tokenize(body: bytes,
+              path: Path,
+              dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Converts whitespace-separated numbers into a 1D array.
+
+    Parameters
+    ----------
+    body : bytes
+        The numbers to convert.
+    path : Path
+        The file path, used in error messages.
+    dtype : np.dtype, optional
+        The dtype of the numbers. Default is float64.
+
+    Returns
+    -------
+    np.ndarray
+        The converted numbers.
+    """
+    try:
+        return np.fromstring(body, dtype=dtype, sep=' ')
+    except (ValueError, DeprecationWarning) as e:
+        raise ValueError(f'Non-numerical value found in file: {path}') from e
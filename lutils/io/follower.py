@@ -0,0 +1,229 @@
+from pathlib import Path
+import numpy as np
+
+from lutils.core.types import DataFrame, Categorical
+from lutils.io.parser import _infer_residual_dtype, _parse_residual_columns
+from lutils.utils.buffer import GrowableArray
+
+
+class FileFollower:
+    """
+    Incrementally reads lines appended to a growing text file.
+
+    The reader remembers the byte offset of the last read, so each call only
+    reads the newly appended bytes. An incomplete last line is kept until it
+    is terminated. If the file is replaced or truncated, reading starts again
+    from the beginning.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the followed file. The file does not need to exist yet.
+    """
+
+    def __init__(self,
+                 path: Path) -> None:
+        self._path = Path(path)
+        self._offset = 0
+        self._inode = None
+        self._pending = b''
+
+    @property
+    def path(self):
+        """Path: The path to the followed file."""
+        return self._path
+
+    @property
+    def offset(self):
+        """int: The byte offset of the next read."""
+        return self._offset
+
+    def read_lines(self) -> tuple[str, bool]:
+        """
+        Reads the complete lines appended since the last call.
+
+        Returns
+        -------
+        tuple[str, bool]
+            The new complete lines, and True if the file was replaced or
+            truncated since the last call, in which case the lines are read
+            from the start of the new file.
+        """
+        if not self._path.exists():
+            return '', False
+
+        stat = self._path.stat()
+        # Detect file rotation or truncation
+        rotated = self._inode is not None and (
+            stat.st_ino != self._inode or stat.st_size < self._offset)
+        if rotated:
+            self._offset = 0
+            self._pending = b''
+        self._inode = stat.st_ino
+
+        # Read only the appended bytes
+        with self._path.open('rb') as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        self._offset += len(chunk)
+
+        # Keep the incomplete last line for the next call
+        chunk = self._pending + chunk
+        end = chunk.rfind(b'\n') + 1
+        self._pending = chunk[end:]
+
+        return chunk[:end].decode(), rotated
+
+
+class ResidualsFollower:
+    """
+    Incrementally parses the residuals file of a running OpenFOAM case.
+
+    Each call to `refresh` parses only the rows appended since the last call
+    and appends them to per-column growable buffers, so a refresh costs only
+    as much as the new output.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the residuals file (e.g. 'postProcessing/residuals/0/solverInfo.dat').
+    """
+
+    def __init__(self,
+                 path: Path) -> None:
+        self._follower = FileFollower(path)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Discards all parsed rows and the header."""
+        self._header = []
+        self._dtypes = []
+        self._columns = {}
+        self._categories = {}
+
+    @property
+    def header(self):
+        """list[str]: The column names, empty until the header is read."""
+        return self._header
+
+    @property
+    def data(self) -> DataFrame:
+        """DataFrame: A columnar DataFrame viewing the rows parsed so far."""
+        if not self._columns:
+            return DataFrame([], {})
+
+        columns = {}
+        for name, buffer in self._columns.items():
+            if name in self._categories:
+                columns[name] = Categorical(
+                    buffer.data, np.array(self._categories[name]))
+            else:
+                columns[name] = buffer.data
+
+        return DataFrame(self._header, columns)
+
+    def refresh(self) -> int:
+        """
+        Parses the rows appended to the residuals file since the last call.
+
+        Returns
+        -------
+        int
+            The number of new rows.
+        """
+        text, rotated = self._follower.read_lines()
+        if rotated:
+            self._reset()
+
+        # Separate comment lines, the last one holds the column names
+        lines = text.splitlines()
+        body_start = 0
+        while body_start < len(lines) and lines[body_start].startswith('#'):
+            self._header = lines[body_start].strip('#').split()
+            body_start += 1
+        rows = [line for line in lines[body_start:] if line.strip()]
+        if not rows or not self._header:
+            return 0
+
+        # Infer column types from the first row, create buffers
+        if not self._columns:
+            self._init_columns(rows[0].split())
+
+        columns = _parse_residual_columns(
+            self._header, self._dtypes, '\n'.join(rows))
+        for name, values in columns.items():
+            if name in self._categories:
+                values = self._encode(name, values)
+            # Iteration counts with missing values ('N/A') are kept as float64, as by `parse_residuals`
+            elif values.dtype.kind == 'f' and self._columns[name].dtype.kind != 'f':
+                self._promote(name)
+            self._columns[name].append(values)
+
+        return len(rows)
+
+    def _init_columns(self,
+                      first_row: list[str]) -> None:
+        """
+        Creates the column buffers using the types inferred from the first row.
+
+        Parameters
+        ----------
+        first_row : list[str]
+            The tokens of the first data row.
+        """
+        self._dtypes = [_infer_residual_dtype(name, token)
+                        for name, token in zip(self._header, first_row)]
+        for name, t in zip(self._header, self._dtypes):
+            if t == 'category':
+                self._categories[name] = []
+            self._columns[name] = GrowableArray(_BUFFER_DTYPES[t])
+
+    def _promote(self,
+                 name: str) -> None:
+        """
+        Converts the buffer of an integer column to float64.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+        """
+        buffer = GrowableArray(np.float64, max(self._columns[name].capacity, 1))
+        buffer.append(self._columns[name].data)
+        self._columns[name] = buffer
+
+    def _encode(self,
+                name: str,
+                values: Categorical) -> np.ndarray:
+        """
+        Maps the codes of a parsed chunk to the codes of the whole column.
+
+        Parameters
+        ----------
+        name : str
+            The categorical column name.
+        values : Categorical
+            The parsed chunk of the column.
+
+        Returns
+        -------
+        np.ndarray
+            The codes into the column categories.
+        """
+        categories = self._categories[name]
+        for category in values.categories:
+            if category not in categories:
+                categories.append(category)
+        mapping = np.array([categories.index(c) for c in values.categories],
+                           dtype=np.uint16)
+
+        return mapping[values.codes]
+
+
+# Buffer dtypes of the residuals file column types
+_BUFFER_DTYPES = {
+    'float': np.float64,
+    'int': np.int32,
+    'bool': np.bool_,
+    'category': np.uint16
+}
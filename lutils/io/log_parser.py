@@ -0,0 +1,220 @@
+from pathlib import Path
+import numpy as np
+import re
+
+from lutils.core.types import DataFrame, Categorical
+from lutils.utils.buffer import GrowableArray
+
+
+# Precompile combined regex for all parsed record types
+_RECORD = re.compile(
+    rb'^(?:Time = (?P<time>[-+]?[\d.]+(?:[eE][-+]?\d+)?)[ \t]*[a-zA-Z]*[ \t\r]*$'
+    rb'|(?P<solver>\w+):\s+Solving for (?P<field>\w+), '
+    rb'Initial residual = (?P<initial>\S+), '
+    rb'Final residual = (?P<final>\S+), '
+    rb'No Iterations (?P<iters>\d+)'
+    rb'|ExecutionTime = (?P<exec>\S+) s\s+ClockTime = (?P<clock>\S+) s)',
+    re.MULTILINE)
+
+# Default size of the chunks read from the log
+_CHUNK_SIZE = 1 << 24
+
+
+def parse_solver_log(path: Path,
+                     chunk_size: int = _CHUNK_SIZE) -> DataFrame:
+    """
+    Parses the solver records and timings of an OpenFOAM solver log.
+
+    The log is read in chunks of `chunk_size` bytes, so memory use does not
+    depend on the log size. Each time step becomes one row with the columns
+    'Time', 'ExecutionTime', 'ClockTime' and, for every solved field in the
+    order of first appearance, '<field>_solver', '<field>_initial',
+    '<field>_final' and '<field>_iters'. Time lines may carry a unit suffix,
+    e.g. 'Time = 1s'.
+
+    If a field is solved several times per time step, the initial residual of
+    the first solve, the final residual of the last solve and the total number
+    of iterations are stored. Fields not solved in a time step are stored as
+    NaN, -1 iterations and an empty solver name.
+
+    Parameters
+    ----------
+    path : Path
+        The file path to the solver log (e.g. 'log.simpleFoam').
+    chunk_size : int, optional
+        The number of bytes read at once. Default is 16 MiB.
+
+    Returns
+    -------
+    DataFrame
+        A columnar DataFrame with one row per time step.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the log file does not exist.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Solver log not found at: {path}')
+
+    table = _LogTable()
+    with path.open('rb') as f:
+        rest = b''
+        while True:
+            chunk = f.read(chunk_size)
+            # Parse complete lines, keep the rest for the next chunk
+            data = rest + chunk
+            end = data.rfind(b'\n') + 1 if chunk else len(data)
+            for match in _RECORD.finditer(data, 0, end):
+                table.add_record(match)
+            table.flush()
+            rest = data[end:]
+            if not chunk:
+                break
+    table.end_step()
+    table.flush()
+
+    return table.to_dataframe()
+
+
+class _LogTable:
+    """
+    Accumulates the parsed log records into per-column growable buffers.
+
+    Finished time steps are collected as rows and moved into the buffers in
+    batches by `flush`.
+    """
+
+    def __init__(self) -> None:
+        self._n_rows = 0
+        self._rows = []
+        self._header = ['Time', 'ExecutionTime', 'ClockTime']
+        self._columns = {name: GrowableArray(np.float64)
+                         for name in self._header}
+        self._solvers = {}
+        self._step = None
+
+    def add_record(self,
+                   match: re.Match) -> None:
+        """
+        Adds a single matched log record to the current time step.
+
+        Parameters
+        ----------
+        match : re.Match
+            A match of the combined record regex.
+        """
+        if match['time'] is not None:
+            self.end_step()
+            self._step = {'Time': float(match['time'])}
+        elif self._step is None:
+            return
+        elif match['field'] is not None:
+            field = match['field'].decode()
+            iters = int(match['iters'])
+            # Repeated solve in the same time step
+            if f'{field}_initial' in self._step:
+                self._step[f'{field}_final'] = float(match['final'])
+                self._step[f'{field}_iters'] += iters
+            else:
+                self._step[f'{field}_solver'] = match['solver'].decode()
+                self._step[f'{field}_initial'] = float(match['initial'])
+                self._step[f'{field}_final'] = float(match['final'])
+                self._step[f'{field}_iters'] = iters
+        else:
+            self._step['ExecutionTime'] = float(match['exec'])
+            self._step['ClockTime'] = float(match['clock'])
+
+    def end_step(self) -> None:
+        """Finishes the current time step."""
+        if self._step is not None:
+            self._rows.append(self._step)
+            self._step = None
+
+    def flush(self) -> None:
+        """Appends the finished time steps to the column buffers."""
+        if not self._rows:
+            return
+
+        # Create columns of newly solved fields, backfill earlier rows
+        for row in self._rows:
+            for name in row:
+                if name not in self._columns:
+                    self._add_field(name.rsplit('_', 1)[0])
+
+        for name in self._header:
+            buffer = self._columns[name]
+            if name.endswith('_solver'):
+                values = [self._encode(name, row.get(name, ''))
+                          for row in self._rows]
+            elif name.endswith('_iters'):
+                values = [row.get(name, -1) for row in self._rows]
+            else:
+                values = [row.get(name, np.nan) for row in self._rows]
+            buffer.append(np.array(values, dtype=buffer.dtype))
+
+        self._n_rows += len(self._rows)
+        self._rows = []
+
+    def _add_field(self,
+                   field: str) -> None:
+        """
+        Creates the columns of a field, filled with missing values for earlier rows.
+
+        Parameters
+        ----------
+        field : str
+            The solved field name.
+        """
+        self._solvers[f'{field}_solver'] = ['']
+        for suffix, dtype, missing in (('solver', np.uint16, 0),
+                                       ('initial', np.float64, np.nan),
+                                       ('final', np.float64, np.nan),
+                                       ('iters', np.int32, -1)):
+            name = f'{field}_{suffix}'
+            self._header.append(name)
+            self._columns[name] = GrowableArray(dtype)
+            self._columns[name].append(np.full(self._n_rows, missing, dtype=dtype))
+
+    def _encode(self,
+                name: str,
+                solver: str) -> int:
+        """
+        Returns the categorical code of a solver name.
+
+        Parameters
+        ----------
+        name : str
+            The solver column name.
+        solver : str
+            The solver name.
+
+        Returns
+        -------
+        int
+            The code of `solver` in the column categories.
+        """
+        categories = self._solvers[name]
+        if solver not in categories:
+            categories.append(solver)
+
+        return categories.index(solver)
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Converts the accumulated buffers into a columnar DataFrame.
+
+        Returns
+        -------
+        DataFrame
+            The parsed log table.
+        """
+        columns = {}
+        for name in self._header:
+            values = self._columns[name].trim()
+            if name in self._solvers:
+                columns[name] = Categorical(values, np.array(self._solvers[name]))
+            else:
+                columns[name] = values
+
+        return DataFrame(self._header, columns)
@@ -0,0 +1,318 @@
+from pathlib import Path
+import numpy as np
+import re
+
+from lutils.core.types import RaggedArray
+from lutils.io.foam_parser import (_HEADER, _HEAD_SIZE, _PARENTHESES_TO_SPACES, _map_file,
+                                   _parse_header, _read_binary, _tokenize, get_binary_dtypes)
+
+
+# Number of components of the list element types
+_ELEMENT_COMPONENTS = {
+    'label': 1,
+    'scalar': 1,
+    'vector': 3
+}
+# List element types of the polyMesh file classes
+_CLASS_ELEMENTS = {
+    'labelList': 'label',
+    'scalarField': 'scalar',
+    'vectorField': 'vector'
+}
+
+# Precompile regex to save time
+_LIST_HEAD = re.compile(rb'(\d+)\s*\(')
+_VECTOR_LIST_END = re.compile(rb'\)\s*\)')
+_PATCH = re.compile(r'(\w+)\s*\{([^}]*)\}')
+_PATCH_ENTRY = re.compile(r'(\w+)\s+([^;]*?)\s*;')
+_ZONE = re.compile(rb'(\w+)\s*\{[^{}]*?(?:cellLabels|faceLabels|pointLabels)\s+List<label>\s*')
+
+
+def parse_foam_list(path: Path) -> np.ndarray:
+    """
+    Parses a top-level list file of a polyMesh, e.g. 'points' or 'owner'.
+
+    Both ASCII and binary formats are supported. Binary payloads are returned
+    as read-only views into a memory mapping of the file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the list file.
+
+    Returns
+    -------
+    np.ndarray
+        A label (int) array of shape (N,) for labelList files, or a scalar
+        array of shape (N,) or (N, 3) for scalarField and vectorField files.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file class is not a supported list class or the list is invalid.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'List file not found at: {path}')
+
+    data = _map_file(path)
+    header = _parse_header(data[:_HEAD_SIZE], path)
+    element = _CLASS_ELEMENTS.get(header.get('class', ''))
+    if element is None:
+        raise ValueError(f'Unsupported list class: "{header.get("class")}"')
+
+    values, _ = _read_list(data, _body_start(data), element, header, path)
+
+    return values
+
+
+def parse_foam_faces(path: Path) -> RaggedArray:
+    """
+    Parses a polyMesh 'faces' file into a RaggedArray of point labels.
+
+    Handles ASCII `faceList` files, e.g. '4(0 1 2 3)' per face, and
+    `faceCompactList` files (ASCII or binary) storing the face offsets and
+    the concatenated point labels as two lists.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the faces file.
+
+    Returns
+    -------
+    RaggedArray
+        The point labels of each face in CSR form.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file class or format is not supported.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Faces file not found at: {path}')
+
+    data = _map_file(path)
+    header = _parse_header(data[:_HEAD_SIZE], path)
+    start = _body_start(data)
+
+    if header.get('class') == 'faceCompactList':
+        offsets, end = _read_list(data, start, 'label', header, path)
+        values, _ = _read_list(data, end, 'label', header, path)
+        return RaggedArray(offsets, values)
+
+    if header.get('class') != 'faceList' or header.get('format') == 'binary':
+        raise ValueError(
+            f'Unsupported faces class: "{header.get("class")}" in file: {path}')
+
+    # Tokens alternate between the face size and its point labels
+    match = _LIST_HEAD.search(data, start)
+    body = data[match.end():data.rfind(b')')]
+    flat = _tokenize(body.translate(_PARENTHESES_TO_SPACES), path, np.int64)
+
+    # The face sizes are the tokens right before each opening bracket
+    chars = np.frombuffer(body, dtype=np.uint8)
+    is_digit = (chars >= ord('0')) & (chars <= ord('9'))
+    token_starts = np.flatnonzero(is_digit[1:] & ~is_digit[:-1]) + 1
+    if is_digit[:1].any():
+        token_starts = np.concatenate([[0], token_starts])
+    size_idx = np.searchsorted(token_starts, np.flatnonzero(chars == ord('('))) - 1
+    counts = flat[size_idx]
+    if counts.size != int(match.group(1)) or flat.size != counts.sum() + counts.size:
+        raise ValueError(f'Invalid face list in file: {path}')
+
+    # Drop the face sizes, keep the point labels
+    is_label = np.ones(flat.size, dtype=bool)
+    is_label[size_idx] = False
+
+    return RaggedArray.from_counts(counts, flat[is_label].astype(np.int32))
+
+
+def parse_foam_boundary(path: Path) -> dict[str, dict[str, str | int]]:
+    """
+    Parses a polyMesh 'boundary' file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the boundary file.
+
+    Returns
+    -------
+    dict[str, dict[str, str | int]]
+        A dictionary mapping patch names to their entries, with 'nFaces' and
+        'startFace' converted to int.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Boundary file not found at: {path}')
+
+    data = _map_file(path)
+    body = data[_body_start(data):].decode()
+
+    patches = {}
+    for name, entries in _PATCH.findall(body):
+        patch = dict(_PATCH_ENTRY.findall(entries))
+        for key in ('nFaces', 'startFace'):
+            patch[key] = int(patch[key])
+        patches[name] = patch
+
+    return patches
+
+
+def parse_foam_set(path: Path,
+                   set_class: str | None = None) -> np.ndarray:
+    """
+    Parses a topoSet file (e.g. 'constant/polyMesh/sets/surfaceCells').
+
+    Parameters
+    ----------
+    path : Path
+        The path to the set file.
+    set_class : str, optional
+        The required header class, e.g. 'cellSet', 'faceSet' or 'pointSet'.
+        If None, sets of any class are read. Default is None.
+
+    Returns
+    -------
+    np.ndarray
+        The labels of the set members as an int32 array.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the header class is not `set_class`.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Set file not found at: {path}')
+
+    data = _map_file(path)
+    header = _parse_header(data[:_HEAD_SIZE], path)
+    if set_class is not None and header.get('class') != set_class:
+        raise ValueError(f'Set file is a {header.get("class")}, expected a {set_class}: {path}')
+    labels, _ = _read_list(data, _body_start(data), 'label', header, path)
+
+    return labels.astype(np.int32)
+
+
+def parse_foam_zones(path: Path) -> dict[str, np.ndarray]:
+    """
+    Parses a zones file (e.g. 'constant/polyMesh/cellZones').
+
+    Parameters
+    ----------
+    path : Path
+        The path to the zones file.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        A dictionary mapping zone names to the labels of their members as
+        int32 arrays.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Zones file not found at: {path}')
+
+    data = _map_file(path)
+    header = _parse_header(data[:_HEAD_SIZE], path)
+
+    zones = {}
+    end = _body_start(data)
+    while match := _ZONE.search(data, end):
+        labels, end = _read_list(data, match.end(), 'label', header, path)
+        zones[match.group(1).decode()] = labels.astype(np.int32)
+
+    return zones
+
+
+def _body_start(data) -> int:
+    """
+    Returns the offset following the FoamFile header.
+
+    Parameters
+    ----------
+    data : mmap.mmap
+        The mapped file content.
+
+    Returns
+    -------
+    int
+        The offset of the first byte after the header.
+    """
+    return _HEADER.search(data[:_HEAD_SIZE]).end()
+
+
+def _read_list(data,
+               start: int,
+               element: str,
+               header: dict[str, str],
+               path: Path) -> tuple[np.ndarray, int]:
+    """
+    Reads the first list of `element` values following `start`.
+
+    Parameters
+    ----------
+    data : mmap.mmap
+        The mapped file content.
+    start : int
+        The offset to search the list from.
+    element : str
+        The element type, 'label', 'scalar' or 'vector'.
+    header : dict[str, str]
+        The parsed FoamFile header.
+    path : Path
+        The file path, used in error messages.
+
+    Returns
+    -------
+    tuple[np.ndarray, int]
+        The parsed list and the offset following its closing bracket.
+    """
+    match = _LIST_HEAD.search(data, start)
+    if not match:
+        raise ValueError(f'List not found in file: {path}')
+
+    size = int(match.group(1))
+    n_components = _ELEMENT_COMPONENTS[element]
+    body_start = match.end()
+
+    # Binary payload
+    if header.get('format') == 'binary':
+        label_dtype, scalar_dtype = get_binary_dtypes(header)
+        dtype = label_dtype if element == 'label' else scalar_dtype
+        values = _read_binary(data, body_start, size * n_components, dtype, b')', path)
+        end = body_start + values.nbytes + 1
+    # ASCII list, vectors end with two closing brackets
+    else:
+        if n_components > 1 and size:
+            end = _VECTOR_LIST_END.search(data, body_start).end()
+        else:
+            end = data.find(b')', body_start) + 1
+        body = data[body_start:end - 1]
+        if n_components > 1:
+            body = body.translate(_PARENTHESES_TO_SPACES)
+        values = _tokenize(body, path, np.int32 if element == 'label' else np.float64)
+
+    if values.size != size * n_components:
+        raise ValueError(
+            f'Expected {size} values of {n_components} components, '
+            f'found {values.size} components in file: {path}')
+
+    if n_components > 1:
+        values = values.reshape(size, n_components)
+
+    return values, end
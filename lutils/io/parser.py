@@ -1,56 +1,215 @@
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 import numpy as np
+import warnings
 import yaml
+import re
 
-from lutils.core.types import DataFrame
+from lutils.core.types import DataFrame, Categorical, RaggedArray
 from lutils.plt_cfg.labels import Labels
 
 
-def parse_internal_field(path: Path) -> DataFrame:
+# Precompiled patterns matching blank lines and empty CSV cells
+_BLANK_LINES = re.compile(r'^\s*$\n?', re.MULTILINE)
+_EMPTY_CELL = re.compile(r'(?<![^,\n])(?![^,\r\n])')
+
+# Interpolation info patterns, label columns
+_LIST_CELL = re.compile(r'^\d+\s*\(')
+_LIST_COUNT = re.compile(r',(\d+)\(')
+_BLANK_LINE = re.compile(r'\n\s*(?=\n)')
+_SEPARATORS_TO_SPACES = str.maketrans(',()\n', '    ')
+_LABEL_COLUMNS = {'cellI', 'inCellI', 'order'}
+
+# Storage dtypes of the residuals file column types, categories are read as
+# Python strings so that names of any length are kept whole
+_RESIDUAL_DTYPES = {
+    'float': np.float64,
+    'int': np.int32,
+    'bool': 'U5',
+    'category': object
+}
+
+
+def parse_internal_field(path: Path,
+                         spill_dir: Path | None = None,
+                         chunk_size: int = 1 << 16,
+                         dtype: np.dtype = np.float64) -> DataFrame:
     """
     Parses a CSV-style internal field file into a DataFrame.
 
     This function expects a comma-separated format where the first line contains
-    headers and subsequent lines contain numerical data.
+    headers and subsequent lines contain numerical data. The data body is
+    tokenized in bulk by NumPy into a single `dtype` block, empty cells are
+    converted to NaN.
+
+    If `spill_dir` is given, the body is tokenized in chunks of `chunk_size`
+    lines which are streamed into memory-mapped columns in `spill_dir`, see
+    `DataFrame.from_chunks`. The peak memory is then bounded by the chunk
+    size instead of the file size.
 
     Parameters
     ----------
     path : Path
         The file path to the CSV data file.
+    spill_dir : Path, optional
+        The directory of the spill files of out-of-core parsing. Default is None.
+    chunk_size : int, optional
+        The number of lines tokenized at once when spilling. Default is 65536.
+    dtype : np.dtype, optional
+        The storage dtype, e.g. np.float32 to halve the memory. The text is
+        converted directly, without an intermediate float64 copy.
+        Default is np.float64.
 
     Returns
     -------
     DataFrame
         A DataFrame instance containing the parsed numerical data.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the data body contains non-numerical values or rows of
+        inconsistent length.
     """
     if not path.exists():
         raise FileNotFoundError(f'Internal field file not found at: {path}')
-    # Open and parse file
+    # Open file, separate header
     with path.open() as f:
-        lines = f.readlines()
-        # Separate header
-        header = lines[0].strip().split(',')
-        data = []
-        for line in lines[1:]:
-            # Skip empty lines
-            if not line.strip():
-                continue
-            values = line.strip().split(',')
-            # Convert to float, convert to np.nan for empty cells
-            row = [float(x) if x else np.nan for x in values]
-            data.append(row)
-    # Convert the list into np.ndarray
-    arr = np.array(data)
+        header = f.readline().strip().split(',')
+        # Stream the data body in chunks
+        if spill_dir is not None:
+            chunks = _iter_csv_chunks(f, len(header), chunk_size, path, dtype)
+            return DataFrame.from_chunks(header, chunks, spill_dir)
+        # Tokenize the data body in bulk
+        try:
+            arr = _load_csv_block(f, len(header), dtype)
+        except ValueError:
+            # Fall back to substituting empty cells with nan
+            f.seek(0)
+            f.readline()
+            arr = _load_csv_text(f.read(), len(header), path, dtype)
 
     return DataFrame(header, arr)
 
 
+def _iter_csv_chunks(f,
+                     n_cols: int,
+                     chunk_size: int,
+                     path: Path,
+                     dtype: np.dtype = np.float64) -> Iterator[np.ndarray]:
+    """
+    Tokenizes the remaining lines of a CSV file in chunks.
+
+    Parameters
+    ----------
+    f : file object
+        The open file, positioned after the header.
+    n_cols : int
+        The number of columns given by the header.
+    chunk_size : int
+        The number of lines per chunk.
+    path : Path
+        The file path, used in error messages.
+    dtype : np.dtype, optional
+        The dtype of the values. Default is np.float64.
+
+    Yields
+    ------
+    np.ndarray
+        A 2D array of at most `chunk_size` rows.
+    """
+    while lines := list(islice(f, chunk_size)):
+        try:
+            arr = _load_csv_block(lines, n_cols, dtype)
+        except ValueError:
+            arr = _load_csv_text(''.join(lines), n_cols, path, dtype)
+        yield arr
+
+
+def _load_csv_text(body: str,
+                   n_cols: int,
+                   path: Path,
+                   dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Converts comma-separated text with empty cells into a 2D array.
+
+    Blank lines are removed and empty cells are substituted with NaN.
+
+    Parameters
+    ----------
+    body : str
+        The data lines, excluding the header.
+    n_cols : int
+        The number of columns given by the header.
+    path : Path
+        The file path, used in error messages.
+    dtype : np.dtype, optional
+        The dtype of the values. Default is np.float64.
+
+    Returns
+    -------
+    np.ndarray
+        A 2D array of shape (rows, n_cols).
+
+    Raises
+    ------
+    ValueError
+        If the text contains non-numerical values or rows of inconsistent length.
+    """
+    body = _BLANK_LINES.sub('', body).rstrip()
+    body = _EMPTY_CELL.sub('nan', body)
+    try:
+        return _load_csv_block(body.splitlines(), n_cols, dtype)
+    except ValueError as e:
+        raise ValueError(
+            f'Invalid internal field file at: {path}. {e}') from e
+
+
+def _load_csv_block(lines,
+                    n_cols: int,
+                    dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Converts comma-separated lines into a 2D array.
+
+    Parameters
+    ----------
+    lines : file object or list[str]
+        The data lines, excluding the header.
+    n_cols : int
+        The number of columns given by the header.
+    dtype : np.dtype, optional
+        The dtype of the values. Default is np.float64.
+
+    Returns
+    -------
+    np.ndarray
+        A 2D array of shape (rows, n_cols).
+    """
+    # Silence the empty input warning, handled by the reshape below
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        arr = np.loadtxt(lines, delimiter=',', dtype=dtype, ndmin=2)
+
+    if arr.size == 0:
+        return arr.reshape(0, n_cols)
+    if arr.shape[1] != n_cols:
+        raise ValueError(
+            f'Expected {n_cols} columns, found {arr.shape[1]}.')
+
+    return arr
+
+
 def parse_residuals(path: Path) -> DataFrame:
     """
     Parses an OpenFOAM residuals file into a DataFrame.
 
     This function specifically handles OpenFOAM formatted logs where the header
     is located on the second line (prefixed with '#') and fields are whitespace-separated.
+    The table is parsed in a single pass into typed columns, see
+    `_infer_residual_dtype`.
 
     Parameters
     ----------
@@ -60,38 +219,286 @@ def parse_residuals(path: Path) -> DataFrame:
     Returns
     -------
     DataFrame
-        A DataFrame containing the residuals data. Values are converted to floats
-        where possible; otherwise, they are kept as strings or NaN.
+        A columnar DataFrame containing the residuals data. Residuals are
+        stored as float64, iteration counts as int32, convergence flags as
+        bool and solver names as Categorical columns.
     """
     # Check if file exists
     if not path.exists():
         raise FileNotFoundError(f'Residuals file not found at: {path}')
     # Open and parse file
     with path.open() as f:
-        lines = f.readlines()
+        f.readline()
         # Separate header
-        header = lines[1].strip('#').split()
-        data = []
-        for line in lines[2:]:
-            # Skip empty lines
-            if not line.strip():
-                continue
-            values = line.strip().split()
-            # Convert to float, if non convertable leave as is, covnert to np.nan for empty cells
-            row = []
-            for x in values:
-                if x:
-                    try:
-                        row.append(float(x))
-                    except:
-                        row.append(x)
-                else:
-                    row.append(np.nan)
-            data.append(row)
-    # Convert the list into np.ndarray
-    arr = np.array(data)
+        header = f.readline().strip('#').split()
+        body = f.read()
 
-    return DataFrame(header, arr)
+    # Infer column types from the names and the first row
+    first_row = body.lstrip().split('\n', 1)[0].split()
+    if not first_row:
+        return DataFrame(header, {name: np.empty(0) for name in header})
+    dtypes = [_infer_residual_dtype(name, token)
+              for name, token in zip(header, first_row)]
+
+    return DataFrame(header, _parse_residual_columns(header, dtypes, body))
+
+
+def _infer_residual_dtype(name: str,
+                          token: str) -> str:
+    """
+    Infers the column type of a residuals file column.
+
+    Parameters
+    ----------
+    name : str
+        The column name, e.g. 'Ux_initial', 'p_iters' or 'k_solver'.
+    token : str
+        The column value in the first row.
+
+    Returns
+    -------
+    str
+        One of 'float', 'int', 'bool' or 'category'.
+    """
+    if name.endswith('_iters'):
+        return 'int'
+    if name.endswith('_converged') or token in ('true', 'false'):
+        return 'bool'
+    if name.endswith('_solver'):
+        return 'category'
+    try:
+        float(token)
+        return 'float'
+    except ValueError:
+        return 'category'
+
+
+def _parse_residual_columns(header: list[str],
+                            dtypes: list[str],
+                            body: str) -> dict[str, np.ndarray]:
+    """
+    Converts the whitespace-separated residuals body into typed columns.
+
+    Values missing in some time steps ('N/A') are converted to NaN, in which
+    case iteration counts are kept as float64.
+
+    Parameters
+    ----------
+    header : list[str]
+        The column names.
+    dtypes : list[str]
+        The column types given by `_infer_residual_dtype`.
+    body : str
+        The data body without the header lines.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        A dictionary mapping the column names to contiguous 1D arrays.
+    """
+    if 'N/A' in body:
+        body = body.replace('N/A', 'nan')
+        dtypes = ['float' if t == 'int' else t for t in dtypes]
+
+    # Parse all columns at once into a structured array
+    record = np.dtype([(name, _RESIDUAL_DTYPES[t])
+                       for name, t in zip(header, dtypes)])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        table = np.loadtxt(body.splitlines(), dtype=record, ndmin=1)
+
+    columns = {}
+    for name, t in zip(header, dtypes):
+        if t == 'bool':
+            columns[name] = table[name] == 'true'
+        elif t == 'category':
+            # Let NumPy infer the string width from the longest value
+            columns[name] = Categorical.from_values(table[name].astype(str))
+        else:
+            columns[name] = np.ascontiguousarray(table[name])
+
+    return columns
+
+
+def parse_interpolation_info(path: Path) -> dict[str, np.ndarray | RaggedArray]:
+    """
+    Parses an openHFDIBRANS interpolation info file into typed columns.
+
+    The file is a comma-separated table whose cells are scalars, vectors
+    such as '(0.1 0.2 0.3)' or variable-length lists such as
+    '3((...) (...) (...))' and '2(35736 35336)'. The whole body is tokenized
+    at once into a flat array, the columns are then gathered by offsets
+    computed from the list lengths, without iterating over rows.
+
+    Parameters
+    ----------
+    path : Path
+        The file path to the interpolation info file.
+
+    Returns
+    -------
+    dict[str, np.ndarray | RaggedArray]
+        A dictionary mapping the column names to (N,) arrays for scalars,
+        (N, 3) arrays for vectors and RaggedArray (CSR) columns for lists.
+        Cell labels, label lists and interpolation orders are stored as int32.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the rows do not match the header.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'Interpolation info file not found at: {path}')
+    # Open file, separate header
+    with path.open() as f:
+        header = f.readline().strip().split(',')
+        body = _BLANK_LINE.sub('', f.read()).strip()
+
+    if not body:
+        return {name: np.empty(0) for name in header}
+
+    # Column layout given by the first row
+    layout = _get_interpolation_layout(header, body.split('\n', 1)[0])
+    n_rows = body.count('\n') + 1
+    rows = body
+
+    # List lengths of all list columns, in row order, every list follows a comma
+    if layout[0][0] == 'list':
+        body = ',' + body.replace('\n', '\n,')
+    counts = np.array(_LIST_COUNT.findall(body), dtype=np.int64)
+    n_lists = sum(kind == 'list' for kind, _ in layout)
+    if counts.size != n_rows * n_lists:
+        raise ValueError(
+            f'Inconsistent number of lists in interpolation info file: {path}')
+    counts = counts.reshape(n_rows, n_lists)
+
+    # Item width of the lists empty in the first row from the first non-empty
+    # list of the column, columns empty in every row are read as label lists
+    list_columns = [idx for idx, (kind, _) in enumerate(layout) if kind == 'list']
+    for list_idx, idx in enumerate(list_columns):
+        if layout[idx][1] == 0:
+            filled = np.flatnonzero(counts[:, list_idx])
+            if filled.size:
+                row = rows.split('\n')[filled[0]]
+                layout[idx] = _get_interpolation_layout(header, row)[idx]
+            else:
+                layout[idx] = ('list', 1)
+
+    # Tokenize the whole body at once
+    try:
+        flat = np.fromstring(body.translate(_SEPARATORS_TO_SPACES), sep=' ')
+    except (ValueError, DeprecationWarning) as e:
+        raise ValueError(
+            f'Non-numerical value found in interpolation info file: {path}') from e
+
+    # Number of tokens in each row, fixed columns plus list lengths and items
+    n_fixed = sum(width for kind, width in layout if kind != 'list')
+    list_widths = np.array([width for kind, width in layout if kind == 'list'],
+                           dtype=np.int64)
+    row_tokens = n_fixed + (1 + counts * list_widths).sum(axis=1)
+    if flat.size != row_tokens.sum():
+        raise ValueError(
+            f'Inconsistent number of columns in interpolation info file: {path}')
+
+    # Gather the columns, pos holds the current token of each row
+    pos = np.concatenate(([0], np.cumsum(row_tokens)[:-1]))
+    columns = {}
+    list_idx = 0
+    for name, (kind, width) in zip(header, layout):
+        if kind == 'scalar':
+            values = flat[pos]
+            n_tokens = 1
+        elif kind == 'vector':
+            values = flat[pos[:, None] + np.arange(width)]
+            n_tokens = width
+        else:
+            # List items follow the list length token
+            n_items = counts[:, list_idx] * width
+            items = _gather_ragged(flat, pos + 1, n_items)
+            items = items.reshape(-1, width) if width > 1 else items.astype(np.int32)
+            values = RaggedArray.from_counts(counts[:, list_idx], items)
+            n_tokens = 1 + n_items
+            list_idx += 1
+
+        if name in _LABEL_COLUMNS:
+            values = values.astype(np.int32)
+        columns[name] = values
+        pos = pos + n_tokens
+
+    return columns
+
+
+def _get_interpolation_layout(header: list[str],
+                              row: str) -> list[tuple[str, int]]:
+    """
+    Determines the kind and number of components of each column from a row.
+
+    Parameters
+    ----------
+    header : list[str]
+        The column names.
+    row : str
+        The data row.
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        The kind ('scalar', 'vector' or 'list') and the number of components
+        of a value (of a list item for lists) of each column. The width of
+        an empty list, e.g. 0(), is unknown and given as 0.
+    """
+    cells = row.split(',')
+    if len(cells) != len(header):
+        raise ValueError('Interpolation info row does not match the header.')
+
+    layout = []
+    for cell in cells:
+        cell = cell.strip()
+        # Variable-length list, e.g. 2(35736 35336) or 3((...) (...) (...))
+        if _LIST_CELL.match(cell):
+            items = cell[cell.index('(') + 1:].strip()
+            if items.startswith(')'):
+                width = 0
+            elif items.startswith('('):
+                width = len(items[1:items.find(')')].split())
+            else:
+                width = 1
+            layout.append(('list', width))
+        # Vector, e.g. (0.1 0.2 0.3)
+        elif cell.startswith('('):
+            layout.append(('vector', len(cell.strip('()').split())))
+        else:
+            layout.append(('scalar', 1))
+
+    return layout
+
+
+def _gather_ragged(flat: np.ndarray,
+                   starts: np.ndarray,
+                   n_items: np.ndarray) -> np.ndarray:
+    """
+    Concatenates variable-length runs of a flat array.
+
+    Parameters
+    ----------
+    flat : np.ndarray
+        The flat source array.
+    starts : np.ndarray
+        The start index of each run.
+    n_items : np.ndarray
+        The length of each run.
+
+    Returns
+    -------
+    np.ndarray
+        The concatenated runs.
+    """
+    run_offsets = np.cumsum(n_items) - n_items
+    local = np.arange(n_items.sum()) - np.repeat(run_offsets, n_items)
+
+    return flat[np.repeat(starts, n_items) + local]
 
 
 def parse_yaml_config(cfg_path: str) -> dict[str, str]:
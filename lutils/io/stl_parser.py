@@ -0,0 +1,60 @@
+from pathlib import Path
+import numpy as np
+import re
+
+
+# Size of the binary header and of one binary facet record
+_BINARY_HEADER = 80
+_BINARY_FACET = np.dtype([('normal', '<f4', 3),
+                          ('vertices', '<f4', (3, 3)),
+                          ('attribute', '<u2')])
+
+# Precompile regex to save time
+_VERTEX = re.compile(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)')
+
+
+def parse_stl(path: Path) -> np.ndarray:
+    """
+    Parses the triangles of an ASCII or binary STL file.
+
+    All solids of the file are merged. The facet normals stored in the file
+    are ignored, the orientation is given by the vertex order.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the STL file.
+
+    Returns
+    -------
+    np.ndarray
+        The float64 triangle vertices, of shape (F, 3, 3).
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file contains no triangles.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f'STL file not found at: {path}')
+
+    data = path.read_bytes()
+
+    # Binary files state their facet count after the header
+    if len(data) >= _BINARY_HEADER + 4:
+        n_facets = int(np.frombuffer(data, dtype='<u4', count=1, offset=_BINARY_HEADER)[0])
+        if len(data) == _BINARY_HEADER + 4 + n_facets * _BINARY_FACET.itemsize:
+            if n_facets == 0:
+                raise ValueError(f'No triangles found in file: {path}')
+            facets = np.frombuffer(data, dtype=_BINARY_FACET, count=n_facets,
+                                   offset=_BINARY_HEADER + 4)
+            return facets['vertices'].astype(np.float64)
+
+    # ASCII files list three vertices per facet
+    vertices = np.array(_VERTEX.findall(data), dtype=np.float64)
+    if len(vertices) == 0 or len(vertices) % 3:
+        raise ValueError(f'No triangles found in file: {path}')
+
+    return vertices.reshape(-1, 3, 3)
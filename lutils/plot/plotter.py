@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import matplotlib.figure as fgr
+import numpy as np
 from pathlib import Path
 from typing import cast
 
@@ -94,7 +95,7 @@ class FoamPlot:
                      field: str,
                      data_axis: str,
                      position_axis: str,
-                     position_value: float,
+                     position_value: float | list[float],
                      position_tol: float,
                      labels: str = 'velocity',
                      style: str = 'lutils.plt_cfg.lutils',
@@ -105,7 +106,9 @@ class FoamPlot:
 
         This method filters 3D field data to find cells close to a specific
         coordinate ('position_value') along a 'position_axis', effectively
-        creating a line plot through the domain.
+        creating a line plot through the domain. If several coordinates are
+        given, the whole profile family is extracted in one pass, see
+        `FieldData.get_profiles`, and drawn into the same axes.
 
         Parameters
         ----------
@@ -117,8 +120,8 @@ class FoamPlot:
             The axis to plot against (usually the independent variable axis).
         position_axis : str
             The axis used to slice the domain (the fixed coordinate axis).
-        position_value : float
-            The coordinate value along `position_axis` where the slice is taken.
+        position_value : float or list[float]
+            The coordinate value(s) along `position_axis` where the slices are taken.
         position_tol : float
             The tolerance width around `position_value` to include cells.
         labels : str, optional
@@ -128,8 +131,8 @@ class FoamPlot:
         figure_id : str or int or None, optional
             The unique identifier for the figure. If None, a new figure is created.
         out_csv : bool, optional
-            If True, exports the sliced data to CSV files in the plot directory.
-            Default is True.
+            If True, exports the sliced data to CSV files in the plot directory,
+            one per dataset and station. Default is True.
         """
 
         # Get label and style
@@ -143,14 +146,18 @@ class FoamPlot:
         ax.set_xlabel(config['xlabel'])
         ax.set_ylabel(config['ylabel'])
 
-        # Plot all plot data entries
+        # Plot all plot data entries, one profile per station
+        stations = np.atleast_1d(position_value)
         for key, value in self._plot_data.items():
-            trimmed = value.get_cells(
-                position_axis, position_value, data_axis, position_tol)
-            ax.scatter(trimmed[data_axis],
-                       trimmed[field], label=key)
-            if out_csv:
-                trimmed.to_csv(self._plot_dir / str(key+'.csv'))
+            profiles = value.get_profiles(
+                position_axis, stations, data_axis, position_tol)
+            for station, trimmed in zip(stations, profiles):
+                label = key if len(stations) == 1 else f'{key} ({position_axis} = {station:g})'
+                ax.scatter(trimmed[data_axis],
+                           trimmed[field], label=label)
+                if out_csv:
+                    file_name = key if len(stations) == 1 else f'{key}_{position_axis}{station:g}'
+                    trimmed.to_csv(self._plot_dir / str(file_name+'.csv'))
 
         fig.legend()
 
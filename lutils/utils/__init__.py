@@ -1,10 +1,12 @@
 from lutils.utils.misc import is_list_str, get_of_version, find_in_file
 from lutils.utils.base_logger import BaseLog
+from lutils.utils.buffer import GrowableArray
 
 
 __all__ = [
     'is_list_str',
     'get_of_version',
     'find_in_file',
-    'BaseLog'
+    'BaseLog',
+    'GrowableArray'
 ]
@@ -3,11 +3,14 @@ import numpy as np
 from abc import ABC
 
 from lutils.utils.misc import check_dir
+from lutils.utils.buffer import GrowableArray
 
 
 class BaseLog(ABC):
     '''
     Base class for logging OpenFOAM case data to NumPy array and writing them to a formatted text file.
+
+    Entries are stored in a growable buffer with capacity doubling, so logging N entries costs O(N).
     '''
 
     def __init__(self,
@@ -28,10 +31,23 @@ class BaseLog(ABC):
         self.name = log_name
         self._log_dtype = dtype
         self._log_dir = Path(case_path / log_dir)
-        self._log = np.empty((0,), dtype=self._log_dtype)
+        self._buffer = GrowableArray(self._log_dtype)
 
         check_dir(self._log_dir)
 
+    @property
+    def _log(self) -> np.ndarray:
+        '''
+        View of the logged entries.
+        '''
+        return self._buffer.data
+
+    def __len__(self) -> int:
+        '''
+        Return the number of logged entries.
+        '''
+        return len(self._buffer)
+
     def add_entry(self,
                   row: tuple) -> None:
         '''
@@ -40,7 +56,7 @@ class BaseLog(ABC):
         Parameters:
             - row: a tuple matching the log dtype
         '''
-        self._log = np.append(self._log, np.array(row, dtype=self._log_dtype))
+        self._buffer.append(np.array(row, dtype=self._log_dtype))
 
     def add_batch(self,
                   batch: np.ndarray) -> None:
@@ -50,7 +66,16 @@ class BaseLog(ABC):
         Parameters:
             - batch: structured NumPy array matching the log dtype
         '''
-        self._log = np.concatenate((self._log, batch))
+        self._buffer.append(batch)
+
+    def finalize(self) -> np.ndarray:
+        '''
+        Release the unused buffer capacity once logging is finished.
+
+        Returns:
+            - np.ndarray: the logged entries
+        '''
+        return self._buffer.trim()
 
     def write(self,
               file_name: str,
@@ -85,7 +110,9 @@ class BaseLog(ABC):
         lines.append(header)
         lines.append('-' * len(header))
 
-        if self._log.shape[0] <= 1:
+        if self._log.shape[0] == 0:
+            return '\n'.join(lines)
+        elif self._log.shape[0] <= 1:
             row = self._log
             line = ' '.join(f'{row[0][i]:<{w}.6g}' if isinstance(row[0][i], float) else f'{row[0][i]:<{w}}'
                             for i, w in enumerate(col_widths))
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class GrowableArray:
+    """
+    A 1D NumPy array with amortized constant-time appends.
+
+    The values are stored in a preallocated buffer whose capacity doubles
+    whenever it is exhausted, so appending N values costs O(N) in total.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        The dtype of the stored values, structured dtypes are supported.
+    capacity : int, optional
+        The initial capacity of the buffer. Default is 1024.
+    """
+
+    def __init__(self,
+                 dtype: np.dtype,
+                 capacity: int = 1024) -> None:
+        self._buffer = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    @property
+    def data(self) -> np.ndarray:
+        """np.ndarray: A view of the filled part of the buffer. The view is not updated by later appends."""
+        return self._buffer[:self._size]
+
+    @property
+    def capacity(self) -> int:
+        """int: The number of values the buffer holds before growing."""
+        return self._buffer.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """np.dtype: The dtype of the stored values."""
+        return self._buffer.dtype
+
+    def append(self,
+               values: np.ndarray) -> None:
+        """
+        Appends a batch of values to the end of the array.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 1D array (or a scalar) convertible to the buffer dtype.
+        """
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        end = self._size + values.shape[0]
+
+        # Double the capacity until the batch fits
+        if end > self.capacity:
+            capacity = max(self.capacity, 1)
+            while capacity < end:
+                capacity *= 2
+            self._resize(capacity)
+
+        self._buffer[self._size:end] = values
+        self._size = end
+
+    def clear(self) -> None:
+        """Removes all values, keeping the allocated capacity."""
+        self._size = 0
+
+    def trim(self) -> np.ndarray:
+        """
+        Releases the unused capacity.
+
+        The capacity never drops below one, so later appends can still grow
+        the buffer by doubling.
+
+        Returns
+        -------
+        np.ndarray
+            The filled array, without any spare capacity.
+        """
+        if max(self._size, 1) < self.capacity:
+            self._resize(max(self._size, 1))
+
+        return self.data
+
+    def _resize(self,
+                capacity: int) -> None:
+        """
+        Reallocates the buffer, copying the filled part.
+
+        Parameters
+        ----------
+        capacity : int
+            The new capacity, at least the current size.
+        """
+        buffer = np.empty(capacity, dtype=self._buffer.dtype)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        """Returns the number of stored values."""
+        return self._size
@@ -0,0 +1,217 @@
+import numpy as np
+
+
+# Byte value of the padding removed from the formatted text
+_PAD = 0
+
+
+def to_chars(values: np.ndarray,
+             precision: int = 15) -> np.ndarray:
+    """
+    Formats a 1D column into a character matrix.
+
+    Each row of the matrix holds the text of one value, padded with zero
+    bytes which are removed by `join_chars`.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The column, of float, integer, bool or string dtype.
+    precision : int, optional
+        The number of significant digits of floating point values.
+        Default is 15.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of shape (len(values), width).
+    """
+    kind = values.dtype.kind
+    if kind == 'f':
+        return float_chars(values, precision)
+    elif kind in 'iu':
+        return int_chars(values)
+    elif kind == 'b':
+        return string_chars(np.array(['False', 'True']))[values.astype(np.intp)]
+
+    return string_chars(values)
+
+
+def float_chars(values: np.ndarray,
+                precision: int = 15) -> np.ndarray:
+    """
+    Formats floating point values in scientific notation, like '%.{p-1}e'.
+
+    The values are converted by the correctly rounded float formatting of
+    Python, so 17 significant digits read back to the same float64 values
+    on every platform.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 1D float column.
+    precision : int, optional
+        The number of significant digits, at least 1. Default is 15.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 character matrix, see `to_chars`.
+    """
+    template = f'%.{precision - 1}e'
+    text = np.array([template % value for value in np.asarray(values, dtype=np.float64).tolist()],
+                    dtype=bytes)
+    width = max(text.dtype.itemsize, 1)
+
+    return text.astype(f'S{width}').view(np.uint8).reshape(len(text), width)
+
+
+def int_chars(values: np.ndarray) -> np.ndarray:
+    """
+    Formats integer values without leading zeros.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 1D integer column.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 character matrix, see `to_chars`.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    magnitude = np.abs(values)
+    n_digits = len(str(magnitude.max(initial=0)))
+
+    chars = np.zeros((len(values), n_digits + 1), dtype=np.uint8, order='F')
+    chars[:, 0] = np.where(values < 0, ord('-'), _PAD)
+    chars[:, 1:] = _digits(magnitude, n_digits)
+
+    # Blank the leading zeros, keeping the last digit
+    powers = 10 ** np.arange(n_digits - 1, 0, -1, dtype=np.int64)
+    chars[:, 1:n_digits][magnitude[:, None] < powers] = _PAD
+
+    return chars
+
+
+def string_chars(values: np.ndarray) -> np.ndarray:
+    """
+    Encodes strings as UTF-8 into a character matrix.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 1D string column.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 character matrix, see `to_chars`.
+    """
+    encoded = np.char.encode(np.asarray(values, dtype=str), 'utf-8')
+    width = max(encoded.dtype.itemsize, 1)
+
+    return encoded.astype(f'S{width}').view(np.uint8).reshape(len(encoded), width)
+
+
+def quote_strings(values: np.ndarray,
+                  delimiter: str = ',') -> np.ndarray:
+    """
+    Quotes the strings that contain the delimiter, a quote or a line break.
+
+    Quoted strings are enclosed in double quotes and their quotes are
+    doubled, as by the `csv` module.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 1D string column.
+    delimiter : str, optional
+        The column delimiter. Default is ','.
+
+    Returns
+    -------
+    np.ndarray
+        The string column, quoted where needed.
+    """
+    values = np.asarray(values, dtype=str)
+    special = np.zeros(values.shape, dtype=bool)
+    for char in (delimiter, '"', '\n', '\r'):
+        special |= np.char.find(values, char) >= 0
+    if not special.any():
+        return values
+
+    quoted = np.char.add(np.char.add('"', np.char.replace(values, '"', '""')), '"')
+
+    return np.where(special, quoted, values)
+
+
+def join_chars(blocks: list[np.ndarray],
+               delimiter: str = ',') -> bytes:
+    """
+    Joins column character matrices into delimited text lines.
+
+    Parameters
+    ----------
+    blocks : list[np.ndarray]
+        The character matrices of the columns, with equal numbers of rows.
+    delimiter : str, optional
+        The column delimiter, of any length. Default is ','.
+
+    Returns
+    -------
+    bytes
+        The text, one line per row, with the padding removed.
+    """
+    n_rows = blocks[0].shape[0]
+    separator = np.frombuffer(delimiter.encode(), dtype=np.uint8)
+    widths = [block.shape[1] + len(separator) for block in blocks]
+    text = np.empty((n_rows, sum(widths) - len(separator) + 1), dtype=np.uint8)
+
+    # Copy each block followed by the delimiter, the last one by a newline
+    start = 0
+    for block, width in zip(blocks[:-1], widths):
+        text[:, start:start + block.shape[1]] = block
+        text[:, start + block.shape[1]:start + width] = separator
+        start += width
+    text[:, start:-1] = blocks[-1]
+    text[:, -1] = ord('\n')
+    text = text.ravel()
+
+    return text[text != _PAD].tobytes()
+
+
+def _digits(values: np.ndarray,
+            n_digits: int) -> np.ndarray:
+    """
+    Splits non-negative integers into fixed-width decimal digit characters.
+
+    The digits are extracted in groups of 8 as uint32, dividing by scalars.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 1D non-negative integers.
+    n_digits : int
+        The number of digits, leading digits are zeros.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of shape (len(values), n_digits) of ASCII digits.
+    """
+    chars = np.empty((len(values), n_digits), dtype=np.uint8, order='F')
+    values = values.astype(np.uint64)
+
+    end = n_digits
+    while end > 0:
+        group = (values % np.uint64(10 ** 8)).astype(np.uint32)
+        values = values // np.uint64(10 ** 8)
+        for idx in range(end - 1, max(end - 8, 0) - 1, -1):
+            quotient = group // np.uint32(10)
+            chars[:, idx] = group - quotient * np.uint32(10) + np.uint32(ord('0'))
+            group = quotient
+        end -= 8
+
+    return chars
@@ -1,18 +1,85 @@
+from pathlib import Path
 import numpy as np
 
 from lutils.utils.base_logger import BaseLog
 
 
+# Log entry of the lambda error norms of one cell region
+DS_DTYPE = np.dtype([('region', 'U12'),
+                     ('cells', 'i8'),
+                     ('L1', 'f8'),
+                     ('L2', 'f8'),
+                     ('Linf', 'f8'),
+                     ('bias', 'f8'),
+                     ('misclassified', 'f8')])
+# Log entry of one lambda error histogram bin
+DS_HISTOGRAM_DTYPE = np.dtype([('lower', 'f8'),
+                               ('upper', 'f8'),
+                               ('all', 'i8'),
+                               ('fluid', 'i8'),
+                               ('interface', 'i8'),
+                               ('solid', 'i8')])
+# Log entry of one failed interpolation stencil check
+INTERP_DTYPE = np.dtype([('check', 'U12'),
+                         ('row', 'i8'),
+                         ('cellI', 'i8'),
+                         ('point', 'i8')])
+
+
 class ProfileLog(BaseLog):
     def __init__(self):
         pass
 
 
 class InterpLog(BaseLog):
-    def __init__(self):
-        pass
+    '''
+    Log of failed interpolation stencil checks, one entry per failing row or stencil point.
+    '''
+
+    def __init__(self,
+                 case_path: Path,
+                 log_dir: str = 'logs/') -> None:
+        '''
+        Initialize the InterpLog object.
+
+        Parameters:
+        - case_path: path to OpenFOAM case folder
+        - log_dir: directory to store logs, relative to case_path
+        '''
+        super().__init__('interp', INTERP_DTYPE, case_path, log_dir)
 
 
 class DsLog(BaseLog):
-    def __init__(self):
-        pass
+    '''
+    Log of the signed distance based lambda error norms, one entry per cell region.
+    '''
+
+    def __init__(self,
+                 case_path: Path,
+                 log_dir: str = 'logs/') -> None:
+        '''
+        Initialize the DsLog object.
+
+        Parameters:
+        - case_path: path to OpenFOAM case folder
+        - log_dir: directory to store logs, relative to case_path
+        '''
+        super().__init__('ds', DS_DTYPE, case_path, log_dir)
+
+
+class DsHistogramLog(BaseLog):
+    '''
+    Log of the signed distance based lambda error histograms, one entry per bin with the cell counts of each region.
+    '''
+
+    def __init__(self,
+                 case_path: Path,
+                 log_dir: str = 'logs/') -> None:
+        '''
+        Initialize the DsHistogramLog object.
+
+        Parameters:
+        - case_path: path to OpenFOAM case folder
+        - log_dir: directory to store logs, relative to case_path
+        '''
+        super().__init__('dsHistogram', DS_HISTOGRAM_DTYPE, case_path, log_dir)
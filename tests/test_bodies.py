@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from lutils.core.bodies import Box, Sphere, TriSurface, _closest_points
+from lutils.core.metrics import LambdaMetrics, expected_lambda
+from lutils.io.stl_parser import parse_stl
+
+
+BAND = 0.2
+
+
+def box_triangles(lower, upper):
+    """Returns the 12 outward oriented triangles of a box."""
+    corners = np.array([[upper[i] if (c >> i) & 1 else lower[i] for i in range(3)] for c in range(8)])
+    quads = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+    return np.array([corners[[a, b, c]] for q in quads for a, b, c in ((q[0], q[1], q[2]), (q[0], q[2], q[3]))])
+
+
+def sphere_triangles(radius, n_theta=16, n_phi=32):
+    """Returns an outward oriented UV sphere."""
+    theta, phi = np.linspace(0, np.pi, n_theta + 1), np.linspace(0, 2 * np.pi, n_phi + 1)
+    t, p = np.meshgrid(theta, phi, indexing='ij')
+    grid = radius * np.stack([np.sin(t) * np.cos(p), np.sin(t) * np.sin(p), np.cos(t)], axis=-1)
+    a, b, c, d = grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]
+    triangles = np.concatenate([np.stack([a, b, c], axis=-2).reshape(-1, 3, 3),
+                                np.stack([a, c, d], axis=-2).reshape(-1, 3, 3)])
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    inward = np.einsum('ij,ij->i', normals, triangles.mean(axis=1)) < 0
+    triangles[inward] = triangles[inward][:, [0, 2, 1]]
+    return triangles
+
+
+def test_stl_box_matches_analytic_box():
+    lower, upper = np.array([0.0, 0.0, 0.0]), np.array([1.0, 2.0, 0.5])
+    points = np.random.default_rng(0).uniform(-0.4, 2.4, (20000, 3))
+    surface = TriSurface(box_triangles(lower, upper), BAND)
+
+    expected = np.clip(Box(lower, upper).signed_distance(points), -BAND, BAND)
+    np.testing.assert_allclose(surface.signed_distance(points), expected, atol=1e-12)
+
+
+def test_sphere_matches_brute_force():
+    triangles = sphere_triangles(1.0)
+    points = np.random.default_rng(1).uniform(-1.5, 1.5, (5000, 3))
+    surface = TriSurface(triangles, BAND)
+    distances = surface.signed_distance(points)
+
+    closest = np.stack([_closest_points(point, triangles) for point in points])
+    brute = np.minimum(np.linalg.norm(closest - points[:, None], axis=2).min(axis=1), BAND)
+    np.testing.assert_allclose(np.abs(distances), brute, atol=1e-12)
+    clear = np.abs(Sphere([0.0, 0.0, 0.0], 1.0).signed_distance(points)) > 0.05
+    np.testing.assert_array_equal(distances[clear] > 0, np.linalg.norm(points[clear], axis=1) < 1.0)
+
+
+def test_parse_ascii_and_binary_stl(tmp_path):
+    triangles = box_triangles([0.0, 0.0, 0.0], [1.0, 0.5, 0.25])
+    ascii_path = tmp_path / 'box_ascii.stl'
+    with ascii_path.open('w') as f:
+        f.write('solid box\n')
+        for triangle in triangles:
+            f.write('  facet normal 0 0 0\n    outer loop\n')
+            for vertex in triangle:
+                f.write(f'      vertex {vertex[0]:.6e} {vertex[1]:.6e} {vertex[2]:.6e}\n')
+            f.write('    endloop\n  endfacet\n')
+        f.write('endsolid box\n')
+
+    binary_path = tmp_path / 'box_binary.stl'
+    facets = np.zeros(len(triangles), dtype=[('normal', '<f4', 3), ('vertices', '<f4', (3, 3)),
+                                             ('attribute', '<u2')])
+    facets['vertices'] = triangles
+    binary_path.write_bytes(b'solid'.ljust(80) + np.uint32(len(triangles)).tobytes() + facets.tobytes())
+
+    np.testing.assert_array_equal(parse_stl(ascii_path), triangles)
+    np.testing.assert_array_equal(parse_stl(binary_path), triangles)
+    with pytest.raises(ValueError):
+        (tmp_path / 'empty.stl').write_text('solid empty\nendsolid empty\n')
+        parse_stl(tmp_path / 'empty.stl')
+
+
+def test_lambda_metrics_of_exact_field():
+    axis = np.arange(20) * 0.1 + 0.05
+    x, y, z = np.meshgrid(axis, axis, axis, indexing='ij')
+    points = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    body = Sphere([1.0, 1.0, 1.0], 0.5)
+    values = expected_lambda(body.signed_distance(points), 0.1)
+
+    norms = LambdaMetrics(points, values, body, 0.1).norms()
+    np.testing.assert_array_equal(np.asarray(norms['region']), ['all', 'fluid', 'interface', 'solid'])
+    assert norms['cells'][0] == len(points)
+    assert norms['cells'][1:].sum() == len(points)
+    np.testing.assert_allclose(norms['Linf'], 0.0, atol=1e-15)
+
+    metrics = LambdaMetrics(points, np.where(values > 0.5, 1.0, 0.0), body, 0.1)
+    edges, counts = metrics.histogram(10)
+    assert len(edges) == 11
+    np.testing.assert_array_equal(counts[0], counts[1:].sum(axis=0))
+    assert metrics.norms()['misclassified'][0] == 0.0
+    assert metrics.norms()['Linf'][2] > 0.0
@@ -0,0 +1,19 @@
+import numpy as np
+
+from lutils.utils.buffer import GrowableArray
+
+
+def test_append_after_trim_of_empty_buffer():
+    buffer = GrowableArray(np.float64, capacity=8)
+    assert len(buffer.trim()) == 0
+    assert buffer.capacity == 1
+
+    buffer.append(np.arange(5.0))
+    np.testing.assert_array_equal(buffer.data, np.arange(5.0))
+
+
+def test_trim_returns_filled_values():
+    buffer = GrowableArray(np.int64, capacity=4)
+    buffer.append(np.arange(3))
+    np.testing.assert_array_equal(buffer.trim(), np.arange(3))
+    assert buffer.capacity == 3
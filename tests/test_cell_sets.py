@@ -0,0 +1,23 @@
+from pathlib import Path
+import pytest
+
+from lutils.core.data import CellSets
+from lutils.io.mesh_parser import parse_foam_set
+
+
+CASE = Path(__file__).parent.parent / 'testdata' / 'bfs' / 'openHFDIBRANS_kE'
+SETS = CASE / 'constant' / 'polyMesh' / 'sets'
+
+
+def test_names_skip_face_sets():
+    cell_sets = CellSets(CASE)
+    assert 'bFacesInsideLambda' not in cell_sets.names
+    assert 'surfaceCells' in cell_sets.names
+    with pytest.raises(KeyError):
+        cell_sets['bFacesInsideLambda']
+
+
+def test_parse_set_checks_class():
+    assert parse_foam_set(SETS / 'bFacesInsideLambda', 'faceSet').size
+    with pytest.raises(ValueError):
+        parse_foam_set(SETS / 'bFacesInsideLambda', 'cellSet')
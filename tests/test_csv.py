@@ -0,0 +1,45 @@
+import csv
+import numpy as np
+
+from lutils.core.types import DataFrame, Categorical
+from lutils.utils.formatting import float_chars, join_chars
+
+
+def test_to_csv_quotes_and_round_trips(tmp_path):
+    values = np.array([0.1, 1 / 3, 5e-324, np.finfo(np.float64).max])
+    labels = Categorical.from_values(np.array(['a,b', 'c"d', 'e\nf', 'g']))
+    names = np.array(['p,q', 'r', 's"t', 'u'])
+    frame = DataFrame(['x', 'c,at', 's'], {'x': values, 'c,at': labels, 's': names})
+
+    path = tmp_path / 'frame.csv'
+    frame.to_csv(path)
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ['x', 'c,at', 's']
+    np.testing.assert_array_equal([float(row[0]) for row in rows[1:]], values)
+    assert [row[1] for row in rows[1:]] == np.asarray(labels).tolist()
+    assert [row[2] for row in rows[1:]] == names.tolist()
+
+
+def test_float_chars_match_printf():
+    rng = np.random.default_rng(1)
+    values = np.concatenate([rng.integers(0, 1 << 63, 20000, dtype=np.uint64).view(np.float64),
+                             rng.standard_normal(20000),
+                             [0.0, -0.0, 5e-324, 1e-310, 9.5, 0.95, 99.99999999999999]])
+    values = values[np.isfinite(values)]
+    for precision in (1, 15, 17):
+        text = join_chars([float_chars(values, precision)]).decode().split('\n')[:-1]
+        assert text == ['%.*e' % (precision - 1, value) for value in values.tolist()]
+    text = join_chars([float_chars(values, 17)]).decode().split('\n')[:-1]
+    np.testing.assert_array_equal(np.array(text, dtype=np.float64), values)
+
+
+def test_to_csv_multi_character_delimiter(tmp_path):
+    frame = DataFrame(['a', 'b', 'c'], {'a': np.array([1, 2]),
+                                        'b': np.array([0.5, np.nan]),
+                                        'c': np.array(['x;;y', 'z'])})
+    path = tmp_path / 'frame.csv'
+    frame.to_csv(path, delimiter=';;')
+
+    assert path.read_text() == 'a;;b;;c\n1;;5.0000000000000000e-01;;"x;;y"\n2;;nan;;z\n'
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from lutils.core.data import FoamCase
+
+
+def _foam_file(path, foam_class, body):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('FoamFile\n{\n    version     2.0;\n    format      ascii;\n'
+                    f'    class       {foam_class};\n    object      {path.name};\n}}\n\n'
+                    + body)
+
+
+def _foam_list(items):
+    return f'{len(items)}\n(\n' + '\n'.join(items) + '\n)\n'
+
+
+def _write_channel(case_path, n_cells):
+    """Writes a polyMesh of unit cubes in a row along x."""
+    def point(i, j, k):
+        return i + (n_cells + 1) * (j + 2 * k)
+
+    points = [f'({i} {j} {k})' for k in (0, 1) for j in (0, 1) for i in range(n_cells + 1)]
+    faces, owner, neighbour = [], [], []
+    for i in range(n_cells - 1):
+        faces.append((point(i + 1, 0, 0), point(i + 1, 1, 0), point(i + 1, 1, 1), point(i + 1, 0, 1)))
+        owner.append(i)
+        neighbour.append(i + 1)
+    faces.append((point(0, 0, 0), point(0, 0, 1), point(0, 1, 1), point(0, 1, 0)))
+    owner.append(0)
+    faces.append((point(n_cells, 0, 0), point(n_cells, 1, 0), point(n_cells, 1, 1), point(n_cells, 0, 1)))
+    owner.append(n_cells - 1)
+    for i in range(n_cells):
+        faces += [(point(i, 0, 0), point(i + 1, 0, 0), point(i + 1, 0, 1), point(i, 0, 1)),
+                  (point(i, 1, 0), point(i, 1, 1), point(i + 1, 1, 1), point(i + 1, 1, 0)),
+                  (point(i, 0, 0), point(i, 1, 0), point(i + 1, 1, 0), point(i + 1, 0, 0)),
+                  (point(i, 0, 1), point(i + 1, 0, 1), point(i + 1, 1, 1), point(i, 1, 1))]
+        owner += [i] * 4
+
+    mesh = case_path / 'constant' / 'polyMesh'
+    _foam_file(mesh / 'points', 'vectorField', _foam_list(points))
+    _foam_file(mesh / 'faces', 'faceList', _foam_list(['4(' + ' '.join(map(str, face)) + ')' for face in faces]))
+    _foam_file(mesh / 'owner', 'labelList', _foam_list(list(map(str, owner))))
+    _foam_file(mesh / 'neighbour', 'labelList', _foam_list(list(map(str, neighbour))))
+    _foam_file(mesh / 'boundary', 'polyBoundaryMesh',
+               f'1\n(\n    walls\n    {{\n        type wall;\n        nFaces {len(faces) - len(neighbour)};\n'
+               f'        startFace {len(neighbour)};\n    }}\n)\n')
+    _foam_file(case_path / '1' / 'T', 'volScalarField',
+               'dimensions [0 0 0 1 0 0 0];\n\ninternalField nonuniform List<scalar>\n'
+               + _foam_list([str(float(i)) for i in range(n_cells)]) + ';\n')
+
+
+@pytest.fixture
+def case(tmp_path):
+    x, y = np.meshgrid(np.arange(4.0), np.arange(3.0), indexing='ij')
+    rows = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size), x.ravel() + y.ravel()])
+    for name in ('p', 'k'):
+        np.savetxt(tmp_path / f'{name}.csv', rows, delimiter=',',
+                   header=f'x,y,z,{name}', comments='')
+    case = FoamCase(tmp_path, 'case', of_version=2406)
+    case.add_field('p.csv', 'p')
+    case.add_field('k.csv', 'k')
+    return case
+
+
+def test_shared_coordinates_copied_on_write(case):
+    p, k = case.fields['p'], case.fields['k']
+    assert p.data['x'] is k.data['x']
+    assert p.get_cells('x', 1.0, 'y', 0.1).shape()[0] == 3
+
+    k.data['x'] = k.data['x'] + 10
+    np.testing.assert_array_equal(k.data['x'][:3], [10.0, 10.0, 10.0])
+    np.testing.assert_array_equal(p.data['x'][:3], [0.0, 0.0, 0.0])
+    assert p.get_cells('x', 1.0, 'y', 0.1).shape()[0] == 3
+    assert p.get_cells('x', 11.0, 'y', 0.1).shape()[0] == 0
+    with pytest.raises(ValueError):
+        p.data['x'][0] = 1.0
+
+
+def test_geometry_added_after_field(tmp_path):
+    _write_channel(tmp_path, 3)
+    case = FoamCase(tmp_path, 'channel', of_version=2406)
+    case.add_field('1/T', 'T')
+    case.add_geometry()
+
+    np.testing.assert_allclose(case.fields['T'].data['x'], [0.5, 1.5, 2.5])
+    np.testing.assert_allclose(case.fields['T'].data['T'], [0.0, 1.0, 2.0])
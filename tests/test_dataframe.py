@@ -0,0 +1,108 @@
+import numpy as np
+
+from lutils.core.types import DataFrame, Categorical, Query
+
+
+def columnar_frame():
+    return DataFrame(['x', 'p', 'solver'], {
+        'x': np.arange(6.0),
+        'p': np.arange(6.0) * 10,
+        'solver': Categorical.from_values(np.array(['GAMG', 'PCG'] * 3))})
+
+
+def test_column_view_copy_on_write():
+    frame = columnar_frame()
+    view = frame[['p', 'solver']]
+    assert np.shares_memory(view['p'], frame['p'])
+
+    # Writing the view leaves the parent unchanged
+    view['p'] = -1.0
+    np.testing.assert_array_equal(frame['p'], np.arange(6.0) * 10)
+    np.testing.assert_array_equal(view['p'], -1.0)
+
+    # Writing the parent leaves the view unchanged
+    frame[0, 'p'] = 5.0
+    assert view['p'][0] == -1.0
+    assert frame['p'][0] == 5.0
+
+
+def test_row_slice_copy_on_write():
+    frame = columnar_frame()
+    rows = frame[2:4]
+    assert np.shares_memory(rows['x'], frame['x'])
+
+    frame['x'] = 0.0
+    np.testing.assert_array_equal(rows['x'], [2.0, 3.0])
+    del rows['p']
+    np.testing.assert_array_equal(frame['p'], np.arange(6.0) * 10)
+
+
+def test_block_views_copy_on_write():
+    frame = DataFrame(['a', 'b'], np.arange(8.0).reshape(4, 2))
+    rows = frame[1:3]
+    columns = frame[['b']]
+
+    rows['a'] = 0.0
+    columns['b'] = 0.0
+    np.testing.assert_array_equal(frame['a'], [0.0, 2.0, 4.0, 6.0])
+    np.testing.assert_array_equal(frame['b'], [1.0, 3.0, 5.0, 7.0])
+
+    frame[0, 0] = 9.0
+    np.testing.assert_array_equal(rows['b'], [3.0, 5.0])
+
+
+def assert_frames_equal(frame, expected):
+    assert frame.header == expected.header
+    for name in expected.header:
+        np.testing.assert_array_equal(np.asarray(frame[name]), np.asarray(expected[name]))
+        if not isinstance(expected[name], Categorical):
+            assert frame[name].dtype == expected[name].dtype
+
+
+def test_npz_and_raw_round_trip(tmp_path):
+    frame = columnar_frame()
+    frame.add_column('iters', np.arange(6, dtype=np.int32))
+
+    for compressed in (False, True):
+        frame.to_npz(tmp_path / 'frame.npz', compressed=compressed)
+        assert_frames_equal(DataFrame.from_npz(tmp_path / 'frame.npz'), frame)
+
+    frame.to_raw(tmp_path / 'raw')
+    np.testing.assert_array_equal(np.fromfile(tmp_path / 'raw' / '1.bin'), frame['p'])
+    for mmap in (True, False):
+        assert_frames_equal(DataFrame.from_raw(tmp_path / 'raw', mmap=mmap), frame)
+
+
+def test_from_chunks_spills_and_memory_maps(tmp_path):
+    rng = np.random.default_rng(7)
+    chunks = [{'t': rng.random(1000),
+               'solver': Categorical.from_values(np.resize(np.roll(['GAMG', 'PCG', 'DIC'], i), 1000))}
+              for i in range(3)]
+    frame = DataFrame.from_chunks(['t', 'solver'], iter(chunks), tmp_path / 'spill')
+    expected = DataFrame.concat([DataFrame(['t', 'solver'], chunk) for chunk in chunks])
+
+    assert isinstance(frame['t'], np.memmap)
+    assert_frames_equal(frame, expected)
+
+    # Chunked queries and reductions match the in-memory DataFrame
+    query = Query.between('t', 0.2, 0.4) & Query.isin('solver', ['PCG'])
+    np.testing.assert_array_equal(frame.mask(query, chunk_size=256), expected.mask(query))
+    assert np.isclose(frame.reduce('t', 'mean', chunk_size=256), expected['t'].mean())
+    assert frame.reduce('t', 'max', chunk_size=256) == expected['t'].max()
+
+    # Writes stay in memory, the spill files are not modified
+    frame['t'] = 0.0
+    np.testing.assert_array_equal(np.fromfile(tmp_path / 'spill' / '0.bin'), expected['t'])
+
+
+def test_append_rows_and_trim():
+    frame = columnar_frame()
+    for _ in range(100):
+        frame.append_rows({'x': np.ones(3), 'p': np.zeros(3),
+                           'solver': Categorical.from_values(np.array(['PCG', 'smoothSolver', 'PCG']))})
+    frame.trim()
+
+    assert frame.shape()[0] == 306
+    assert np.asarray(frame['solver'])[-2] == 'smoothSolver'
+    np.testing.assert_array_equal(frame['x'][:6], np.arange(6.0))
+    assert frame.reduce('x', 'sum') == 15.0 + 300.0
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from lutils.io.decomposed import parse_decomposed_field
+
+
+def _foam_file(path, foam_class, body):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('FoamFile\n{\n    version     2.0;\n    format      ascii;\n'
+                    f'    class       {foam_class};\n    object      {path.name};\n}}\n\n'
+                    + body)
+
+
+def _write_case(case_path, addressing, values):
+    for idx, (labels, local) in enumerate(zip(addressing, values)):
+        processor_dir = case_path / f'processor{idx}'
+        _foam_file(processor_dir / 'constant/polyMesh/cellProcAddressing', 'labelList',
+                   f'{len(labels)}\n(\n' + '\n'.join(map(str, labels)) + '\n)\n')
+        _foam_file(processor_dir / '1/T', 'volScalarField',
+                   'dimensions [0 0 0 1 0 0 0];\n\ninternalField nonuniform List<scalar>\n'
+                   f'{len(local)}\n(\n' + '\n'.join(map(str, local)) + '\n)\n;\n')
+
+
+def test_scatter_by_addressing(tmp_path):
+    _write_case(tmp_path, [[2, 0], [1, 3]], [[2.0, 0.0], [1.0, 3.0]])
+    values = parse_decomposed_field(tmp_path, '1/T', n_workers=1)
+    np.testing.assert_array_equal(values, [0.0, 1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize('addressing', [[[0, 1], [1, 3]], [[0, 1], [2, 4]], [[0, 1], [2, -1]]])
+def test_invalid_addressing(tmp_path, addressing):
+    _write_case(tmp_path, addressing, [[0.0, 1.0], [2.0, 3.0]])
+    with pytest.raises(ValueError):
+        parse_decomposed_field(tmp_path, '1/T', n_workers=1)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from lutils.io.follower import ResidualsFollower
+from lutils.io.parser import parse_residuals
+
+
+def test_missing_iterations_match_parse_residuals(tmp_path):
+    path = tmp_path / 'solverInfo.dat'
+    path.write_text('# Residuals\n# Time Ux_initial p_iters p_solver\n'
+                    '1 0.1 5 GAMG\n2 0.05 4 GAMG\n')
+    follower = ResidualsFollower(path)
+    follower.refresh()
+    with path.open('a') as f:
+        f.write('3 0.02 N/A GAMG\n4 0.01 3 GAMG\n')
+    follower.refresh()
+
+    expected = parse_residuals(path)['p_iters']
+    np.testing.assert_array_equal(follower.data['p_iters'], expected)
+    assert follower.data['p_iters'].dtype == expected.dtype
+
+
+def test_long_solver_names_are_kept(tmp_path):
+    solver = 'smoothSolver' + 'WithAVeryLongUserDefinedSuffix' * 2
+    path = tmp_path / 'solverInfo.dat'
+    path.write_text('# Residuals\n# Time Ux_initial Ux_solver p_solver\n'
+                    f'1 0.1 {solver} GAMG\n2 0.05 {solver} GAMG\n')
+
+    frame = parse_residuals(path)
+    assert np.asarray(frame['Ux_solver']).tolist() == [solver, solver]
+    assert np.asarray(frame['p_solver']).tolist() == ['GAMG', 'GAMG']
+
+    follower = ResidualsFollower(path)
+    follower.refresh()
+    assert np.asarray(follower.data['Ux_solver']).tolist() == [solver, solver]
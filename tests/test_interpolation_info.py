@@ -0,0 +1,22 @@
+from pathlib import Path
+import numpy as np
+
+from lutils.io.parser import parse_interpolation_info
+
+
+HEADER = 'cellI,order,intPoints,intCells,extra\n'
+
+
+def test_empty_first_stencil(tmp_path):
+    path = tmp_path / 'interpolationInfo.dat'
+    path.write_text(HEADER
+                    + '1,0,0(),0(),0()\n'
+                    + '2,2,2((1 0 0) (2 0 0)),2(3 4),0()\n'
+                    + '5,1,1((3 0 0)),1(6),0()\n')
+    columns = parse_interpolation_info(path)
+
+    np.testing.assert_array_equal(columns['cellI'], [1, 2, 5])
+    assert columns['intPoints'].values.shape == (3, 3)
+    np.testing.assert_array_equal(columns['intPoints'].values[:, 0], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(columns['intCells'].values, [3, 4, 6])
+    assert columns['extra'].values.size == 0
@@ -0,0 +1,19 @@
+import numpy as np
+
+from lutils.io.log_parser import parse_solver_log
+
+
+STEP = ('{time}\n'
+        'smoothSolver:  Solving for Ux, Initial residual = 0.5, Final residual = 0.01, '
+        'No Iterations 3\n'
+        'ExecutionTime = 1.5 s  ClockTime = 2 s\n\n')
+
+
+def test_time_with_unit_suffix(tmp_path):
+    path = tmp_path / 'log.simpleFoam'
+    path.write_text(''.join(STEP.format(time=time)
+                            for time in ('Time = 1', 'Time = 2s', 'Time = 3 s', 'Time = 4e-1s')))
+    frame = parse_solver_log(path)
+
+    np.testing.assert_array_equal(frame['Time'], [1.0, 2.0, 3.0, 0.4])
+    np.testing.assert_array_equal(frame['Ux_iters'], [3, 3, 3, 3])
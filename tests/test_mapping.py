@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from lutils.core.data import FoamCase
+from lutils.core.mapping import CaseMapping, _save_entry
+from lutils.core.sampling import InterpolationWeights
+
+
+def linear(x, y, z):
+    return 1.0 + 2.0 * x - 3.0 * y + 0.5 * z
+
+
+def write_case(path, spacing, extent, offset=0.0):
+    path.mkdir()
+    axis = np.arange(spacing / 2, extent, spacing)
+    x, y, z = [values.ravel() for values in np.meshgrid(axis, axis, axis, indexing='ij')]
+    np.savetxt(path / 'p.csv', np.column_stack([x, y, z, linear(x, y, z) + offset]),
+               delimiter=',', header='x,y,z,p', comments='')
+    case = FoamCase(path, path.name, of_version=2406)
+    case.add_field('p.csv', 'p')
+    return case
+
+
+@pytest.fixture
+def cases(tmp_path):
+    return write_case(tmp_path / 'source', 0.1, 1.0), write_case(tmp_path / 'target', 0.25, 1.0, offset=1.0)
+
+
+def test_map_and_compare(cases):
+    source, target = cases
+    mapping = CaseMapping(source, target)
+    mapped = mapping.map_field('p')
+    np.testing.assert_allclose(mapped['p'], linear(mapped['x'], mapped['y'], mapped['z']))
+
+    differences, norms = mapping.compare()
+    np.testing.assert_allclose(differences['p']['p'], -1.0)
+    assert np.asarray(norms['column']).tolist() == ['p.p']
+    np.testing.assert_allclose([norms['L1'][0], norms['L2'][0], norms['Linf'][0]], 1.0)
+
+    # The mapped coordinates are shared with the target case, but copied on write
+    mapped['x'] = mapped['x'] + 10.0
+    assert target.fields['p'].data['x'].max() < 1.0
+
+
+def test_target_cells_outside_of_source(tmp_path):
+    source = write_case(tmp_path / 'source', 0.1, 0.5)
+    target = write_case(tmp_path / 'target', 0.25, 1.0)
+    differences, norms = CaseMapping(source, target).compare()
+
+    data = target.fields['p'].data
+    outside = np.column_stack([data['x'], data['y'], data['z']]).max(axis=1) > 0.6
+    assert np.isnan(differences['p']['p'][outside]).all()
+    assert np.isfinite(differences['p']['p'][~outside]).all()
+    assert np.isfinite(norms['L2'][0])
+
+
+def test_operator_cache(cases):
+    source, target = cases
+    first = CaseMapping(source, target, cache_dir='mapping')
+    mapped = first.map_field('p')
+    entries = list((target.case_path / 'mapping').iterdir())
+    assert len(entries) == 1 and (entries[0] / 'weights.npy').exists()
+
+    # A new mapping loads the stored operator
+    second = CaseMapping(source, target, cache_dir='mapping')
+    operator = second.operator(source.fields['p'], target.fields['p'])
+    assert isinstance(operator.weights, np.memmap)
+    np.testing.assert_array_equal(second.map_field('p')['p'], mapped['p'])
+
+    # A writer losing the rename race keeps the complete entry
+    _save_entry(entries[0], InterpolationWeights(operator.indices, np.zeros(operator.weights.shape)))
+    assert [path.name for path in (target.case_path / 'mapping').iterdir()] == [entries[0].name]
+    np.testing.assert_array_equal(np.load(entries[0] / 'weights.npy'), operator.weights)
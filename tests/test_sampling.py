@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from lutils.core.data import FoamCase
+from lutils.core.sampling import InterpolationWeights, line_points
+from lutils.core.spatial import SpatialIndex
+
+
+@pytest.fixture
+def grid():
+    axes = np.arange(6) + 0.5
+    x, y, z = np.meshgrid(axes, axes, axes, indexing='ij')
+    points = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    return SpatialIndex(points), 1.0 + 2.0 * points[:, 0] + 3.0 * points[:, 1] - points[:, 2]
+
+
+def linear(points):
+    return 1.0 + 2.0 * points[:, 0] + 3.0 * points[:, 1] - points[:, 2]
+
+
+def test_linear_reproduces_linear_fields(grid):
+    index, values = grid
+    points = np.random.default_rng(0).uniform(0.5, 5.5, (200, 3))
+    weights = InterpolationWeights.compute(index, points, 'linear')
+
+    np.testing.assert_allclose(weights.weights.sum(axis=1), 1.0)
+    np.testing.assert_allclose(weights.apply(values), linear(points))
+    assert not weights.outside.any()
+
+
+@pytest.mark.parametrize('method', ['nearest', 'idw', 'linear'])
+def test_points_outside_are_nan(grid, method):
+    index, values = grid
+    points, _ = line_points([3.0, 3.0, 3.0], [9.0, 3.0, 3.0], 13)
+    weights = InterpolationWeights.compute(index, points, method)
+    sampled = weights.apply(np.column_stack([values, values]))
+
+    outside = points[:, 0] > 6.5
+    np.testing.assert_array_equal(weights.outside, outside)
+    assert np.isnan(sampled[outside]).all()
+    assert np.isfinite(sampled[~outside]).all()
+
+
+def test_explicit_cell_size(grid):
+    index, values = grid
+    points = np.array([[3.0, 3.0, 3.0], [6.5, 3.0, 3.0]])
+
+    weights = InterpolationWeights.compute(index, points, 'linear', cell_size=0.5)
+    np.testing.assert_array_equal(weights.outside, [True, True])
+    weights = InterpolationWeights.compute(index, points, 'linear', cell_size=np.full(len(values), 2.0))
+    np.testing.assert_array_equal(weights.outside, [False, False])
+    assert weights.apply(values)[0] == pytest.approx(linear(points)[0])
+
+
+def test_save_and_load(grid, tmp_path):
+    index, values = grid
+    points = np.array([[2.2, 3.1, 0.9], [20.0, 0.0, 0.0]])
+    weights = InterpolationWeights.compute(index, points)
+    weights.save(tmp_path / 'weights')
+    loaded = InterpolationWeights.load(tmp_path / 'weights')
+
+    np.testing.assert_array_equal(loaded.apply(values), weights.apply(values))
+    np.testing.assert_array_equal(loaded.outside, [False, True])
+
+
+def test_sample_line_and_plane(grid, tmp_path):
+    index, values = grid
+    np.savetxt(tmp_path / 'p.csv', np.column_stack([index.points, values]),
+               delimiter=',', header='x,y,z,p', comments='')
+    case = FoamCase(tmp_path, 'case', of_version=2406)
+    case.add_field('p.csv', 'p')
+    field = case.fields['p']
+
+    # The line leaves the cells past x = 6.5
+    line = field.sample_line([1.0, 2.0, 3.0], [9.0, 2.0, 3.0], 9)
+    np.testing.assert_allclose(line['distance'], np.arange(9.0))
+    inside = line['x'] < 6.5
+    points = np.column_stack([line['x'], line['y'], line['z']])
+    np.testing.assert_allclose(line['p'][inside], linear(points[inside]))
+    assert np.isnan(line['p'][~inside]).all()
+
+    plane = field.sample_plane([3.0, 3.0, 2.5], [0.0, 0.0, 1.0], 4.0, 5)
+    assert plane.shape()[0] == 25
+    np.testing.assert_allclose(plane['z'], 2.5)
+    points = np.column_stack([plane['x'], plane['y'], plane['z']])
+    np.testing.assert_allclose(plane['p'], linear(points))
@@ -0,0 +1,68 @@
+import numpy as np
+
+from lutils.core.spatial import SpatialIndex
+
+
+def brute_force(points, queries):
+    return np.sqrt(((queries[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+
+
+def test_nearest_and_k_nearest_match_brute_force():
+    rng = np.random.default_rng(3)
+    # Clustered points leave most bins empty
+    points = np.concatenate([rng.random((1500, 3)), 0.01 * rng.random((500, 3)) + 0.5])
+    queries = np.concatenate([rng.random((300, 3)), rng.random((20, 3)) * 4 - 2])
+    index = SpatialIndex(points)
+    distances = brute_force(points, queries)
+
+    nearest, nearest_distances = index.nearest(queries)
+    np.testing.assert_allclose(nearest_distances, distances.min(axis=1))
+    np.testing.assert_allclose(distances[np.arange(len(queries)), nearest], nearest_distances)
+
+    indices, k_distances = index.k_nearest(queries, 8)
+    np.testing.assert_allclose(k_distances, np.sort(distances, axis=1)[:, :8])
+    np.testing.assert_allclose(np.take_along_axis(distances, indices, axis=1), k_distances)
+
+
+def test_flat_points():
+    # Points of a 2D mesh have no extent in z
+    axis = np.linspace(0, 1, 30)
+    x, y = np.meshgrid(axis, axis, indexing='ij')
+    points = np.column_stack([x.ravel(), y.ravel(), np.full(x.size, 0.5)])
+    queries = np.random.default_rng(4).random((100, 3))
+
+    _, distances = SpatialIndex(points).nearest(queries)
+    np.testing.assert_allclose(distances, brute_force(points, queries).min(axis=1))
+
+
+def test_radius_matches_brute_force():
+    rng = np.random.default_rng(5)
+    points = rng.random((2000, 3))
+    queries = rng.random((100, 3))
+    neighbours = SpatialIndex(points).radius(queries, 0.15)
+
+    distances = brute_force(points, queries)
+    for row, query_distances in enumerate(distances):
+        np.testing.assert_array_equal(neighbours[row], np.flatnonzero(query_distances <= 0.15))
+
+
+def test_slabs():
+    rng = np.random.default_rng(6)
+    points = rng.random((1000, 3))
+    index = SpatialIndex(points)
+    values = np.array([0.1, 0.5, 0.52])
+    slabs = index.slabs('y', values, 0.05)
+
+    for row, value in enumerate(values):
+        inside = np.flatnonzero(np.abs(points[:, 1] - value) < 0.05)
+        np.testing.assert_array_equal(np.sort(slabs[row]), inside)
+        assert np.all(np.diff(points[slabs[row], 1]) >= 0)
+    np.testing.assert_array_equal(index.slab(1, 0.5, 0.05), slabs[1])
+
+
+def test_empty_index():
+    index = SpatialIndex(np.empty((0, 3)))
+    indices, distances = index.nearest(np.zeros((2, 3)))
+    assert (indices == -1).all() and np.isinf(distances).all()
+    assert index.k_nearest(np.zeros((2, 3)), 4)[0].shape == (2, 0)
+    assert len(index.radius(np.zeros((2, 3)), 1.0)[0]) == 0
@@ -0,0 +1,74 @@
+from pathlib import Path
+import numpy as np
+import pytest
+
+from lutils.core.stencils import StencilValidator
+from lutils.core.types import RaggedArray
+
+
+CHECKS = ['order', 'sigma', 'collinear', 'spacing', 'yOrtho', 'cells']
+SIDE = 8
+LAYERS = 4
+
+
+def wall_stencils():
+    """Returns second order stencils of a wall at x = 0 on a unit grid."""
+    x, y, z = np.meshgrid(np.arange(LAYERS) + 0.5, np.arange(SIDE) + 0.5, np.arange(SIDE) + 0.5,
+                          indexing='ij')
+    centres = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    n_stencils = SIDE * SIDE
+
+    # Interface cells in the first layer, points one and two cells out along +x
+    cells = np.arange(n_stencils)
+    points = np.repeat(centres[cells], 3, axis=0).reshape(n_stencils, 3, 3)
+    points[:, 0, 0] = 0.0
+    points[:, 1:, 0] += np.array([1.0, 2.0])
+    int_cells = cells[:, None] + np.array([1, 2]) * n_stencils
+    columns = {'cellI': cells.astype(np.int32),
+               'cellCenter': centres[cells],
+               'surfNorm': np.tile([1.0, 0.0, 0.0], (n_stencils, 1)),
+               'yOrtho': np.full(n_stencils, 0.75),
+               'sigma': np.full(n_stencils, 0.5),
+               'order': np.full(n_stencils, 2, dtype=np.int32),
+               'intPoints': RaggedArray.from_counts(np.full(n_stencils, 3), points.reshape(-1, 3)),
+               'intCells': RaggedArray.from_counts(np.full(n_stencils, 2),
+                                                   int_cells.ravel().astype(np.int32))}
+    return columns, centres
+
+
+def test_valid_stencils_pass():
+    columns, centres = wall_stencils()
+    failures = StencilValidator(columns, centres=centres).validate()
+
+    assert list(failures) == CHECKS
+    assert all(len(rows) == 0 for rows in failures.values())
+
+
+def test_one_corrupted_row_per_check(tmp_path):
+    columns, centres = wall_stencils()
+    rows = dict(zip(CHECKS, [3, 11, 20, 35, 47, 60]))
+    columns['order'][rows['order']] = 3
+    columns['sigma'][rows['sigma']] = 0.4
+    columns['intPoints'].values[3 * rows['collinear'] + 2, 1] += 0.1
+    columns['cellCenter'][rows['spacing'], 0] = 1.6
+    columns['sigma'][rows['spacing']] = 1.6
+    columns['yOrtho'][rows['yOrtho']] = 2.0
+    columns['intCells'].values[2 * rows['cells']] += 1
+
+    validator = StencilValidator(columns, centres=centres)
+    failures = validator.validate()
+    for check, row in rows.items():
+        np.testing.assert_array_equal(failures[check], [row])
+
+    validator.write(tmp_path)
+    text = (tmp_path / 'logs' / 'interpolationCheck.dat').read_text()
+    assert 'failing rows: order 1, sigma 1, collinear 1, spacing 1, yOrtho 1, cells 1' in text
+
+
+def test_surface_stencils_without_y_ortho():
+    columns, centres = wall_stencils()
+    del columns['yOrtho']
+    failures = StencilValidator(columns, centres=centres).validate()
+
+    assert 'yOrtho' not in failures
+    assert all(len(rows) == 0 for rows in failures.values())